@@ -5,3 +5,5 @@ class ConfigConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "config"
 
+    def ready(self) -> None:
+        from . import checks  # noqa: F401
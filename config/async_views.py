@@ -0,0 +1,195 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.http import Http404, HttpResponse
+from django.urls import path
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.routers import Route
+
+from config.instrumentation import phase
+from config.serialization import ValuesListMixin
+
+
+class AsyncReadMixin:
+    """
+    Async list and retrieve (`alist`, `aretrieve`) for a `GenericAPIView`, served by `AsyncReadView`
+    under ASGI.
+
+    They follow `list`/`retrieve`: the same filtering, pagination, serializers and object permissions,
+    with the queries run through the async ORM. Lists use the lean `.values()` serialization when the
+    view has `ValuesListMixin` and `LEAN_LIST_SERIALIZATION` is on.
+    """
+
+    async def alist(self, request, *args, **kwargs):
+        lean = settings.LEAN_LIST_SERIALIZATION and isinstance(self, ValuesListMixin)
+        if lean:
+            representation = self.get_values_representation()
+            queryset = self.get_values_queryset(representation)
+        else:
+            queryset = self.filter_queryset(self.get_queryset())
+
+        with phase("queryset"):
+            if self.paginator is not None:
+                page = await self.paginator.apaginate_queryset(queryset, request, view=self)
+            else:
+                page = [row async for row in queryset]
+
+        data = representation.many(page) if lean else self.get_serializer(page, many=True).data
+        return self.get_paginated_response(data) if self.paginator is not None else Response(data)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        return Response(self.get_serializer(instance).data)
+
+    async def aget_object(self):
+        """
+        `get_object` with the async ORM.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        with phase("queryset"):
+            try:
+                instance = await queryset.aget(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            except (ObjectDoesNotExist, TypeError, ValueError, ValidationError):
+                # The message of django.shortcuts.get_object_or_404.
+                raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+
+class ReplayAuthentication(BaseAuthentication):
+    """
+    Replays the outcome of an async authentication when DRF's `Request` authenticates, so the
+    request ends up with the usual `user`, `auth` and `successful_authenticator`.
+    """
+
+    def __init__(self, authenticator: BaseAuthentication, result=None, error: APIException | None = None):
+        self.authenticator = authenticator
+        self.result = result
+        self.error = error
+
+    def authenticate(self, request):
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def authenticate_header(self, request):
+        return self.authenticator.authenticate_header(request)
+
+
+class AsyncReadView:
+    """
+    Async view for the GET action (`list` or `retrieve`) of a viewset route whose viewset defines
+    `a<action>`; `actions` is the route's method map, as given to `ViewSet.as_view`.
+
+    GET requests run the viewset's usual steps (content negotiation, authentication, permissions,
+    throttles, exception handling) around the async handler, and the response is rendered on the
+    event loop. Authenticators are awaited through `aauthenticate` when they have one. Other methods,
+    and requests negotiating a renderer other than JSON (e.g. the browsable API), are passed to the
+    synchronous `fallback` view, so the URL behaves as the router's.
+    """
+
+    def __init__(self, viewset_class, actions: dict[str, str], fallback, initkwargs: dict):
+        self.viewset_class = viewset_class
+        self.actions = {**actions, "head": actions["get"]}
+        self.action = actions["get"]
+        self.fallback = sync_to_async(fallback)
+        self.initkwargs = initkwargs
+
+    @classmethod
+    def as_view(cls, viewset_class, actions: dict[str, str], fallback, initkwargs: dict):
+        handler = cls(viewset_class, actions, fallback, initkwargs)
+
+        async def view(request, *args, **kwargs):
+            return await handler.dispatch(request, *args, **kwargs)
+
+        return csrf_exempt(view)
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method != "GET":
+            return await self.fallback(request, *args, **kwargs)
+
+        # As in ViewSetMixin.as_view(), which also gives the `Allow` header its methods.
+        viewset = self.viewset_class(**self.initkwargs)
+        viewset.action_map = self.actions
+        for method, action in self.actions.items():
+            setattr(viewset, method, getattr(viewset, action))
+        viewset.args, viewset.kwargs = args, kwargs
+        viewset.format_kwarg = viewset.get_format_suffix(**kwargs)
+        drf_request = viewset.initialize_request(request, *args, **kwargs)
+        viewset.request = drf_request
+        viewset.headers = viewset.default_response_headers
+        if not self.renders_json(viewset, drf_request):
+            return await self.fallback(request, *args, **kwargs)
+
+        try:
+            with phase("authentication"):
+                drf_request.authenticators = await self.authenticate(drf_request)
+            viewset.initial(drf_request, *args, **kwargs)
+            response = await getattr(viewset, f"a{self.action}")(drf_request, *args, **kwargs)
+        except Exception as exc:
+            response = viewset.handle_exception(exc)
+
+        response = viewset.finalize_response(drf_request, response, *args, **kwargs)
+        if not hasattr(response, "render"):
+            # E.g. the 304 of a conditional request.
+            return response
+        with phase("rendering"):
+            response.render()
+        # A plain response, so the handler does not render it again in a thread.
+        rendered = HttpResponse(response.content, status=response.status_code)
+        for name, value in response.items():
+            rendered[name] = value
+        return rendered
+
+    @staticmethod
+    def renders_json(viewset, drf_request) -> bool:
+        try:
+            renderer, _ = viewset.perform_content_negotiation(drf_request)
+        except APIException:
+            return False
+        return isinstance(renderer, JSONRenderer)
+
+    @staticmethod
+    async def authenticate(drf_request) -> tuple[BaseAuthentication, ...]:
+        """
+        Run the request's authenticators and return replays of the outcome for `Request` to use.
+        """
+        authenticators = drf_request.authenticators
+        for authenticator in authenticators:
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    result = await authenticator.aauthenticate(drf_request)
+                else:
+                    result = await sync_to_async(authenticator.authenticate)(drf_request)
+            except APIException as exc:
+                return (ReplayAuthentication(authenticator, error=exc),)
+            if result is not None:
+                return (ReplayAuthentication(authenticator, result=result),)
+        return tuple(ReplayAuthentication(authenticator) for authenticator in authenticators)
+
+
+def async_read_urls(router) -> list:
+    """
+    URL patterns serving GET on the list and detail routes of the router's viewsets that define
+    `alist`/`aretrieve` with `AsyncReadView`. They go ahead of the router's patterns, which keep
+    serving the other routes (actions, format suffixes).
+    """
+    urlpatterns = []
+    for prefix, viewset, basename in router.registry:
+        for route in router.routes:
+            if not isinstance(route, Route):
+                continue
+            actions = router.get_method_map(viewset, route.mapping)
+            if not hasattr(viewset, f"a{actions.get('get')}"):
+                continue
+            initkwargs = {**route.initkwargs, "basename": basename, "detail": route.detail}
+            fallback = viewset.as_view(actions, **initkwargs)
+            lookup = viewset.lookup_url_kwarg or viewset.lookup_field
+            url = f"{prefix}/<int:{lookup}>/" if route.detail else f"{prefix}/"
+            urlpatterns.append(path(url, AsyncReadView.as_view(viewset, actions, fallback, initkwargs)))
+    return urlpatterns
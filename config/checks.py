@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+LOCAL_CACHE_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+def get_shared_cache_aliases() -> set[str]:
+    """
+    Cache aliases whose entries every process must see: the default cache (JWT user state, replica
+    pins), the vaccine catalogue, the per-owner responses and the throttle buckets.
+    """
+    aliases = {"default", settings.VACCINE_CATALOGUE_CACHE, settings.RESPONSE_CACHE, settings.THROTTLE_CACHE}
+    return aliases - {""}
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_caches(app_configs, **kwargs) -> list[Error]:
+    """
+    With several web workers, a per-process (locmem) cache leaves the other workers serving stale
+    catalogues and responses and missing revocations. Run by `check --deploy` and before gunicorn
+    starts its workers (config/gunicorn.py).
+    """
+    if settings.WEB_WORKERS <= 1:
+        return []
+    return [
+        Error(
+            f"Cache '{alias}' is kept per process (locmem), but DJANGO_WEB_WORKERS is {settings.WEB_WORKERS}.",
+            hint="Set DJANGO_CACHE_URL to a cache shared by all processes, e.g. a filecache:// or redis:// URL.",
+            id="config.E001",
+        )
+        for alias in sorted(get_shared_cache_aliases())
+        if settings.CACHES.get(alias, {}).get("BACKEND") == LOCAL_CACHE_BACKEND
+    ]
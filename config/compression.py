@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+
+# Responses worth compressing. HTML is left out: pages carrying a CSRF token (the admin, the browsable
+# API) would be exposed to BREACH-style attacks.
+COMPRESSIBLE_TYPES = ("application/json", "text/csv", "application/x-ndjson")
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an `Accept-Encoding` header accepts gzip, honouring q-values ("gzip;q=0" refuses it).
+    """
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        quality = params.strip().removeprefix("q=").removeprefix("Q=")
+        try:
+            return not params.strip() or float(quality) > 0
+        except ValueError:
+            return False
+    return False
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Gzip API responses (`COMPRESSIBLE_TYPES`) of at least `RESPONSE_COMPRESSION_MIN_BYTES` for clients
+    that accept it, and streamed exports of any size. Smaller bodies are sent as they are: the gzip
+    header and CPU time are not worth it.
+
+    Disabled with `RESPONSE_COMPRESSION=False`, e.g. behind a proxy that compresses.
+    """
+
+    def __init__(self, get_response):
+        if not settings.RESPONSE_COMPRESSION:
+            raise MiddlewareNotUsed()
+        super().__init__(get_response)
+        self.min_bytes = settings.RESPONSE_COMPRESSION_MIN_BYTES
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < self.min_bytes:
+            return response
+        if not response.get("Content-Type", "").startswith(COMPRESSIBLE_TYPES):
+            return response
+        if not accepts_gzip(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+            patch_vary_headers(response, ("Accept-Encoding",))
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,45 @@
+from django.db.models import BooleanField, DateField, Func
+
+
+class AddDays(Func):
+    """
+    `date + days` evaluated in the database, for set-based updates of derived due dates.
+    """
+
+    arity = 2
+    output_field = DateField()
+    template = "(%(expressions)s)"
+    arg_joiner = " + "
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="DATE(%(expressions)s || ' days')",
+            arg_joiner=", '+' || ",
+            **extra_context,
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler,
+            connection,
+            template="DATE_ADD(%(expressions)s DAY)",
+            arg_joiner=", INTERVAL ",
+            **extra_context,
+        )
+
+
+class Likely(Func):
+    """
+    A condition the planner should treat as matching most rows, so it keeps reading an index in the
+    requested order instead of using the condition's index and sorting. Only SQLite takes the hint
+    (`likely()`); elsewhere the condition is emitted as is.
+    """
+
+    arity = 1
+    output_field = BooleanField()
+    template = "(%(expressions)s)"
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, template="likely(%(expressions)s)", **extra_context)
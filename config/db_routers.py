@@ -0,0 +1,151 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpRequest, HttpResponse
+from django.utils.functional import SimpleLazyObject
+
+# Set on the responses of requests that wrote, so the client's next reads go to the primary.
+PRIMARY_PIN_COOKIE = "db_primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def get_replicas() -> list[str]:
+    return [alias for alias in settings.DATABASES if alias != DEFAULT_DB_ALIAS]
+
+
+class RoutingState:
+    """
+    Where the reads of one request go: the chosen replica, until the request writes or turns out
+    to belong to a client pinned to the primary.
+    """
+
+    def __init__(self, request: HttpRequest, replica: str | None):
+        self.request = request
+        self.replica = replica
+        self.wrote = False
+        self.read_replica = False
+        self._pinned = None
+
+    @property
+    def pinned(self) -> bool:
+        if self._pinned:
+            return True
+        if PRIMARY_PIN_COOKIE in self.request.COOKIES:
+            self._pinned = True
+            return True
+        # Clients without cookies are pinned by user id, known once DRF has authenticated the request.
+        # Session users are left to the cookie: resolving the lazy user would query from in here.
+        user = getattr(self.request, "user", None)
+        if user is not None and not isinstance(user, SimpleLazyObject) and user.is_authenticated:
+            self._pinned = bool(cache.get(primary_pin_key(user.pk)))
+            return self._pinned
+        return False
+
+    def read_alias(self) -> str | None:
+        if self.replica is None or self.wrote or self.pinned or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return self.replica
+
+
+_current_state: ContextVar[RoutingState | None] = ContextVar("db_routing_state", default=None)
+
+
+def read_from_replica() -> bool:
+    """
+    Whether the current request has read from a replica, so what it built may lag behind the primary.
+    """
+    state = _current_state.get()
+    return state is not None and state.read_replica
+
+
+def primary_pin_key(user_id) -> str:
+    return f"db:primary-pin:{user_id}"
+
+
+class ReplicaRouter:
+    """
+    Sends the reads of safe-method requests (see `ReplicaRoutingMiddleware`) to a replica, and
+    everything else, writes included, to `default`.
+
+    A request that writes is served from the primary from then on, and its client stays pinned to
+    the primary for `DB_REPLICA_PIN_SECONDS` (a cookie, and a cache entry per user for clients that
+    drop cookies), so it reads its own writes despite replication lag. Reads outside requests
+    (commands, jobs) and inside transactions use the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _current_state.get()
+        if state is None:
+            return None
+        alias = state.read_alias()
+        if alias is not None:
+            state.read_replica = True
+        return alias
+
+    def db_for_write(self, model, **hints):
+        state = _current_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get the schema through replication.
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Picks a replica for each safe-method request (when replicas are configured) and pins the
+    client to the primary after a request that wrote. Works in sync and async mode.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        self.replicas = get_replicas()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.is_async:
+            return self.__acall__(request)
+        with self.route(request) as state:
+            response = self.get_response(request)
+        return self.finish(state, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with self.route(request) as state:
+            response = await self.get_response(request)
+        return self.finish(state, response)
+
+    @contextmanager
+    def route(self, request: HttpRequest):
+        replica = random.choice(self.replicas) if self.replicas and request.method in SAFE_METHODS else None
+        state = RoutingState(request, replica)
+        token = _current_state.set(state)
+        try:
+            yield state
+        finally:
+            _current_state.reset(token)
+
+    @staticmethod
+    def finish(state: RoutingState, response: HttpResponse) -> HttpResponse:
+        if state.wrote and settings.DB_REPLICA_PIN_SECONDS:
+            seconds = settings.DB_REPLICA_PIN_SECONDS
+            response.set_cookie(PRIMARY_PIN_COOKIE, "1", max_age=seconds, httponly=True, samesite="Lax")
+            user = getattr(state.request, "user", None)
+            if user is not None and user.is_authenticated:
+                cache.set(primary_pin_key(user.pk), True, seconds)
+        return response
@@ -0,0 +1,86 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from datetime import date
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import BaseRenderer
+
+# Bytes buffered before a chunk is sent, so the response is not flushed one row at a time.
+CHUNK_BYTES = 64 * 1024
+
+_json_encoder = DjangoJSONEncoder()
+
+
+class ExportRenderer(BaseRenderer):
+    """
+    Renderer selecting an export format through `?format=` or the `Accept` header.
+
+    Successful exports bypass rendering with a `StreamingHttpResponse`; this only renders error
+    responses, as JSON.
+    """
+
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, cls=DjangoJSONEncoder).encode(self.charset)
+
+
+class CSVRenderer(ExportRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class NDJSONRenderer(ExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+def stream_csv(records: Iterable[dict], columns: list[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for record in records:
+        writer.writerow([_csv_value(record.get(column)) for column in columns])
+        if buffer.tell() >= CHUNK_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def stream_ndjson(records: Iterable[dict]) -> Iterator[str]:
+    lines, size = [], 0
+    for record in records:
+        line = _json_encoder.encode(record)
+        lines.append(line)
+        size += len(line) + 1
+        if size >= CHUNK_BYTES:
+            yield "\n".join(lines) + "\n"
+            lines, size = [], 0
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_response(renderer: ExportRenderer, records: Iterable[dict], columns: list[str], filename: str):
+    """
+    Stream `records` as CSV (with `columns` as header) or NDJSON, depending on the accepted renderer.
+
+    `records` should be lazy (e.g. built from `QuerySet.iterator()`) so memory stays flat.
+    """
+    if renderer.format == CSVRenderer.format:
+        content = stream_csv(records, columns)
+    else:
+        content = stream_ndjson(records)
+    response = StreamingHttpResponse(content, content_type=f"{renderer.media_type}; charset=utf-8")
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{renderer.format}"'
+    return response
+
+
+def _csv_value(value):
+    # Dates and datetimes formatted as in the NDJSON output.
+    if isinstance(value, date):
+        return _json_encoder.default(value)
+    return value
@@ -0,0 +1,32 @@
+"""
+Gunicorn settings for the production WSGI server: `gunicorn -c config/gunicorn.py config.wsgi`.
+
+Threaded workers, each thread keeping its database connection for `DJANGO_DB_CONN_MAX_AGE` seconds,
+so a worker process holds up to `WEB_THREADS` connections (or pooler clients).
+"""
+
+import os
+
+import django
+from django.conf import settings
+from django.core.management import call_command
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+bind = settings.WEB_BIND
+workers = settings.WEB_WORKERS
+threads = settings.WEB_THREADS
+worker_class = "gthread"
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+# Recycle workers now and then, so slow memory growth cannot accumulate.
+max_requests = 2000
+max_requests_jitter = 200
+accesslog = "-"
+
+
+def on_starting(server):
+    # Refuse to fork several workers over per-process caches (config.checks).
+    django.setup()
+    call_command("check", deploy=True, tags=["caches"], fail_level="ERROR")
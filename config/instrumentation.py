@@ -0,0 +1,271 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger("config.instrumentation")
+
+PHASES = ("authentication", "permission", "queryset", "serialization", "rendering")
+
+_current_metrics: ContextVar["RequestMetrics | None"] = ContextVar("request_metrics", default=None)
+
+_IN_LIST = re.compile(r"\((?:%s|\?)(?:\s*,\s*(?:%s|\?))*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class RepeatedQueryError(Exception):
+    """
+    Raised in strict mode when a request runs the same query shape too many times (an N+1).
+    """
+
+
+def query_shape(sql: str) -> str:
+    """
+    Normalize parameterized SQL so queries differing only in parameters, or in the length of an
+    IN list, share a shape.
+    """
+    return _WHITESPACE.sub(" ", _IN_LIST.sub("(...)", sql)).strip()
+
+
+class RequestMetrics:
+    """
+    Phase timings and query statistics of one request.
+
+    Phases nest: entering a phase pauses the enclosing one, so each phase reports exclusive time.
+    """
+
+    def __init__(self, repeat_limit: int = 0):
+        self.started = time.perf_counter()
+        self.repeat_limit = repeat_limit
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.queries = 0
+        self.query_time = 0.0
+        self.shapes = Counter()
+        self.error = None
+        self._stack = []
+
+    def start(self, name: str) -> None:
+        now = time.perf_counter()
+        if self._stack:
+            outer, since = self._stack[-1]
+            self.phases[outer] += now - since
+        self._stack.append((name, now))
+
+    def stop(self, name: str) -> None:
+        if not self._stack or self._stack[-1][0] != name:
+            return
+        now = time.perf_counter()
+        _, since = self._stack.pop()
+        self.phases[name] += now - since
+        if self._stack:
+            outer, _ = self._stack.pop()
+            self._stack.append((outer, now))
+
+    def stop_all(self) -> None:
+        while self._stack:
+            self.stop(self._stack[-1][0])
+
+    @contextmanager
+    def phase(self, name: str):
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop(name)
+
+    def record_query(self, execute, sql, params, many, context):
+        shape = query_shape(sql)
+        self.shapes[shape] += 1
+        if self.repeat_limit and self.shapes[shape] >= self.repeat_limit and self.error is None:
+            self.error = RepeatedQueryError(
+                f"Query shape ran {self.shapes[shape]} times in one request: {shape}"
+            )
+            raise self.error
+
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.query_time += time.perf_counter() - started
+
+    @property
+    def duplicate_queries(self) -> int:
+        return sum(count - 1 for count in self.shapes.values() if count > 1)
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total: float) -> str:
+        entries = [f"{name};dur={self.phases[name] * 1000:.2f}" for name in PHASES if self.phases[name]]
+        entries.append(f'db;dur={self.query_time * 1000:.2f};desc="{self.queries} queries"')
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(entries)
+
+    def as_dict(self, request: HttpRequest, response: HttpResponse, total: float) -> dict:
+        data = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 2),
+            "queries": self.queries,
+            "duplicate_queries": self.duplicate_queries,
+            "db_ms": round(self.query_time * 1000, 2),
+        }
+        data.update({f"{name}_ms": round(self.phases[name] * 1000, 2) for name in PHASES})
+        if self.duplicate_queries:
+            shape, count = self.shapes.most_common(1)[0]
+            data["most_repeated_query"] = {"count": count, "sql": shape}
+        return data
+
+
+def phase(name: str):
+    """
+    Time a block as the given phase of the current request; a no-op outside instrumented requests.
+    """
+    metrics = _current_metrics.get()
+    return metrics.phase(name) if metrics else nullcontext()
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Execute wrapper reporting to the metrics of the current request, if any.
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics.record_query(execute, sql, params, many, context)
+
+
+def install_query_recorder(connection, **kwargs) -> None:
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class RequestInstrumentationMiddleware:
+    """
+    Counts queries (and repeated query shapes) for each request, times the request phases reported
+    by `InstrumentedViewMixin`, and exposes them as a `Server-Timing` header and a JSON log line.
+
+    With `QUERY_REPEAT_LIMIT` set, a request that runs the same query shape that many times fails
+    with `RepeatedQueryError` (strict mode, meant for tests).
+
+    Works in sync and async mode. Queries are recorded by a wrapper installed on every connection,
+    which finds the request through a context variable: under ASGI the async ORM runs queries on
+    other threads' connections, which the context follows.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        connection_created.connect(install_query_recorder, dispatch_uid="config.instrumentation")
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self.is_async:
+            return self.__acall__(request)
+        if not settings.REQUEST_INSTRUMENTATION:
+            return self.get_response(request)
+
+        # Connections opened before the signal was connected.
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection)
+        metrics = RequestMetrics(repeat_limit=settings.QUERY_REPEAT_LIMIT)
+        with self.track(metrics):
+            response = self.get_response(request)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.REQUEST_INSTRUMENTATION:
+            return await self.get_response(request)
+
+        metrics = RequestMetrics(repeat_limit=settings.QUERY_REPEAT_LIMIT)
+        with self.track(metrics):
+            response = await self.get_response(request)
+        return self.finish(request, response, metrics)
+
+    @staticmethod
+    @contextmanager
+    def track(metrics: RequestMetrics):
+        token = _current_metrics.set(metrics)
+        try:
+            yield
+        finally:
+            _current_metrics.reset(token)
+            metrics.stop_all()
+
+    def finish(self, request: HttpRequest, response: HttpResponse, metrics: RequestMetrics) -> HttpResponse:
+        if metrics.error is not None:
+            # The view's exception handler may have turned the error into a 500 response; surface it.
+            raise metrics.error
+
+        total = metrics.total
+        response["Server-Timing"] = metrics.server_timing(total)
+        logger.info(json.dumps(metrics.as_dict(request, response, total)))
+        return response
+
+    def process_template_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            # Django renders the response right after the template response middleware runs.
+            metrics.start("rendering")
+        return response
+
+
+class InstrumentedViewMixin:
+    """
+    Reports DRF view phases to `RequestInstrumentationMiddleware`.
+
+    `serialization` covers the handler time outside queryset evaluation and object permission
+    checks, i.e. serializer work, validation and saves.
+    """
+
+    def perform_authentication(self, request):
+        with phase("authentication"):
+            super().perform_authentication(request)
+
+    def check_permissions(self, request):
+        with phase("permission"):
+            super().check_permissions(request)
+
+    def check_object_permissions(self, request, obj):
+        with phase("permission"):
+            super().check_object_permissions(request, obj)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            metrics.start("serialization")
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            metrics.stop("serialization")
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        with phase("queryset"):
+            return super().filter_queryset(queryset)
+
+    def paginate_queryset(self, queryset):
+        with phase("queryset"):
+            return super().paginate_queryset(queryset)
+
+    def get_object(self):
+        with phase("queryset"):
+            return super().get_object()
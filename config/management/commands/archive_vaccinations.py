@@ -0,0 +1,55 @@
+import time
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from vaccinations.archive import VaccinationArchiver
+
+
+class Command(BaseCommand):
+    help = (
+        "Move vaccinations applied before a date from the vaccinations table to vaccinations_archive, in "
+        "batches of one transaction each, keeping the latest dose of each pet and vaccine. An interrupted run "
+        "is resumed by running it again. The API lists archived rows only with include_archived=true."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--before", type=date.fromisoformat, help="Archive doses applied before this date.")
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.VACCINATION_ARCHIVE_AFTER_DAYS,
+            help="Archive doses applied more than this many days ago (default DJANGO_VACCINATION_ARCHIVE_AFTER_DAYS).",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000, help="Primary key range moved per transaction.")
+        parser.add_argument("--max-seconds", type=float, help="Stop after the batch that passes this run time.")
+
+    def handle(self, *args, **options):
+        before = options["before"]
+        if before is None and options["older_than_days"]:
+            before = date.today() - timedelta(days=options["older_than_days"])
+        if before is None:
+            raise CommandError("Give --before or --older-than-days, or set DJANGO_VACCINATION_ARCHIVE_AFTER_DAYS.")
+
+        self.started = time.perf_counter()
+        self.archived = 0
+        self.stdout.write(f"Archiving vaccinations applied before {before}.")
+        archiver = VaccinationArchiver(
+            before,
+            batch_size=options["batch_size"],
+            max_seconds=options["max_seconds"],
+            on_batch=self.report,
+        )
+        metrics = archiver.run()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {metrics['archived']} vaccinations in {metrics['batches']} batches "
+                f"({metrics['rows_per_second']:,.0f} rows/s)."
+            )
+        )
+
+    def report(self, moved: int, last_id: int) -> None:
+        self.archived += moved
+        elapsed = time.perf_counter() - self.started
+        self.stdout.write(f"{self.archived} archived, up to id {last_id} ({self.archived / elapsed:,.0f} rows/s)")
@@ -0,0 +1,62 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import F, Max, Min, OuterRef, Subquery
+
+from config.db_functions import AddDays
+from config.response_cache import invalidate_all
+from vaccines.models import Vaccine
+from vaccinations.models import Vaccination, VaccinationStatus
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill missing vaccination next_due_date values from the vaccine periodicity, "
+        "using chunked set-based UPDATEs over primary key ranges."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=50000, help="Primary key range updated per statement.")
+
+    def handle(self, *args, **options):
+        periodicity = Vaccine.objects.filter(pk=OuterRef("vaccine_id")).values("periodicity_days")[:1]
+        updated = self.update_in_chunks(
+            "vaccinations",
+            Vaccination.objects.filter(next_due_date__isnull=True),
+            AddDays(F("application_date"), Subquery(periodicity)),
+            options["chunk_size"],
+        )
+
+        # Status rows copy the due date of their latest vaccination.
+        latest_due = Vaccination.objects.filter(pk=OuterRef("vaccination_id")).values("next_due_date")[:1]
+        statuses = self.update_in_chunks(
+            "vaccination statuses",
+            VaccinationStatus.objects.filter(next_due_date__isnull=True),
+            Subquery(latest_due),
+            options["chunk_size"],
+        )
+
+        # The UPDATEs bypass the model signals, so drop every owner's cached responses.
+        invalidate_all()
+        self.stdout.write(
+            self.style.SUCCESS(f"Backfilled {updated} vaccinations and {statuses} vaccination statuses.")
+        )
+
+    def update_in_chunks(self, label: str, queryset, next_due_date, chunk_size: int) -> int:
+        bounds = queryset.model.objects.aggregate(low=Min("pk"), high=Max("pk"))
+        if bounds["low"] is None:
+            return 0
+
+        low, high = bounds["low"], bounds["high"]
+        total = 0
+        started = time.perf_counter()
+        for start in range(low, high + 1, chunk_size):
+            end = min(start + chunk_size, high + 1)
+            # Each UPDATE commits on its own, so an interrupted run resumes from the remaining NULLs.
+            total += queryset.filter(pk__gte=start, pk__lt=end).update(next_due_date=next_due_date)
+            elapsed = time.perf_counter() - started
+            progress = (end - low) / (high + 1 - low)
+            self.stdout.write(
+                f"{label}: {progress:6.1%} ids {start}-{end - 1}, {total} updated, {total / elapsed:,.0f} rows/s"
+            )
+        return total
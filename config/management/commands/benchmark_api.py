@@ -0,0 +1,221 @@
+import json
+import statistics
+import subprocess
+import time
+from datetime import date, datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from config.throttling import unreached_rates
+from pets.models import Pet
+from vaccines.models import Vaccine
+from vaccinations.models import Vaccination
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the API in-process against the current dataset (see generate_data). Records p50/p95/p99 "
+        "latency, queries per request and response bytes per endpoint, writes them to a JSON file and, with "
+        "--compare, exits non-zero when a case regresses beyond the threshold."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", help="Owner to benchmark as (defaults to the owner with the most vaccinations).")
+        parser.add_argument("--password", default="Passw0rd!", help="Password of that owner, used for the login case.")
+        parser.add_argument("--iterations", type=int, default=50, help="Measured requests per case.")
+        parser.add_argument("--warmup", type=int, default=3, help="Unmeasured requests per case.")
+        parser.add_argument("--only", help="Comma-separated substrings; run only the cases whose name matches.")
+        parser.add_argument("--output", default="benchmark.json", help="Where to write the results.")
+        parser.add_argument("--compare", help="Previous results file to compare against.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed relative p95 increase before a case counts as a regression (0.2 = 20%%).",
+        )
+
+    def handle(self, *args, **options):
+        # Every request comes from one user and address, and repeats one of a few URLs: measure the work behind
+        # them, not the response cache.
+        with override_settings(THROTTLE_RATES=unreached_rates(), RESPONSE_CACHE=""):
+            self.run_benchmark(options)
+
+    def run_benchmark(self, options: dict) -> None:
+        owner = self.get_owner(options["email"])
+        client = APIClient()
+        response = client.post(
+            "/api/auth/login/",
+            {"email": owner.email, "password": options["password"]},
+            format="json",
+        )
+        if response.status_code != 200:
+            raise CommandError(f"Could not log in as {owner.email}: {response.status_code} {response.content!r}")
+        tokens = response.json()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+
+        cases = self.get_cases(owner, tokens, options["password"])
+        if options["only"]:
+            wanted = options["only"].split(",")
+            cases = [case for case in cases if any(part in case["name"] for part in wanted)]
+
+        results = {}
+        # Writes issued by the create cases are rolled back so repeated runs see the same dataset.
+        with transaction.atomic():
+            for case in cases:
+                results[case["name"]] = self.run_case(client, case, options["iterations"], options["warmup"])
+                self.print_result(case["name"], results[case["name"]])
+            transaction.set_rollback(True)
+
+        report = {"meta": self.get_meta(owner, options), "results": results}
+        with open(options["output"], "w") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}."))
+
+        if options["compare"]:
+            self.compare(options["compare"], results, options["threshold"])
+
+    def get_owner(self, email: str | None):
+        User = get_user_model()
+        if email:
+            try:
+                return User.objects.get(email=email)
+            except User.DoesNotExist:
+                raise CommandError(f"User {email} does not exist.")
+        owner_id = (
+            Vaccination.objects.values("pet__owner_id")
+            .annotate(total=Count("id"))
+            .order_by("-total")
+            .values_list("pet__owner_id", flat=True)
+            .first()
+        )
+        if owner_id is None:
+            raise CommandError("No vaccinations found. Run generate_data first.")
+        return User.objects.get(pk=owner_id)
+
+    def get_cases(self, owner, tokens: dict, password: str) -> list[dict]:
+        """
+        One case per endpoint and access pattern. `data` marks a write, sent as JSON.
+        """
+        pet = Pet.objects.filter(owner=owner).order_by("id").first()
+        vaccination = Vaccination.objects.filter(pet__owner=owner).order_by("id").first()
+        vaccine = Vaccine.objects.order_by("id").first()
+        today = date.today().isoformat()
+
+        return [
+            {"name": "auth login", "method": "post", "path": "/api/auth/login/",
+             "data": {"email": owner.email, "password": password}, "anonymous": True},
+            {"name": "auth refresh", "method": "post", "path": "/api/auth/refresh/",
+             "data": {"refresh": tokens["refresh"]}, "anonymous": True},
+            {"name": "users retrieve", "method": "get", "path": f"/api/users/{owner.pk}/"},
+            {"name": "pets list", "method": "get", "path": "/api/pets/"},
+            {"name": "pets list cursor", "method": "get", "path": "/api/pets/?pagination=cursor"},
+            {"name": "pets retrieve", "method": "get", "path": f"/api/pets/{pet.pk}/"},
+            {"name": "pets filter species", "method": "get", "path": f"/api/pets/?species={pet.species}"},
+            {"name": "pets search", "method": "get", "path": f"/api/pets/?search={pet.name[:3]}"},
+            {"name": "pets create", "method": "post", "path": "/api/pets/",
+             "data": {"name": "Benchmark", "species": "dog"}},
+            {"name": "vaccines list", "method": "get", "path": "/api/vaccines/"},
+            {"name": "vaccines retrieve", "method": "get", "path": f"/api/vaccines/{vaccine.pk}/"},
+            {"name": "vaccines filter manufacturer", "method": "get",
+             "path": f"/api/vaccines/?manufacturer={vaccine.manufacturer}"},
+            {"name": "vaccines search", "method": "get", "path": f"/api/vaccines/?search={vaccine.name[:3]}"},
+            {"name": "vaccines create", "method": "post", "path": "/api/vaccines/",
+             "data": {"name": "Benchmark", "periodicity_days": 365}},
+            {"name": "vaccinations list", "method": "get", "path": "/api/vaccinations/"},
+            {"name": "vaccinations list cursor", "method": "get", "path": "/api/vaccinations/?pagination=cursor"},
+            {"name": "vaccinations list archived", "method": "get", "path": "/api/vaccinations/?include_archived=true"},
+            {"name": "vaccinations retrieve", "method": "get", "path": f"/api/vaccinations/{vaccination.pk}/"},
+            {"name": "vaccinations filter upcoming", "method": "get", "path": "/api/vaccinations/?upcoming=true"},
+            {"name": "vaccinations filter pet", "method": "get", "path": f"/api/vaccinations/?pet={pet.pk}"},
+            {"name": "vaccinations filter vaccine", "method": "get",
+             "path": f"/api/vaccinations/?vaccine={vaccination.vaccine_id}"},
+            {"name": "vaccinations due", "method": "get", "path": "/api/vaccinations/due/?window=30"},
+            {"name": "vaccinations create", "method": "post", "path": "/api/vaccinations/",
+             "data": {"pet": pet.pk, "vaccine": vaccine.pk, "application_date": today}},
+        ]
+
+    def run_case(self, client: APIClient, case: dict, iterations: int, warmup: int) -> dict:
+        anonymous = APIClient()
+        request_client = anonymous if case.get("anonymous") else client
+        send = getattr(request_client, case["method"])
+        kwargs = {"data": case["data"], "format": "json"} if "data" in case else {}
+
+        for _ in range(warmup):
+            send(case["path"], **kwargs)
+
+        timings, queries = [], []
+        response = None
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                response = send(case["path"], **kwargs)
+                timings.append((time.perf_counter() - started) * 1000)
+            queries.append(len(context.captured_queries))
+
+        percentiles = statistics.quantiles(timings, n=100, method="inclusive") if len(timings) > 1 else timings * 99
+        return {
+            "status": response.status_code,
+            "iterations": iterations,
+            "mean_ms": round(statistics.fmean(timings), 3),
+            "p50_ms": round(percentiles[49], 3),
+            "p95_ms": round(percentiles[94], 3),
+            "p99_ms": round(percentiles[98], 3),
+            "queries": max(queries),
+            "bytes": len(response.content),
+        }
+
+    def print_result(self, name: str, result: dict) -> None:
+        self.stdout.write(
+            f"{name:<32} {result['status']} p50 {result['p50_ms']:>8.2f}ms  p95 {result['p95_ms']:>8.2f}ms  "
+            f"p99 {result['p99_ms']:>8.2f}ms  {result['queries']:>3} queries  {result['bytes']:>7} bytes"
+        )
+
+    def get_meta(self, owner, options: dict) -> dict:
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            "commit": commit,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "database": connection.vendor,
+            "owner": owner.email,
+            "iterations": options["iterations"],
+            "vaccinations": Vaccination.objects.count(),
+        }
+
+    def compare(self, path: str, results: dict, threshold: float) -> None:
+        with open(path) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+        regressions = []
+        for name, result in results.items():
+            previous = baseline.get(name)
+            if previous is None:
+                continue
+            change = (result["p95_ms"] - previous["p95_ms"]) / previous["p95_ms"] if previous["p95_ms"] else 0
+            problems = []
+            if change > threshold:
+                problems.append(f"p95 {previous['p95_ms']:.2f}ms -> {result['p95_ms']:.2f}ms ({change:+.0%})")
+            if result["queries"] > previous["queries"]:
+                problems.append(f"queries {previous['queries']} -> {result['queries']}")
+            if problems:
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(f"REGRESSION {name}: {'; '.join(problems)}"))
+            else:
+                self.stdout.write(f"ok {name}: p95 {change:+.0%}")
+
+        if regressions:
+            raise CommandError(f"{len(regressions)} case(s) regressed beyond {threshold:.0%}.")
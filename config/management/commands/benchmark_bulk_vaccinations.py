@@ -0,0 +1,77 @@
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from pets.models import Pet
+from vaccines.models import Vaccine
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare ingesting vaccinations through one POST per record against the bulk endpoint. "
+        "Everything runs inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Number of vaccinations to ingest per path.")
+        parser.add_argument("--pets", type=int, default=20, help="Number of pets the rows are spread over.")
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+
+        with transaction.atomic():
+            payload = self.build_payload(rows, options["pets"])
+            client = APIClient()
+            client.force_authenticate(self.user)
+
+            with CaptureQueriesContext(connection) as single_queries:
+                started = time.perf_counter()
+                for item in payload:
+                    response = client.post("/api/vaccinations/", item, format="json")
+                    assert response.status_code == 201, response.content
+                single_elapsed = time.perf_counter() - started
+
+            with CaptureQueriesContext(connection) as bulk_queries:
+                started = time.perf_counter()
+                response = client.post("/api/vaccinations/bulk/", payload, format="json")
+                assert response.status_code == 201, response.content
+                bulk_elapsed = time.perf_counter() - started
+
+            transaction.set_rollback(True)
+
+        self.report("per-record", rows, single_elapsed, len(single_queries))
+        self.report("bulk", rows, bulk_elapsed, len(bulk_queries))
+        self.stdout.write(self.style.SUCCESS(f"speedup: {single_elapsed / bulk_elapsed:.1f}x"))
+
+    def build_payload(self, rows: int, pet_count: int) -> list[dict]:
+        User = get_user_model()
+        self.user = User.objects.create_user(
+            username="bulk-benchmark@example.com",
+            email="bulk-benchmark@example.com",
+            full_name="Bulk Benchmark",
+        )
+        pets = Pet.objects.bulk_create(
+            [Pet(name=f"Benchmark {i}", species="dog", owner=self.user) for i in range(pet_count)]
+        )
+        vaccine = Vaccine.objects.create(name="Benchmark", periodicity_days=365)
+        today = date.today()
+        return [
+            {
+                "pet": pets[i % len(pets)].pk,
+                "vaccine": vaccine.pk,
+                "application_date": (today - timedelta(days=i % 365)).isoformat(),
+                "notes": f"Dose {i}",
+                "veterinarian_name": "Dr. Benchmark",
+            }
+            for i in range(rows)
+        ]
+
+    def report(self, label: str, rows: int, elapsed: float, queries: int) -> None:
+        self.stdout.write(
+            f"{label:<11} {rows} rows in {elapsed:.3f}s ({rows / elapsed:,.0f} rows/s), {queries} queries"
+        )
@@ -0,0 +1,293 @@
+import asyncio
+import itertools
+import json
+import os
+import shlex
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+
+from config.throttling import unreached_rates
+from users.models import User
+from users.tokens import UserRefreshToken
+from vaccinations.models import Vaccination
+from vaccines.models import Vaccine
+
+RUNSERVER_COMMAND = "{python} manage.py runserver --noreload --skip-checks 127.0.0.1:{port}"
+DEFAULT_WSGI_COMMAND = (
+    "{python} -m gunicorn -c config/gunicorn.py --bind 127.0.0.1:{port} --workers {workers} config.wsgi"
+)
+DEFAULT_ASGI_COMMAND = (
+    "{python} -m uvicorn config.asgi:application --host 127.0.0.1 --port {port} --workers {workers} --no-access-log"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Start the API under the development server, the production WSGI server (with and without persistent "
+        "database connections) and the ASGI server (with and without the async read views), and load the read "
+        "endpoints with many concurrent slow clients. Reports throughput, errors and p50/p95/p99 latency per "
+        "concurrency level, so the servers' concurrency limits and connection setup costs can be compared."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--servers",
+            default="runserver,wsgi-no-reuse,wsgi,asgi-sync,asgi",
+            help="Comma-separated: runserver, wsgi (--wsgi-command, connections kept 60s), wsgi-no-reuse "
+            "(--wsgi-command, a connection per request), asgi-sync (--asgi-command, sync views), asgi "
+            "(--asgi-command, async read views).",
+        )
+        parser.add_argument("--wsgi-command", default=DEFAULT_WSGI_COMMAND, help="WSGI server command line.")
+        parser.add_argument("--asgi-command", default=DEFAULT_ASGI_COMMAND, help="ASGI server command line.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes, for commands using {workers} (defaults to the CPU count).",
+        )
+        parser.add_argument("--clients", default="1,10,50,200", help="Comma-separated concurrency levels.")
+        parser.add_argument("--requests", type=int, default=400, help="Requests per concurrency level.")
+        parser.add_argument(
+            "--slow-ms",
+            type=int,
+            default=100,
+            help="How long each client takes to send its request (half the headers, a pause, the rest).",
+        )
+        parser.add_argument(
+            "--idle",
+            type=int,
+            default=0,
+            help="Extra connections that trickle headers and never finish their request, held during each level.",
+        )
+        parser.add_argument("--timeout", type=float, default=30, help="Seconds before a request counts as failed.")
+        parser.add_argument("--email", help="Owner to request as (defaults to the owner with the most vaccinations).")
+        parser.add_argument("--output", help="Also write the results to this JSON file.")
+
+    def handle(self, *args, **options):
+        if connection.vendor == "sqlite" and connection.settings_dict["NAME"] in ("", ":memory:"):
+            raise CommandError("The servers need a database file or server shared with this process.")
+        owner = self.get_owner(options["email"])
+        token = str(UserRefreshToken.for_user(owner).access_token)
+        paths = self.get_paths(owner)
+        levels = [int(level) for level in options["clients"].split(",")]
+
+        results = {}
+        for name in options["servers"].split(","):
+            command, env = self.get_server(name, options)
+            self.stdout.write(self.style.MIGRATE_HEADING(f"{name}: {command}"))
+            with ServerProcess(command, env) as server:
+                results[name] = []
+                for clients in levels:
+                    result = asyncio.run(
+                        LoadRun(server.port, paths, token, options).run(clients, options["requests"])
+                    )
+                    results[name].append(result)
+                    self.print_result(result)
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}."))
+
+    def get_server(self, name: str, options: dict) -> tuple[str, dict]:
+        servers = {
+            "runserver": (RUNSERVER_COMMAND, {"DJANGO_DB_CONN_MAX_AGE": "0"}),
+            "wsgi": (options["wsgi_command"], {"DJANGO_DB_CONN_MAX_AGE": "60"}),
+            "wsgi-no-reuse": (options["wsgi_command"], {"DJANGO_DB_CONN_MAX_AGE": "0"}),
+            "asgi-sync": (options["asgi_command"], {"DJANGO_ASYNC_READ_VIEWS": "False", "DJANGO_DB_CONN_MAX_AGE": "0"}),
+            "asgi": (options["asgi_command"], {"DJANGO_ASYNC_READ_VIEWS": "True", "DJANGO_DB_CONN_MAX_AGE": "0"}),
+        }
+        if name not in servers:
+            raise CommandError(f"Unknown server {name}; choose from {', '.join(servers)}.")
+        command, env = servers[name]
+        # All clients share one user and address, and repeat the same URLs past the response cache.
+        env = {
+            **env,
+            "DJANGO_THROTTLE_RATES": ",".join(f"{scope}={rate}" for scope, rate in unreached_rates().items()),
+            "DJANGO_RESPONSE_CACHE": "",
+        }
+        command = command.replace("{python}", shlex.quote(sys.executable)).replace("{workers}", str(options["workers"]))
+        return command, env
+
+    def get_owner(self, email: str | None) -> User:
+        if email:
+            try:
+                return User.objects.get(email=email)
+            except User.DoesNotExist:
+                raise CommandError(f"User {email} does not exist.")
+        owner_id = (
+            Vaccination.objects.values("pet__owner_id")
+            .annotate(total=Count("id"))
+            .order_by("-total")
+            .values_list("pet__owner_id", flat=True)
+            .first()
+        )
+        if owner_id is None:
+            raise CommandError("No vaccinations found. Run generate_data first.")
+        return User.objects.get(pk=owner_id)
+
+    def get_paths(self, owner: User) -> list[str]:
+        vaccination = Vaccination.objects.filter(pet__owner=owner).order_by("id").only("id").first()
+        vaccine = Vaccine.objects.order_by("id").only("id").first()
+        paths = ["/api/vaccinations/", "/api/vaccinations/?expand=vaccine", "/api/pets/", "/api/vaccines/"]
+        if vaccination is not None:
+            paths.append(f"/api/vaccinations/{vaccination.pk}/")
+        if vaccine is not None:
+            paths.append(f"/api/vaccines/{vaccine.pk}/")
+        return paths
+
+    def print_result(self, result: dict) -> None:
+        self.stdout.write(
+            f"  {result['clients']:>5} clients  {result['ok']:>5} ok  {result['errors']:>4} errors  "
+            f"{result['requests_per_second']:>8.1f} req/s  p50 {result['p50_ms']:>8.1f}ms  "
+            f"p95 {result['p95_ms']:>8.1f}ms  p99 {result['p99_ms']:>8.1f}ms  max {result['max_ms']:>8.1f}ms"
+        )
+
+
+class ServerProcess:
+    """
+    Runs a server command on a free port for the duration of a `with` block.
+    """
+
+    startup_timeout = 30
+
+    def __init__(self, command: str, env: dict):
+        self.port = self.free_port()
+        self.command = command.replace("{port}", str(self.port))
+        self.env = {**os.environ, **env}
+
+    def __enter__(self):
+        self.log = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            shlex.split(self.command), cwd=settings.BASE_DIR, env=self.env, stdout=self.log, stderr=subprocess.STDOUT
+        )
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                break
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=1).close()
+                return self
+            except OSError:
+                time.sleep(0.2)
+        self.log.seek(0)
+        output = self.log.read().decode(errors="replace")[-2000:]
+        self.stop()
+        raise CommandError(f"Server did not start: {self.command}\n{output}")
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def stop(self) -> None:
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        self.log.close()
+
+    @staticmethod
+    def free_port() -> int:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+
+class LoadRun:
+    """
+    Concurrent clients issuing GET requests over raw HTTP/1.1 connections (`Connection: close`).
+
+    Latency is measured from the moment the request is fully sent to the end of the response, so it
+    reflects the server's queueing and work, not the clients' own slowness.
+    """
+
+    def __init__(self, port: int, paths: list[str], token: str, options: dict):
+        self.port = port
+        self.paths = paths
+        self.token = token
+        self.slow = options["slow_ms"] / 1000
+        self.idle = options["idle"]
+        self.timeout = options["timeout"]
+
+    async def run(self, clients: int, total: int) -> dict:
+        self.remaining = total
+        self.paths_cycle = itertools.cycle(self.paths)
+        self.latencies, self.errors = [], 0
+        idle = [asyncio.create_task(self.hold_connection()) for _ in range(self.idle)]
+        started = time.perf_counter()
+        await asyncio.gather(*(self.client() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+        for task in idle:
+            task.cancel()
+        await asyncio.gather(*idle, return_exceptions=True)
+
+        timings = self.latencies or [0.0]
+        percentiles = statistics.quantiles(timings, n=100, method="inclusive") if len(timings) > 1 else timings * 99
+        return {
+            "clients": clients,
+            "ok": len(self.latencies),
+            "errors": self.errors,
+            "requests_per_second": round(len(self.latencies) / elapsed, 1),
+            "p50_ms": round(percentiles[49], 1),
+            "p95_ms": round(percentiles[94], 1),
+            "p99_ms": round(percentiles[98], 1),
+            "max_ms": round(max(timings), 1),
+        }
+
+    async def client(self) -> None:
+        while self.remaining > 0:
+            self.remaining -= 1
+            try:
+                status, latency = await asyncio.wait_for(self.request(next(self.paths_cycle)), self.timeout)
+            except (asyncio.TimeoutError, OSError, IndexError, ValueError):
+                self.errors += 1
+                continue
+            if status == 200:
+                self.latencies.append(latency * 1000)
+            else:
+                self.errors += 1
+
+    async def request(self, path: str) -> tuple[int, float]:
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        try:
+            head = (
+                f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1:{self.port}\r\nAuthorization: Bearer {self.token}\r\n"
+                "Accept: application/json\r\nConnection: close\r\n\r\n"
+            ).encode()
+            middle = len(head) // 2
+            writer.write(head[:middle])
+            await writer.drain()
+            await asyncio.sleep(self.slow)
+            writer.write(head[middle:])
+            await writer.drain()
+            sent = time.perf_counter()
+            response = await reader.read()
+            latency = time.perf_counter() - sent
+        finally:
+            writer.close()
+        return int(response.split(b" ", 2)[1]), latency
+
+    async def hold_connection(self) -> None:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        except OSError:
+            return
+        try:
+            writer.write(f"GET /api/pets/ HTTP/1.1\r\nHost: 127.0.0.1:{self.port}\r\n".encode())
+            while True:
+                await asyncio.sleep(1)
+                writer.write(b"X-Idle: 1\r\n")
+                await writer.drain()
+        except OSError:
+            pass
+        finally:
+            writer.close()
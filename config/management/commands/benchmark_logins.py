@@ -0,0 +1,192 @@
+import os
+import queue
+import statistics
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from config.throttling import unreached_rates
+from users.hashers import PasswordHashingBusy, get_executor
+
+PASSWORD = "Bench-login-42!"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark registration and login in process. Counts the queries of a registration, then for each "
+        "PBKDF2 iteration count measures logins/second (and per core) from --clients concurrent clients "
+        "against WEB_THREADS server threads, hashing on every request thread (inline, as before users.hashers) "
+        "or on the bounded hashing pool, while another client measures the latency of GET /api/vaccines/."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            default=f"720000,{settings.PASSWORD_HASH_ITERATIONS}",
+            help="Comma-separated PBKDF2 iteration counts to measure.",
+        )
+        parser.add_argument("--logins", type=int, default=24, help="Logins per measurement.")
+        parser.add_argument("--clients", type=int, default=8, help="Concurrent login clients.")
+
+    def handle(self, *args, **options):
+        # Every request comes from one user and address.
+        with override_settings(THROTTLE_RATES=unreached_rates()):
+            self.run_benchmark(options)
+
+    def run_benchmark(self, options: dict) -> None:
+        counts = list(dict.fromkeys(int(value) for value in options["iterations"].split(",")))
+        User = get_user_model()
+        email = "benchmark-logins@example.com"
+        User.objects.filter(email=email).delete()
+
+        try:
+            self.benchmark_registration(email)
+            user = User.objects.get(email=email)
+            access = self.login(APIClient(), email)["access"]
+
+            cores = os.cpu_count() or 1
+            self.stdout.write(
+                f"{cores} core(s), {settings.WEB_THREADS} server threads, {options['clients']} login clients, "
+                f"{options['logins']} logins per run"
+            )
+            for count in counts:
+                with override_settings(PASSWORD_HASH_ITERATIONS=count):
+                    # The first login at a new count re-hashes the stored password.
+                    self.login(APIClient(), email)
+                    user.refresh_from_db(fields=["password"])
+                    stored = identify_hasher(user.password).decode(user.password)["iterations"]
+                    if stored != count:
+                        raise CommandError(f"Password not re-hashed on login: {stored} iterations, expected {count}.")
+
+                    modes = {
+                        # Every server thread may hash at once, as when hashing ran on the request thread.
+                        "inline": {"PASSWORD_HASHING_WORKERS": settings.WEB_THREADS, "PASSWORD_HASHING_QUEUE_SIZE": 0},
+                        "pool": {},
+                    }
+                    for mode, overrides in modes.items():
+                        with override_settings(**overrides):
+                            self.reset_executor()
+                            result = self.run(email, access, options["logins"], options["clients"])
+                        self.stdout.write(
+                            f"{count:>8} iterations  {mode:<6} {result['rate']:>5.1f} logins/s "
+                            f"({result['rate'] / cores:.1f}/core)  login p50 {result['login_p50']:>7.1f}ms  "
+                            f"{result['rejected']:>3} rejected  vaccines p50 {result['probe_p50']:>6.1f}ms "
+                            f"p95 {result['probe_p95']:>6.1f}ms"
+                        )
+            self.reset_executor()
+        finally:
+            User.objects.filter(email=email).delete()
+
+    def benchmark_registration(self, email: str) -> None:
+        data = {"email": email, "full_name": "Benchmark", "password": PASSWORD, "password_confirm": PASSWORD}
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            response = APIClient().post("/api/auth/register/", data, format="json")
+            elapsed = (time.perf_counter() - started) * 1000
+        if response.status_code != 201:
+            raise CommandError(f"Registration failed: {response.status_code} {response.content!r}")
+        writes = [query for query in context.captured_queries if query["sql"].startswith(("INSERT", "UPDATE"))]
+        self.stdout.write(
+            f"register: {elapsed:.1f}ms, {len(context.captured_queries)} queries, {len(writes)} write(s) "
+            f"at {settings.PASSWORD_HASH_ITERATIONS} iterations"
+        )
+
+    @staticmethod
+    def login(client: APIClient, email: str) -> dict:
+        response = client.post("/api/auth/login/", {"email": email, "password": PASSWORD}, format="json")
+        if response.status_code != 200:
+            raise CommandError(f"Login failed: {response.status_code} {response.content!r}")
+        return response.json()
+
+    @staticmethod
+    def reset_executor() -> None:
+        get_executor().executor.shutdown(wait=True)
+        get_executor.cache_clear()
+
+    def run(self, email: str, access: str, logins: int, clients: int) -> dict:
+        """
+        `logins` logins from `clients` concurrent clients, served like a gunicorn worker: by `WEB_THREADS`
+        server threads taking requests from one queue. Meanwhile a probe client requests the vaccine
+        list, so its latency includes waiting for a free server thread. Rejected logins (503) are retried.
+        """
+        requests = queue.Queue()
+        login_timings, probe_timings = [], []
+        rejected = 0
+        remaining = iter(range(logins))
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def serve():
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+            try:
+                while (request := requests.get()) is not None:
+                    path, data, reply = request
+                    if data is None:
+                        reply.put(client.get(path).status_code)
+                    else:
+                        reply.put(client.post(path, data, format="json").status_code)
+            finally:
+                connection.close()
+
+        def send(path: str, data=None) -> int:
+            reply = queue.Queue(maxsize=1)
+            requests.put((path, data, reply))
+            return reply.get()
+
+        def log_in():
+            nonlocal rejected
+            while True:
+                with lock:
+                    if next(remaining, None) is None:
+                        return
+                started = time.perf_counter()
+                while (status := send("/api/auth/login/", {"email": email, "password": PASSWORD})) == 503:
+                    with lock:
+                        rejected += 1
+                    # As told by Retry-After.
+                    time.sleep(PasswordHashingBusy.wait)
+                if status != 200:
+                    raise CommandError(f"Login failed: {status}")
+                login_timings.append((time.perf_counter() - started) * 1000)
+
+        def probe():
+            while not done.is_set():
+                started = time.perf_counter()
+                send("/api/vaccines/")
+                probe_timings.append((time.perf_counter() - started) * 1000)
+                time.sleep(0.02)
+
+        servers = [threading.Thread(target=serve) for _ in range(settings.WEB_THREADS)]
+        login_clients = [threading.Thread(target=log_in) for _ in range(clients)]
+        probe_client = threading.Thread(target=probe)
+        for thread in servers:
+            thread.start()
+        started = time.perf_counter()
+        probe_client.start()
+        for thread in login_clients:
+            thread.start()
+        for thread in login_clients:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        done.set()
+        probe_client.join()
+        for _ in servers:
+            requests.put(None)
+        for thread in servers:
+            thread.join()
+
+        return {
+            "rate": logins / elapsed,
+            "login_p50": statistics.median(login_timings),
+            "probe_p50": statistics.median(probe_timings) if probe_timings else 0.0,
+            "probe_p95": statistics.quantiles(probe_timings, n=20)[-1] if len(probe_timings) > 1 else 0.0,
+            "rejected": rejected,
+        }
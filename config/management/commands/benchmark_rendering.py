@@ -0,0 +1,75 @@
+import io
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.text import compress_string
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from config.compression import CompressionMiddleware
+from config.renderers import ORJSONParser, ORJSONRenderer
+from config.serialization import ValuesRepresentation
+from pets.models import Pet
+from pets.serializers import PetSerializer
+from vaccinations.models import Vaccination
+from vaccinations.serializers import VaccinationSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure list payloads of 100 and 1,000 rows (pets and vaccinations, as the lean list serialization "
+        "builds them): render and parse time with DRF's json-based renderer/parser and the orjson pair "
+        "(config.renderers), checking both render the same bytes, and bytes on the wire with and without gzip "
+        "(config.compression)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="100,1000", help="Comma-separated page sizes.")
+        parser.add_argument("--repeat", type=int, default=20, help="Runs per measurement; the fastest one is reported.")
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options["sizes"].split(",")]
+        cases = [
+            ("vaccinations", VaccinationSerializer, Vaccination.objects.order_by("-pk")),
+            ("pets", PetSerializer, Pet.objects.order_by("-pk")),
+        ]
+        for label, serializer_class, queryset in cases:
+            representation = ValuesRepresentation(serializer_class)
+            for size in sizes:
+                rows = representation.many(queryset.values(*representation.value_names)[:size])
+                if len(rows) < size:
+                    self.stdout.write(self.style.WARNING(f"{label}: only {len(rows)} rows, run generate_data first."))
+                    if not rows:
+                        continue
+                data = {"count": len(rows), "next": None, "previous": None, "results": rows}
+                self.report(f"{label} x{len(rows)}", data, options["repeat"])
+
+    def report(self, label: str, data: dict, repeat: int) -> None:
+        expected = JSONRenderer().render(data)
+        content = ORJSONRenderer().render(data)
+        if content != expected:
+            raise CommandError(f"{label}: ORJSONRenderer output differs from JSONRenderer.")
+
+        drf_render = self.best(lambda: JSONRenderer().render(data), repeat)
+        orjson_render = self.best(lambda: ORJSONRenderer().render(data), repeat)
+        drf_parse = self.best(lambda: JSONParser().parse(io.BytesIO(content)), repeat)
+        orjson_parse = self.best(lambda: ORJSONParser().parse(io.BytesIO(content)), repeat)
+        max_random_bytes = CompressionMiddleware.max_random_bytes
+        gzip_time = self.best(lambda: compress_string(content, max_random_bytes=max_random_bytes), repeat)
+        compressed = compress_string(content, max_random_bytes=max_random_bytes)
+
+        self.stdout.write(
+            f"{label:<18} render {drf_render:7.2f} -> {orjson_render:5.2f}ms ({drf_render / orjson_render:4.1f}x)  "
+            f"parse {drf_parse:6.2f} -> {orjson_parse:5.2f}ms  "
+            f"{len(content):>8} bytes -> gzip {len(compressed):>7} bytes "
+            f"({len(compressed) / len(content):.0%}, {gzip_time:5.2f}ms)"
+        )
+
+    @staticmethod
+    def best(function, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - started) * 1000)
+        return min(timings)
@@ -0,0 +1,85 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from config.serialization import ValuesRepresentation
+from pets.models import Pet
+from pets.serializers import PetSerializer
+from vaccinations.models import Vaccination
+from vaccinations.serializers import VaccinationSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the lean list serialization (config.serialization) produces the same JSON as the "
+        "ModelSerializers, and measure rows/second for both paths, query included."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000, help="Rows read per case.")
+        parser.add_argument("--repeat", type=int, default=3, help="Runs per path; the fastest one is reported.")
+
+    def handle(self, *args, **options):
+        cases = [
+            ("pets", PetSerializer, Pet.objects.order_by("id")),
+            (
+                "vaccinations",
+                VaccinationSerializer,
+                Vaccination.objects.select_related("pet", "vaccine").order_by("id"),
+            ),
+        ]
+        mismatches = 0
+        for label, serializer_class, queryset in cases:
+            queryset = queryset[: options["rows"]]
+            representation = ValuesRepresentation(serializer_class)
+
+            instances = list(queryset)
+            rows = list(queryset.values(*representation.value_names))
+            if not instances:
+                self.stdout.write(self.style.WARNING(f"{label}: no rows, run generate_data first."))
+                continue
+
+            paths = {
+                "with query": (
+                    lambda: serializer_class(list(queryset), many=True).data,
+                    lambda: representation.many(queryset.values(*representation.value_names)),
+                ),
+                "serialization only": (
+                    lambda: serializer_class(instances, many=True).data,
+                    lambda: representation.many(rows),
+                ),
+            }
+            expected = serializer_class(instances, many=True).data
+            actual = representation.many(rows)
+
+            # Compare the rendered JSON, so types that render alike (e.g. str subclasses) are equal.
+            if json.dumps(expected) != json.dumps(actual):
+                mismatches += 1
+                for index, (old, new) in enumerate(zip(expected, actual)):
+                    if json.dumps(old) != json.dumps(new):
+                        self.stdout.write(self.style.ERROR(f"{label}: row {index} differs:\n  {old}\n  {new}"))
+                        break
+            else:
+                self.stdout.write(self.style.SUCCESS(f"{label}: {len(expected)} rows identical"))
+
+            for name, (model_path, values_path) in paths.items():
+                model_seconds = self.measure(model_path, options["repeat"])
+                values_seconds = self.measure(values_path, options["repeat"])
+                self.stdout.write(
+                    f"  {name:<19} serializer {len(rows) / model_seconds:>10,.0f} rows/s   "
+                    f"values {len(rows) / values_seconds:>10,.0f} rows/s   ({model_seconds / values_seconds:.1f}x)"
+                )
+
+        if mismatches:
+            raise CommandError(f"{mismatches} serializer(s) differ from their lean representation.")
+
+    @staticmethod
+    def measure(function, repeat: int) -> float:
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best
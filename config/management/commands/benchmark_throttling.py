@@ -0,0 +1,85 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.views import APIView
+
+from config.throttling import AnonThrottle, UserThrottle, WriteThrottle, get_store, unreached_rates
+from users.models import User
+from users.tokens import UserRefreshToken
+
+
+class ThrottledView(APIView):
+    throttle_classes = [AnonThrottle, UserThrottle, WriteThrottle]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the cost of the default throttles (config.throttling): microseconds per check_throttles() "
+        "call for an authenticated request with the in-process store and a cache store, and the p50 of "
+        "GET /api/vaccines/ with the throttles on and off. Also checks that a client over its rate gets 429."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--checks", type=int, default=100_000, help="check_throttles() calls per store.")
+        parser.add_argument("--clients", type=int, default=1000, help="Distinct users the checks rotate through.")
+        parser.add_argument("--requests", type=int, default=500, help="Requests per end-to-end case.")
+        parser.add_argument("--cache", default="default", help="Cache alias for the cache store case.")
+
+    def handle(self, *args, **options):
+        for name, alias in (("in-process", ""), (f"cache {options['cache']!r}", options["cache"])):
+            with override_settings(THROTTLE_RATES=unreached_rates(), THROTTLE_CACHE=alias):
+                get_store.cache_clear()
+                micros = self.time_checks(options["checks"], options["clients"])
+            self.stdout.write(f"check_throttles, {name + ' store':<24} {micros:6.2f} µs per request")
+        get_store.cache_clear()
+
+        user = User.objects.order_by("id").first()
+        if user is None:
+            self.stdout.write(self.style.WARNING("No users; run seed_data or generate_data for the end-to-end cases."))
+            return
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {UserRefreshToken.for_user(user).access_token}")
+        for label, rates in (("off", {}), ("on", unreached_rates())):
+            with override_settings(THROTTLE_RATES=rates):
+                p50 = self.time_requests(client, options["requests"])
+            self.stdout.write(f"GET /api/vaccines/, throttles {label:<3} p50 {p50:7.3f} ms")
+
+        self.check_limit(client)
+
+    @staticmethod
+    def time_checks(checks: int, clients: int) -> float:
+        factory = APIRequestFactory()
+        view = ThrottledView()
+        requests = []
+        for index in range(clients):
+            request = Request(factory.get("/api/vaccines/"))
+            request.user = User(pk=index + 1)
+            requests.append(request)
+
+        started = time.perf_counter()
+        for index in range(checks):
+            view.check_throttles(requests[index % clients])
+        return (time.perf_counter() - started) / checks * 1e6
+
+    @staticmethod
+    def time_requests(client: APIClient, count: int) -> float:
+        timings = []
+        for _ in range(count):
+            started = time.perf_counter()
+            client.get("/api/vaccines/")
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    def check_limit(self, client: APIClient) -> None:
+        with override_settings(THROTTLE_RATES={"user": "5/min"}):
+            statuses = [client.get("/api/vaccines/").status_code for _ in range(7)]
+            retry_after = client.get("/api/vaccines/").get("Retry-After")
+        get_store.cache_clear()
+        if statuses[:5] == [200] * 5 and statuses[5:] == [429, 429]:
+            self.stdout.write(self.style.SUCCESS(f"5/min: 5 requests served, then 429 (Retry-After {retry_after})"))
+        else:
+            self.stdout.write(self.style.ERROR(f"5/min: unexpected statuses {statuses}"))
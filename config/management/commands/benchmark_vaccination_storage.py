@@ -0,0 +1,109 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Max, Min
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from config.throttling import unreached_rates
+from pets.models import Pet
+from users.models import User
+from users.tokens import UserRefreshToken
+from vaccinations.models import VaccinationArchive
+from vaccinations.partitioning import VaccinationPartitioner
+
+CASES = {
+    "list": "/api/vaccinations/",
+    "list cursor": "/api/vaccinations/?pagination=cursor",
+    "filter pet": "/api/vaccinations/?pet={pet}",
+    "filter upcoming": "/api/vaccinations/?upcoming=true",
+    "search": "/api/vaccinations/?search=booster",
+    "due": "/api/vaccinations/due/?window=30",
+    "list include_archived": "/api/vaccinations/?include_archived=true",
+    "filter pet include_archived": "/api/vaccinations/?pet={pet}&include_archived=true",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the vaccination tables and the API reads over them, to compare before and after "
+        "partition_vaccinations and archive_vaccinations: rows, table and index size of vaccinations (all "
+        "partitions) and vaccinations_archive (PostgreSQL), and the p50/p95 latency of the vaccination list "
+        "endpoints for a sample of owners, each owner requested once per case, without the response cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owners", type=int, default=200, help="Owners sampled (pets picked at random).")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed of the sample.")
+
+    def handle(self, *args, **options):
+        self.report_sizes()
+
+        pets = self.sample_pets(options["owners"], options["seed"])
+        if not pets:
+            raise CommandError("No pets found. Run generate_data first.")
+        clients = [(self.client_for(owner_id), pet_id) for pet_id, owner_id in pets]
+        with override_settings(THROTTLE_RATES=unreached_rates(), RESPONSE_CACHE=""):
+            for name, path in CASES.items():
+                timings = []
+                for client, pet_id in clients:
+                    started = time.perf_counter()
+                    response = client.get(path.format(pet=pet_id), HTTP_ACCEPT="application/json")
+                    timings.append((time.perf_counter() - started) * 1000)
+                    if response.status_code != 200:
+                        raise CommandError(f"{name}: status {response.status_code}.")
+                p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+                self.stdout.write(f"{name:<30} p50 {statistics.median(timings):8.2f}ms  p95 {p95:8.2f}ms")
+
+    def report_sizes(self) -> None:
+        partitioner = VaccinationPartitioner()
+        for table in (partitioner.table, VaccinationArchive._meta.db_table):
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(table)}")
+                rows = cursor.fetchone()[0]
+            line = f"{table:<22} {rows:>12,} rows"
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    # A plain table is not in its own partition tree; a partitioned one has no storage itself.
+                    cursor.execute(
+                        "SELECT SUM(pg_table_size(relid)), SUM(pg_indexes_size(relid)) FROM "
+                        "(SELECT %s::regclass AS relid UNION SELECT relid FROM pg_partition_tree(%s::regclass)) tree",
+                        [table, table],
+                    )
+                    table_bytes, index_bytes = cursor.fetchone()
+                line += f"  table {table_bytes / 2**20:9.1f} MB  indexes {index_bytes / 2**20:9.1f} MB"
+                if table == partitioner.table and partitioner.is_partitioned():
+                    line += f"  ({len(partitioner.get_partitions())} partitions)"
+            self.stdout.write(line)
+
+    @staticmethod
+    def sample_pets(count: int, seed: int) -> list[tuple[int, int]]:
+        """
+        (pet id, owner id) of `count` pets of distinct owners, picked at random through the primary key.
+        """
+        rng = random.Random(seed)
+        bounds = Pet.objects.aggregate(low=Min("id"), high=Max("id"))
+        if bounds["low"] is None:
+            return []
+        pets = {}
+        for _ in range(count * 2):
+            pet = (
+                Pet.objects.filter(pk__gte=rng.randint(bounds["low"], bounds["high"]))
+                .order_by("pk")
+                .values_list("pk", "owner_id")
+                .first()
+            )
+            if pet is not None:
+                pets.setdefault(pet[1], pet)
+            if len(pets) == count:
+                break
+        return [(pet_id, owner_id) for owner_id, (pet_id, _) in pets.items()]
+
+    @staticmethod
+    def client_for(owner_id: int) -> APIClient:
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {UserRefreshToken.for_user(User(pk=owner_id)).access_token}")
+        return client
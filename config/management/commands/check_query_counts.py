@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from config.throttling import unreached_rates
+from pets.models import Pet
+from users.models import User
+from users.tokens import UserRefreshToken
+from vaccinations.models import Vaccination, VaccinationStatus
+from vaccines.models import Vaccine
+
+# Queries per request, whatever the number of pets on the page: the page (and its count) with the
+# vaccination summary annotated in the same query.
+EXPECTED_QUERIES = {
+    "pets list": ("/api/pets/", 2),
+    "pets list cursor": ("/api/pets/?pagination=cursor", 1),
+    "pets detail": ("/api/pets/{pet}/", 1),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the pet list and detail run a fixed number of queries whatever the number of pets on "
+        "the page: create an owner with 1 pet and one with --pets pets (each with vaccinations), count the "
+        "queries of each request without the response cache, and fail if a count differs from the expected "
+        "one. The data is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pets",
+            type=int,
+            default=settings.REST_FRAMEWORK["PAGE_SIZE"],
+            help="Pets of the larger owner (default: a full page).",
+        )
+        parser.add_argument("--vaccinations", type=int, default=3, help="Vaccinations of each pet.")
+
+    def handle(self, *args, **options):
+        failures = []
+        with transaction.atomic(), override_settings(THROTTLE_RATES=unreached_rates(), RESPONSE_CACHE=""):
+            vaccines = self.get_vaccines(options["vaccinations"])
+            for pet_count in sorted({1, options["pets"]}):
+                owner, pets = self.create_owner(pet_count, vaccines)
+                client = APIClient()
+                client.credentials(HTTP_AUTHORIZATION=f"Bearer {UserRefreshToken.for_user(owner).access_token}")
+                for name, (path, expected) in EXPECTED_QUERIES.items():
+                    label = f"{name}, {pet_count} pet{'s' if pet_count > 1 else ''}"
+                    with CaptureQueriesContext(connection) as queries:
+                        response = client.get(path.format(pet=pets[-1].pk), HTTP_ACCEPT="application/json")
+                    if response.status_code != 200:
+                        raise CommandError(f"{label}: status {response.status_code}.")
+                    if len(queries) != expected:
+                        failures.append(label)
+                        message = f"FAIL {label}: {len(queries)} queries, expected {expected}"
+                        self.stdout.write(self.style.ERROR(message))
+                        for query in queries.captured_queries:
+                            self.stdout.write(f"       {query['sql']}")
+                    else:
+                        self.stdout.write(self.style.SUCCESS(f"ok   {label}: {len(queries)} queries"))
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f"{len(failures)} request(s) ran an unexpected number of queries.")
+
+    @staticmethod
+    def get_vaccines(count: int) -> list[Vaccine]:
+        vaccines = list(Vaccine.objects.order_by("id")[:count])
+        for index in range(len(vaccines), count):
+            vaccines.append(Vaccine.objects.create(name=f"Query count check {index}", periodicity_days=365))
+        return vaccines
+
+    @staticmethod
+    def create_owner(pet_count: int, vaccines: list[Vaccine]) -> tuple[User, list[Pet]]:
+        owner = User.objects.create_user(
+            username=None, email=f"query-count-check-{pet_count}@example.com", full_name="Query count check"
+        )
+        pets = Pet.objects.bulk_create(
+            Pet(owner=owner, name=f"Pet {index}", species="dog") for index in range(pet_count)
+        )
+        today = date.today()
+        vaccinations = [
+            Vaccination(
+                pet=pet,
+                owner=owner,
+                vaccine=vaccine,
+                application_date=today - timedelta(days=400 * (index + 1)),
+                next_due_date=today - timedelta(days=400 * (index + 1) - vaccine.periodicity_days),
+            )
+            for pet in pets
+            for index, vaccine in enumerate(vaccines)
+        ]
+        Vaccination.objects.bulk_create(vaccinations)
+        VaccinationStatus.objects.refresh((pet.pk, vaccine.pk) for pet in pets for vaccine in vaccines)
+        return owner, pets
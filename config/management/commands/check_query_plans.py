@@ -0,0 +1,125 @@
+import re
+from datetime import date
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from pets.models import Pet
+from pets.views import PetViewSet
+from vaccines.models import Vaccine
+from vaccinations.filters import VaccinationFilter
+from vaccinations.models import Vaccination, VaccinationStatus
+from vaccinations.partitioning import VaccinationPartitioner
+
+SQLITE_TABLE_SCAN = re.compile(r"\bSCAN (?!.*\bUSING\b.*\bINDEX\b)")
+SQLITE_SORT = re.compile(r"USE TEMP B-TREE FOR ORDER BY")
+POSTGRES_TABLE_SCAN = re.compile(r"\bSeq Scan on\b")
+# Sort nodes only: a Merge Append over the partitions of a partitioned table prints a "Sort Key" too.
+POSTGRES_SORT = re.compile(r"^\s*(->\s+)?(Incremental )?Sort\s+\(", re.MULTILINE)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN on the list, filter and ordering queries issued by the API "
+        "and fail if any of them falls back to a sequential scan or a sort step."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner", type=int, help="User id to scope the queries to (defaults to the first user).")
+        parser.add_argument("--verbose-plans", action="store_true", help="Print every plan, not only failures.")
+
+    def handle(self, *args, **options):
+        if connection.vendor == "sqlite":
+            table_scan, sort = SQLITE_TABLE_SCAN, SQLITE_SORT
+        elif connection.vendor == "postgresql":
+            table_scan, sort = POSTGRES_TABLE_SCAN, POSTGRES_SORT
+        else:
+            raise CommandError(f"Query plan checks are not supported on '{connection.vendor}'.")
+
+        User = get_user_model()
+        owner_id = options["owner"] or User.objects.order_by("id").values_list("id", flat=True).first()
+        if owner_id is None:
+            raise CommandError("No users found. Run seed_data first.")
+
+        failures = []
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                # Small or freshly seeded tables make the planner prefer sequential scans even when a
+                # usable index exists, so make it pick the index path whenever there is one.
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for label, queryset, allow_sort in self.get_queries(owner_id):
+                # The API reads a page at a time, and the planner only favours index order under a LIMIT.
+                plan = queryset[: settings.REST_FRAMEWORK["PAGE_SIZE"]].explain()
+                problems = []
+                if table_scan.search(plan):
+                    problems.append("sequential scan")
+                if not allow_sort and sort.search(plan):
+                    problems.append("sort")
+
+                if problems:
+                    failures.append(label)
+                    self.stdout.write(self.style.ERROR(f"FAIL {label}: {', '.join(problems)}"))
+                    self.stdout.write(plan)
+                else:
+                    self.stdout.write(self.style.SUCCESS(f"ok   {label}"))
+                    if options["verbose_plans"]:
+                        self.stdout.write(plan)
+
+        if failures:
+            raise CommandError(f"{len(failures)} query plan(s) are not index-backed.")
+
+    def get_queries(self, owner_id: int):
+        """
+        Queries mirroring the viewsets' get_queryset, filters and ordering_fields.
+
+        Each entry is (label, queryset, allow_sort). An owner's vaccinations and statuses are read
+        through their denormalized owner column, in the order of an (owner, ...) index. Only on a
+        partitioned vaccinations table (see `vaccinations.partitioning`) may a pet's rows, spread over
+        the partitions, be sorted after the index scan of each one. Every other query must be served
+        straight from an index.
+        """
+        today = date.today()
+        pet_id = Pet.objects.filter(owner_id=owner_id).values_list("id", flat=True).first() or 0
+        vaccine_id = Vaccine.objects.values_list("id", flat=True).first() or 0
+        manufacturer = Vaccine.objects.values_list("manufacturer", flat=True).first() or ""
+        partitioned = VaccinationPartitioner().is_partitioned()
+
+        pets = Pet.objects.filter(owner_id=owner_id)
+        vaccinations = Vaccination.objects.select_related("pet", "vaccine").filter(owner_id=owner_id)
+        upcoming = VaccinationFilter().filter_upcoming(vaccinations, "upcoming", True)
+        statuses = VaccinationStatus.objects.filter(owner_id=owner_id, next_due_date__isnull=False)
+
+        return [
+            ("pets list", pets.order_by("name"), False),
+            ("pets list with summary", PetViewSet.annotate_summary(pets.order_by("name")), False),
+            ("pets ordering=created_at", pets.order_by("created_at"), False),
+            ("pets ordering=-created_at", pets.order_by("-created_at"), False),
+            ("vaccines list", Vaccine.objects.order_by("name"), False),
+            ("vaccines manufacturer filter", Vaccine.objects.filter(manufacturer=manufacturer).order_by("name"), False),
+            ("vaccinations list", vaccinations.order_by("-application_date"), False),
+            ("vaccinations pet filter", vaccinations.filter(pet_id=pet_id).order_by("-application_date"), partitioned),
+            (
+                "vaccinations vaccine filter",
+                vaccinations.filter(vaccine_id=vaccine_id).order_by("-application_date"),
+                False,
+            ),
+            ("vaccinations upcoming filter", upcoming.order_by("-application_date"), False),
+            (
+                "vaccinations pet + upcoming filter",
+                upcoming.filter(pet_id=pet_id).order_by("next_due_date"),
+                partitioned,
+            ),
+            ("vaccinations ordering=next_due_date", vaccinations.order_by("next_due_date"), False),
+            ("vaccinations ordering=-created_at", vaccinations.order_by("-created_at"), False),
+            ("due list", statuses.order_by("next_due_date"), False),
+            ("due window=overdue", statuses.filter(next_due_date__lt=today).order_by("next_due_date"), False),
+            (
+                "reminders across all owners",
+                VaccinationStatus.objects.filter(next_due_date__lte=today).order_by("next_due_date"),
+                False,
+            ),
+        ]
@@ -0,0 +1,197 @@
+import itertools
+import shutil
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Count
+from rest_framework.test import APIClient
+
+from config.db_routers import PRIMARY_PIN_COOKIE, get_replicas, primary_pin_key
+from config.response_cache import HEADER
+from pets.models import Pet
+from users.models import User
+from users.tokens import UserRefreshToken
+
+
+class Command(BaseCommand):
+    help = (
+        "Check the read-replica routing (config.db_routers) by running API requests in process and recording "
+        "which database each query hits: safe requests read from a replica, writes go to the primary, and a "
+        "client that wrote reads from the primary for DJANGO_DB_REPLICA_PIN_SECONDS. With the response cache on, "
+        "routed requests carry a unique query parameter so the cache cannot answer them, and responses built "
+        "from a replica must not be cached. To run it locally, point DJANGO_DB_REPLICA_URLS at another SQLite "
+        "file and pass --snapshot to copy the primary into it first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--snapshot",
+            action="store_true",
+            help="Copy the primary SQLite database over the replica's before checking (SQLite only).",
+        )
+
+    def handle(self, *args, **options):
+        replicas = get_replicas()
+        if not replicas:
+            raise CommandError("No replica configured; set DJANGO_DB_REPLICA_URLS.")
+        if not settings.DB_REPLICA_PIN_SECONDS:
+            raise CommandError("DJANGO_DB_REPLICA_PIN_SECONDS is 0, so clients are never pinned to the primary.")
+        if options["snapshot"]:
+            self.snapshot(replicas)
+
+        owners = list(User.objects.annotate(pet_count=Count("pets")).filter(pet_count__gt=0).order_by("id")[:2])
+        if len(owners) < 2:
+            raise CommandError("Two owners with pets are needed. Run seed_data or generate_data first.")
+        writer, other = (self.client_for(owner) for owner in owners)
+        cache.delete(primary_pin_key(owners[0].pk))
+
+        self.failures = 0
+        self.request_ids = itertools.count(1)
+        self.check_request("safe request reads from a replica", writer, "get", "/api/pets/", expect="replica")
+        response = self.check_request(
+            "write goes to the primary",
+            writer,
+            "post",
+            "/api/pets/",
+            {"name": "Replica check", "species": "dog"},
+            expect="primary",
+            status=201,
+        )
+        pet_id = response.data["id"] if response.status_code == 201 else None
+        try:
+            if PRIMARY_PIN_COOKIE not in response.cookies:
+                self.fail(f"the write did not set the {PRIMARY_PIN_COOKIE} cookie")
+            self.check_request(
+                "writer reads its own write (cookie)",
+                writer,
+                "get",
+                f"/api/pets/{pet_id}/",
+                expect="primary",
+                status=200,
+            )
+            writer_without_cookie = self.client_for(owners[0])
+            self.check_request(
+                "writer reads its own write (user pin, no cookie)",
+                writer_without_cookie,
+                "get",
+                f"/api/pets/{pet_id}/",
+                expect="primary",
+                status=200,
+            )
+            self.check_request("other clients still read from a replica", other, "get", "/api/pets/", expect="replica")
+            if settings.RESPONSE_CACHE:
+                self.check_response_cache(writer, other, pet_id)
+
+            # Once the pin expires, the writer is back on the replicas; a stale snapshot answers 404.
+            cache.delete(primary_pin_key(owners[0].pk))
+            response = self.check_request(
+                "writer back on a replica after the pin",
+                writer_without_cookie,
+                "get",
+                f"/api/pets/{pet_id}/",
+                expect="replica",
+            )
+            self.stdout.write(f"       (replica answered {response.status_code} for the new pet)")
+        finally:
+            if pet_id is not None:
+                Pet.objects.filter(pk=pet_id).delete()
+            cache.delete(primary_pin_key(owners[0].pk))
+
+        if self.failures:
+            raise CommandError(f"{self.failures} routing check(s) failed.")
+
+    def snapshot(self, replicas: list[str]) -> None:
+        primary = settings.DATABASES[DEFAULT_DB_ALIAS]
+        for alias in replicas:
+            replica = settings.DATABASES[alias]
+            if "sqlite3" not in primary["ENGINE"] or "sqlite3" not in replica["ENGINE"]:
+                raise CommandError("--snapshot only copies SQLite databases.")
+            connections[alias].close()
+            shutil.copyfile(primary["NAME"], replica["NAME"])
+            self.stdout.write(f"Copied {primary['NAME']} to {alias} ({replica['NAME']}).")
+
+    @staticmethod
+    def client_for(user: User) -> APIClient:
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {UserRefreshToken.for_user(user).access_token}")
+        return client
+
+    def check_response_cache(self, writer: APIClient, other: APIClient, pet_id: int) -> None:
+        """
+        A response built from a replica is not stored; one built on the primary is, and is served again.
+        """
+        path = "/api/pets/?ordering=name"
+        for attempt in ("first", "second"):
+            self.check_request(
+                f"response built from a replica is not cached ({attempt} request)",
+                other,
+                "get",
+                path,
+                expect="replica",
+                bypass_cache=False,
+            )
+        path = f"/api/pets/{pet_id}/?ordering=name"
+        self.check_request(
+            "response built on the primary is cached", writer, "get", path, expect="primary", bypass_cache=False
+        )
+        self.check_request("cached response is served again", writer, "get", path, expect="cache", bypass_cache=False)
+
+    def check_request(
+        self,
+        label: str,
+        client: APIClient,
+        method: str,
+        path: str,
+        data=None,
+        expect: str = "",
+        status=None,
+        bypass_cache: bool = True,
+    ):
+        """
+        Make the request, recording the database alias of each query, and compare with `expect`
+        ("replica", "primary", or "cache" for a response cache hit without queries).
+
+        With `bypass_cache`, reads carry a parameter of their own, so the response cache (keyed on the
+        query string) cannot answer them without routing.
+        """
+        if method == "get" and bypass_cache and settings.RESPONSE_CACHE:
+            path += f"{'&' if '?' in path else '?'}routing_check={next(self.request_ids)}"
+        queries = Counter()
+
+        def record(alias):
+            def wrapper(execute, sql, params, many, context):
+                queries[alias] += 1
+                return execute(sql, params, many, context)
+
+            return wrapper
+
+        with ExitStack() as stack:
+            for alias in settings.DATABASES:
+                stack.enter_context(connections[alias].execute_wrapper(record(alias)))
+            response = getattr(client, method)(path, data, format="json", HTTP_ACCEPT="application/json")
+
+        replica_queries = sum(count for alias, count in queries.items() if alias != DEFAULT_DB_ALIAS)
+        problems = []
+        if expect == "replica" and (queries[DEFAULT_DB_ALIAS] or not replica_queries):
+            problems.append("expected every query on a replica")
+        if expect == "primary" and (replica_queries or not queries[DEFAULT_DB_ALIAS]):
+            problems.append("expected every query on the primary")
+        if expect == "cache" and (queries or response.get(HEADER) != "hit"):
+            problems.append(f"expected a response cache hit without queries ({HEADER}: {response.get(HEADER)})")
+        if status is not None and response.status_code != status:
+            problems.append(f"status {response.status_code}, expected {status}")
+
+        summary = ", ".join(f"{alias}: {count}" for alias, count in sorted(queries.items())) or "no queries"
+        if problems:
+            self.fail(f"{label}: {'; '.join(problems)} ({summary})")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"ok   {label} ({summary})"))
+        return response
+
+    def fail(self, message: str) -> None:
+        self.failures += 1
+        self.stdout.write(self.style.ERROR(f"FAIL {message}"))
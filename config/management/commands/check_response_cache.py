@@ -0,0 +1,139 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from config.response_cache import HEADER, get_stats
+from config.throttling import get_store, unreached_rates
+from pets.models import Pet
+from users.models import User
+from users.tokens import UserRefreshToken
+from vaccines.models import Vaccine
+
+ENDPOINTS = ["pet-list", "pet-retrieve", "vaccination-list", "vaccination-retrieve"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the per-owner response cache (config.response_cache) never serves stale data: warm the "
+        "cached pet and vaccination lists and details, write through the API (create, update, delete, bulk and "
+        "CSV import), and compare every cached response with one built without the cache. Also checks that "
+        "another owner's cached responses survive those writes, and prints the hit/miss counters."
+    )
+
+    def handle(self, *args, **options):
+        owners = list(User.objects.annotate(pet_count=Count("pets")).filter(pet_count__gt=0).order_by("id")[:2])
+        vaccine = Vaccine.objects.order_by("id").first()
+        if len(owners) < 2 or vaccine is None:
+            raise CommandError("Two owners with pets and a vaccine are needed. Run seed_data or generate_data first.")
+        writer, other = (self.client_for(owner) for owner in owners)
+
+        self.failures = 0
+        pet_id = None
+        with override_settings(THROTTLE_RATES=unreached_rates()):
+            get_store.cache_clear()
+            if not self.get(writer, "/api/pets/").has_header(HEADER):
+                raise CommandError("Responses are not cached; set DJANGO_RESPONSE_CACHE.")
+            try:
+                other_pets = "/api/pets/?ordering=-created_at"
+                self.warm(other, [other_pets])
+
+                pets = "/api/pets/?ordering=-created_at"
+                self.warm(writer, [pets])
+                pet_id = self.write(writer, "post", "/api/pets/", {"name": "Cache check", "species": "dog"}).data["id"]
+                pet = f"/api/pets/{pet_id}/"
+                vaccinations = f"/api/vaccinations/?pet={pet_id}"
+                self.check_fresh("pet create", writer, [pets])
+
+                self.warm(writer, [pets, pet, vaccinations])
+                self.write(writer, "patch", pet, {"name": "Cache check (renamed)"})
+                self.check_fresh("pet update", writer, [pets, pet])
+
+                self.warm(writer, [pets, pet, vaccinations])
+                item = {"pet": pet_id, "vaccine": vaccine.pk, "application_date": "2020-01-10"}
+                vaccination_id = self.write(writer, "post", "/api/vaccinations/", item).data["id"]
+                vaccination = f"/api/vaccinations/{vaccination_id}/"
+                self.check_fresh("vaccination create", writer, [pets, pet, vaccinations])
+
+                self.warm(writer, [pet, vaccinations, vaccination])
+                self.write(writer, "patch", vaccination, {"application_date": "2021-01-10", "notes": "Updated"})
+                self.check_fresh("vaccination update", writer, [pet, vaccinations, vaccination])
+
+                self.warm(writer, [pet, vaccinations, vaccination])
+                bulk = [{"id": vaccination_id, "notes": "Bulk"}, {**item, "application_date": "2022-01-10"}]
+                self.write(writer, "post", "/api/vaccinations/bulk/", bulk)
+                self.check_fresh("bulk create and update", writer, [pet, vaccinations, vaccination])
+
+                self.warm(writer, [pet, vaccinations])
+                upload = SimpleUploadedFile(
+                    "check.csv", f"pet,vaccine,application_date\n{pet_id},{vaccine.pk},2023-01-10\n".encode()
+                )
+                self.write(writer, "post", "/api/vaccinations/import/", {"file": upload}, format="multipart")
+                self.check_fresh("CSV import", writer, [pet, vaccinations])
+
+                self.warm(writer, [pet, vaccinations, vaccination])
+                self.write(writer, "delete", vaccination)
+                self.check_fresh("vaccination delete", writer, [pet, vaccinations, vaccination])
+
+                self.warm(writer, [pets, pet, vaccinations])
+                self.write(writer, "delete", pet)
+                pet_id = None
+                self.check_fresh("pet delete", writer, [pets, pet, vaccinations])
+
+                if self.get(other, other_pets).get(HEADER) != "hit":
+                    self.fail("another owner's cached list was invalidated by these writes")
+                else:
+                    self.stdout.write(self.style.SUCCESS("ok   another owner's cached list is still served"))
+            finally:
+                if pet_id is not None:
+                    Pet.objects.filter(pk=pet_id).delete()
+                get_store.cache_clear()
+
+        for endpoint, counts in get_stats(ENDPOINTS).items():
+            self.stdout.write(f"{endpoint:<20} hits {counts['hit']:>8}  misses {counts['miss']:>8}")
+        if self.failures:
+            raise CommandError(f"{self.failures} response cache check(s) failed.")
+
+    @staticmethod
+    def client_for(user: User) -> APIClient:
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {UserRefreshToken.for_user(user).access_token}")
+        return client
+
+    @staticmethod
+    def get(client: APIClient, path: str):
+        return client.get(path, HTTP_ACCEPT="application/json")
+
+    def write(self, client: APIClient, method: str, path: str, data=None, format: str = "json"):
+        response = getattr(client, method)(path, data, format=format, HTTP_ACCEPT="application/json")
+        if response.status_code >= 300:
+            raise CommandError(f"{method.upper()} {path} answered {response.status_code}: {response.content[:200]}")
+        return response
+
+    def warm(self, client: APIClient, paths: list[str]) -> None:
+        """
+        Request each path until it is served from the cache.
+        """
+        for path in paths:
+            self.get(client, path)
+            if self.get(client, path).get(HEADER) != "hit":
+                raise CommandError(f"GET {path} is not served from the cache.")
+
+    def check_fresh(self, label: str, client: APIClient, paths: list[str]) -> None:
+        """
+        Compare each path as served now with the response built without the cache.
+        """
+        for path in paths:
+            response = self.get(client, path)
+            with override_settings(RESPONSE_CACHE=""):
+                expected = self.get(client, path)
+            if (response.status_code, response.content) != (expected.status_code, expected.content):
+                self.fail(f"after {label}: GET {path} is stale ({response.get(HEADER)})")
+            else:
+                outcome = f"{response.status_code}, {response.get(HEADER)}"
+                self.stdout.write(self.style.SUCCESS(f"ok   after {label}: GET {path} ({outcome})"))
+
+    def fail(self, message: str) -> None:
+        self.failures += 1
+        self.stdout.write(self.style.ERROR(f"FAIL {message}"))
@@ -0,0 +1,27 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.models import Job
+from jobs.registry import UnknownJob, registry
+
+
+class Command(BaseCommand):
+    help = "Queue a background job, e.g. `enqueue_job notifications.send_due_reminders`, for the workers to run."
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", help="Registered job name.")
+        parser.add_argument("--payload", default="{}", help="Keyword arguments for the job, as a JSON object.")
+
+    def handle(self, *args, **options):
+        try:
+            payload = json.loads(options["payload"])
+        except json.JSONDecodeError as exc:
+            raise CommandError(f"Invalid --payload: {exc}")
+        if not isinstance(payload, dict):
+            raise CommandError("--payload must be a JSON object.")
+        try:
+            job = Job.objects.enqueue(options["name"], payload=payload)
+        except UnknownJob as exc:
+            raise CommandError(f"{exc} Registered jobs: {', '.join(sorted(registry))}.")
+        self.stdout.write(self.style.SUCCESS(f"Queued {job}."))
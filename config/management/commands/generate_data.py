@@ -0,0 +1,244 @@
+import multiprocessing
+import random
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+
+from pets.models import Pet
+from vaccines import catalogue
+from vaccines.models import Vaccine
+from vaccinations.models import Vaccination, VaccinationStatus
+
+SPECIES_WEIGHTS = [("dog", 0.55), ("cat", 0.35), ("other", 0.10)]
+BREEDS = {
+    "dog": ["Labrador", "Poodle", "Bulldog", "Beagle", "German Shepherd", "Golden Retriever", "Mixed"],
+    "cat": ["Siamese", "Persian", "Maine Coon", "Bengal", "Sphynx", "Mixed"],
+    "other": ["Rabbit", "Ferret", "Parrot", "Hamster", ""],
+}
+WEIGHT_RANGES = {"dog": (3.0, 45.0), "cat": (2.5, 7.5), "other": (0.1, 3.0)}
+PET_NAMES = [
+    "Rex", "Mia", "Thor", "Luna", "Bob", "Nina", "Max", "Bella", "Simba", "Mel", "Toby", "Lola", "Fred", "Kiara"
+]
+FIRST_NAMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Felipe", "Gabriela", "Heitor", "Isabela", "João"]
+LAST_NAMES = ["Silva", "Santos", "Oliveira", "Souza", "Lima", "Pereira", "Costa", "Almeida", "Ribeiro"]
+VACCINE_NAMES = ["Rabies", "Distemper", "Parvovirus", "Leptospirosis", "Bordetella", "FeLV", "FVRCP", "Giardia"]
+MANUFACTURERS = ["VetPharma", "AnimalHealth", "Zoetis", "MSD", "Boehringer", "Virbac"]
+PERIODICITIES = [180, 365, 365, 365, 730, 1095]
+VETERINARIANS = ["Dr. Smith", "Dr. Johnson", "Dr. Costa", "Dr. Lima", "Dr. Moreira", ""]
+NOTES = ["", "", "", "Annual booster.", "First dose.", "Mild reaction observed.", "Applied at home visit."]
+
+OWNERS_PER_CHUNK = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large synthetic dataset (owners, pets, vaccine catalogue and vaccination history) "
+        "with bulk inserts, a deterministic seed and optional parallel workers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owners", type=int, default=1000, help="Number of owners to create.")
+        parser.add_argument("--pets-per-owner", type=float, default=2.0, help="Mean pets per owner.")
+        parser.add_argument("--vaccines", type=int, default=20, help="Size of the vaccine catalogue.")
+        parser.add_argument("--history", type=float, default=8.0, help="Mean vaccinations per pet.")
+        parser.add_argument("--seed", type=int, default=42, help="Random seed; the same seed yields the same data.")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per bulk_create batch.")
+        parser.add_argument("--workers", type=int, default=1, help="Parallel worker processes (PostgreSQL only).")
+        parser.add_argument(
+            "--email-domain",
+            default="generated.example.com",
+            help="Domain of the generated owner emails; generation refuses to run if it is already in use.",
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        if User.objects.filter(email__endswith=f"@{options['email_domain']}").exists():
+            raise CommandError(f"Owners with domain '{options['email_domain']}' already exist.")
+
+        workers = options["workers"]
+        if workers > 1 and connection.vendor == "sqlite":
+            self.stdout.write(self.style.WARNING("SQLite allows a single writer, using one worker."))
+            workers = 1
+
+        started = time.perf_counter()
+        vaccine_rows = create_vaccines(options["vaccines"], options["seed"])
+        options["vaccine_rows"] = vaccine_rows
+        # The password hash is computed once and shared, hashing per owner would dominate the run.
+        options["password"] = make_password("Passw0rd!")
+
+        chunks = [
+            (index, start, min(start + OWNERS_PER_CHUNK, options["owners"]), options)
+            for index, start in enumerate(range(0, options["owners"], OWNERS_PER_CHUNK))
+        ]
+        totals = {"owners": 0, "pets": 0, "vaccinations": 0}
+
+        if workers > 1:
+            connections.close_all()
+            with multiprocessing.get_context("fork").Pool(workers) as pool:
+                for counts in pool.imap_unordered(generate_chunk, chunks):
+                    self.report(totals, counts, started)
+        else:
+            for chunk in chunks:
+                self.report(totals, generate_chunk(chunk), started)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {totals['owners']} owners, {totals['pets']} pets, {len(vaccine_rows)} vaccines and "
+                f"{totals['vaccinations']} vaccinations in {time.perf_counter() - started:.1f}s."
+            )
+        )
+
+    def report(self, totals: dict, counts: dict, started: float) -> None:
+        for key, value in counts.items():
+            totals[key] += value
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{totals['owners']} owners, {totals['pets']} pets, {totals['vaccinations']} vaccinations "
+            f"({totals['vaccinations'] / elapsed:,.0f} vaccinations/s)"
+        )
+
+
+def create_vaccines(count: int, seed: int) -> list[tuple[int, int]]:
+    """
+    Create the vaccine catalogue and return `(id, periodicity_days)` pairs.
+    """
+    rng = random.Random(f"{seed}-vaccines")
+    vaccines = []
+    for index in range(count):
+        name = VACCINE_NAMES[index % len(VACCINE_NAMES)]
+        if index >= len(VACCINE_NAMES):
+            name = f"{name} {index // len(VACCINE_NAMES) + 1}"
+        vaccines.append(
+            Vaccine(
+                name=name,
+                manufacturer=rng.choice(MANUFACTURERS),
+                description=f"{name} vaccine.",
+                periodicity_days=rng.choice(PERIODICITIES),
+            )
+        )
+    vaccines = Vaccine.objects.bulk_create(vaccines)
+    # bulk_create skips the signals that invalidate the cached catalogue.
+    catalogue.invalidate()
+    return [(vaccine.pk, vaccine.periodicity_days) for vaccine in vaccines]
+
+
+def generate_chunk(chunk: tuple) -> dict:
+    """
+    Generate the owners `[start, end)` with their pets and history in one transaction.
+
+    The random stream is seeded per chunk, so the output does not depend on the number of workers.
+    """
+    index, start, end, options = chunk
+    rng = random.Random(f"{options['seed']}-{index}")
+    batch_size = options["batch_size"]
+    today = date.today()
+    User = get_user_model()
+
+    with transaction.atomic():
+        owners = User.objects.bulk_create(
+            [build_owner(rng, number, options) for number in range(start, end)],
+            batch_size=batch_size,
+        )
+
+        pets = []
+        for owner in owners:
+            # Geometric-like spread: most owners have one or two pets, a few have many.
+            for _ in range(min(1 + int(rng.expovariate(1 / max(options["pets_per_owner"] - 1, 0.01))), 20)):
+                pets.append(build_pet(rng, owner, today))
+        pets = Pet.objects.bulk_create(pets, batch_size=batch_size)
+
+        vaccinations = []
+        for pet in pets:
+            vaccinations.extend(build_history(rng, pet, options["vaccine_rows"], options["history"], today))
+        vaccinations = Vaccination.objects.bulk_create(vaccinations, batch_size=batch_size)
+
+        # bulk_create skips the signals that maintain the status table, so write it directly.
+        latest = {}
+        for vaccination in vaccinations:
+            key = (vaccination.pet_id, vaccination.vaccine_id)
+            if key not in latest or vaccination.application_date >= latest[key].application_date:
+                latest[key] = vaccination
+        VaccinationStatus.objects.bulk_create(
+            [
+                VaccinationStatus(
+                    pet_id=vaccination.pet_id,
+                    vaccine_id=vaccination.vaccine_id,
+                    owner_id=vaccination.owner_id,
+                    vaccination=vaccination,
+                    application_date=vaccination.application_date,
+                    next_due_date=vaccination.next_due_date,
+                )
+                for vaccination in latest.values()
+            ],
+            batch_size=batch_size,
+        )
+
+    return {"owners": len(owners), "pets": len(pets), "vaccinations": len(vaccinations)}
+
+
+def build_owner(rng: random.Random, number: int, options: dict):
+    User = get_user_model()
+    email = f"owner{number}@{options['email_domain']}"
+    return User(
+        username=email,
+        email=email,
+        password=options["password"],
+        full_name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        phone_number=f"+55-11-9{rng.randrange(10**7, 10**8)}",
+    )
+
+
+def build_pet(rng: random.Random, owner, today: date) -> Pet:
+    species = rng.choices([name for name, _ in SPECIES_WEIGHTS], weights=[weight for _, weight in SPECIES_WEIGHTS])[0]
+    low, high = WEIGHT_RANGES[species]
+    # Ages skew young: exponential with a mean of about four years, capped at twenty.
+    age_days = min(int(rng.expovariate(1 / (4 * 365))) + 30, 20 * 365)
+    return Pet(
+        name=rng.choice(PET_NAMES),
+        species=species,
+        breed=rng.choice(BREEDS[species]),
+        birth_date=today - timedelta(days=age_days),
+        weight=Decimal(f"{rng.uniform(low, high):.2f}"),
+        owner=owner,
+    )
+
+
+def build_history(
+    rng: random.Random,
+    pet: Pet,
+    vaccine_rows: list[tuple[int, int]],
+    mean_history: float,
+    today: date,
+) -> list[Vaccination]:
+    """
+    Periodic doses for a few vaccines, starting a couple of months after birth and drifting by a
+    few weeks per dose, the way real boosters are rarely applied exactly on the due date.
+    """
+    if not vaccine_rows:
+        return []
+    total = max(0, round(rng.gauss(mean_history, mean_history / 3)))
+    chosen = rng.sample(vaccine_rows, k=min(len(vaccine_rows), rng.randint(1, 4)))
+    doses = []
+    for position in range(total):
+        vaccine_id, periodicity = chosen[position % len(chosen)]
+        dose_number = position // len(chosen)
+        applied = pet.birth_date + timedelta(days=60 + dose_number * periodicity + rng.randint(-10, 30))
+        if applied > today:
+            continue
+        doses.append(
+            Vaccination(
+                pet=pet,
+                owner_id=pet.owner_id,
+                vaccine_id=vaccine_id,
+                application_date=applied,
+                next_due_date=applied + timedelta(days=periodicity),
+                notes=rng.choice(NOTES),
+                veterinarian_name=rng.choice(VETERINARIANS),
+            )
+        )
+    return doses
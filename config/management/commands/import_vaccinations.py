@@ -0,0 +1,105 @@
+import csv
+import json
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from vaccinations.importer import ImportFileError, VaccinationImporter
+from vaccinations.models import VaccinationImport
+
+
+class Command(BaseCommand):
+    help = (
+        "Import vaccinations from a CSV file (columns pet, vaccine, application_date and optionally "
+        "next_due_date, notes, veterinarian_name) in chunked bulk inserts. Rejected rows are written to an "
+        "error file, and an interrupted import can be resumed with --resume."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file to import.")
+        parser.add_argument("--owner", help="Email of the owner whose pets the rows must belong to.")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Rows per bulk_create transaction.")
+        parser.add_argument("--errors", help="Where to write rejected rows (defaults to <path>.errors.csv).")
+        parser.add_argument("--resume", type=int, help="Id of an interrupted import to continue.")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"File {path} does not exist.")
+
+        if options["resume"]:
+            try:
+                job = VaccinationImport.objects.get(pk=options["resume"])
+            except VaccinationImport.DoesNotExist:
+                raise CommandError(f"Import {options['resume']} does not exist.")
+            if job.status == "completed":
+                raise CommandError(f"Import {job.pk} already completed.")
+            self.stdout.write(f"Resuming import {job.pk} after row {job.rows_committed}.")
+        else:
+            job = VaccinationImport.objects.create(
+                owner=self.get_owner(options["owner"]), source=os.path.basename(path)
+            )
+            self.stdout.write(f"Started import {job.pk}; resume with --resume {job.pk} if interrupted.")
+
+        self.resumed_from = job.rows_committed
+        errors_path = options["errors"] or f"{path}.errors.csv"
+        with open(path, newline="", encoding="utf-8-sig") as source, open(errors_path, "a", newline="") as errors:
+            error_writer = ErrorFileWriter(errors)
+            importer = VaccinationImporter(
+                job,
+                chunk_size=options["chunk_size"],
+                on_rejected=error_writer.write,
+                on_chunk=self.report,
+            )
+            try:
+                importer.run(source)
+            except ImportFileError as exc:
+                if job.rows_committed == 0:
+                    job.delete()
+                raise CommandError(str(exc))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Import {job.pk} completed: {job.created_count} created, {job.rejected_count} rejected."
+            )
+        )
+        if job.rejected_count:
+            self.stdout.write(f"Rejected rows written to {errors_path}.")
+
+    def get_owner(self, email: str | None):
+        if not email:
+            return None
+        User = get_user_model()
+        try:
+            return User.objects.get(email=email)
+        except User.DoesNotExist:
+            raise CommandError(f"User {email} does not exist.")
+
+    def report(self, job: VaccinationImport, elapsed: float) -> None:
+        processed = job.rows_committed - self.resumed_from
+        self.stdout.write(
+            f"{job.rows_committed} rows committed, {job.created_count} created, {job.rejected_count} rejected "
+            f"({processed / elapsed:,.0f} rows/s)"
+        )
+
+
+class ErrorFileWriter:
+    """
+    Appends rejected rows to a CSV: their row number, the original columns and the validation errors.
+    The row and errors columns are ignored on import, so the file can be fixed and imported again.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.writer = None
+
+    def write(self, rejected: list[tuple[int, dict, dict]]) -> None:
+        if self.writer is None:
+            columns = [name for name in rejected[0][1] if name is not None]
+            self.writer = csv.DictWriter(self.file, ["row", *columns, "errors"], extrasaction="ignore")
+            if self.file.tell() == 0:
+                self.writer.writeheader()
+        for number, row, errors in rejected:
+            self.writer.writerow({**row, "row": number, "errors": json.dumps(errors)})
+        self.file.flush()
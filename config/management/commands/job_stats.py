@@ -0,0 +1,52 @@
+import argparse
+import json
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobs.models import STATS_MAX_HOURS, Job
+
+
+def hours(value: str) -> float:
+    """
+    `--hours` value: a number of hours between 0 and STATS_MAX_HOURS (NaN fails both comparisons).
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a number.")
+    if not 0 <= number <= STATS_MAX_HOURS:
+        raise argparse.ArgumentTypeError(f"must be between 0 and {STATS_MAX_HOURS}.")
+    return number
+
+
+class Command(BaseCommand):
+    help = (
+        "Show the background job queue and throughput per job name: jobs queued, running and failed, the "
+        "queue lag, and for the jobs finished in the window their count, average duration and summed metrics "
+        "per second of run time (e.g. reminder items/s). Also served to staff at /api/jobs/stats/."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hours", type=hours, default=24, help="Window for finished jobs, in hours.")
+        parser.add_argument("--json", action="store_true", help="Print the stats as JSON.")
+
+    def handle(self, *args, **options):
+        stats = Job.objects.stats(timezone.now() - timedelta(hours=options["hours"]))
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, indent=2, default=str))
+            return
+        if not stats:
+            self.stdout.write("No jobs.")
+        for row in stats:
+            self.stdout.write(self.style.MIGRATE_HEADING(row["name"]))
+            self.stdout.write(
+                f"  queued {row['queued']}  running {row['running']}  failed {row['failed']}  "
+                f"lag {row['queue_lag_seconds']}s  succeeded {row['succeeded']} in {options['hours']:g}h  "
+                f"avg {row['average_seconds'] or 0}s"
+            )
+            for key, value in row["totals"].items():
+                rate = row["per_second"].get(key)
+                value = f"{value:,}" if isinstance(value, int) else f"{value:,.3f}"
+                self.stdout.write(f"  {key:<12} {value:>14}" + (f"  ({rate:,.1f}/s)" if rate is not None else ""))
@@ -0,0 +1,41 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from vaccinations.partitioning import VaccinationPartitioner
+
+
+class Command(BaseCommand):
+    help = (
+        "Range-partition the vaccinations table by application_date, one partition per year (PostgreSQL). The "
+        "first run converts the table in one transaction holding an exclusive lock; later runs (and the weekly "
+        "vaccinations.add_partitions job) create the partitions missing up to --ahead years from now."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ahead", type=int, default=1, help="Years after the current one to add partitions for.")
+        parser.add_argument(
+            "--from-year",
+            type=int,
+            help="First yearly partition when converting (defaults to the year of the oldest vaccination).",
+        )
+
+    def handle(self, *args, **options):
+        partitioner = VaccinationPartitioner()
+        if not partitioner.is_supported():
+            raise CommandError("Range partitioning needs PostgreSQL.")
+        last_year = date.today().year + options["ahead"]
+
+        if partitioner.is_partitioned():
+            created = partitioner.add_partitions(range(date.today().year, last_year + 1))
+            self.stdout.write(f"Created {', '.join(created)}." if created else "No partition missing.")
+        else:
+            first_year = options["from_year"] or (partitioner.get_year_range() or (date.today().year,))[0]
+            started = time.perf_counter()
+            self.stdout.write(f"Converting {partitioner.table} with partitions for {first_year}-{last_year}...")
+            partitioner.convert(range(first_year, last_year + 1))
+            self.stdout.write(f"Converted in {time.perf_counter() - started:.1f}s.")
+
+        partitions = partitioner.get_partitions()
+        self.stdout.write(self.style.SUCCESS(f"{partitioner.table} has {len(partitions)} partitions."))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from config.response_cache import invalidate_all
+from vaccinations.models import VaccinationStatus
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-(pet, vaccine) vaccination status table from the vaccination history."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of pets processed per batch.")
+
+    def handle(self, *args, **options):
+        total = VaccinationStatus.objects.rebuild(batch_size=options["batch_size"])
+        invalidate_all()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} vaccination statuses."))
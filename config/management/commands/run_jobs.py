@@ -0,0 +1,46 @@
+import multiprocessing
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background job workers: each process claims due jobs from the database queue and runs them "
+        "until stopped (SIGTERM/SIGINT finish the current job first)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=1, help="Worker processes to run.")
+        parser.add_argument("--burst", action="store_true", help="Exit once no job is due.")
+        parser.add_argument("--max-jobs", type=int, help="Exit after running this many jobs (per process).")
+        parser.add_argument("--poll-interval", type=float, help="Seconds between polls of an empty queue.")
+
+    def handle(self, *args, **options):
+        if options["processes"] <= 1:
+            processed = self.run_worker(options)
+            self.stdout.write(self.style.SUCCESS(f"Worker stopped after {processed} job(s)."))
+            return
+
+        # Forked workers must open their own database connections.
+        connections.close_all()
+        processes = [
+            multiprocessing.Process(target=self.run_worker, args=(options,)) for _ in range(options["processes"])
+        ]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+                process.join()
+        self.stdout.write(self.style.SUCCESS(f"{len(processes)} workers stopped."))
+
+    @staticmethod
+    def run_worker(options: dict) -> int:
+        worker = Worker(poll_interval=options["poll_interval"])
+        return worker.run(burst=options["burst"], max_jobs=options["max_jobs"])
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from jobs.registry import schedules
+from jobs.worker import Scheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Enqueue the periodic background jobs (e.g. the daily vaccination reminders) as their periods start. "
+        "Each period is enqueued once, so more than one scheduler may run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--interval", type=float, default=30, help="Seconds between checks.")
+        parser.add_argument("--once", action="store_true", help="Enqueue the current periods and exit.")
+
+    def handle(self, *args, **options):
+        for entry in schedules:
+            self.stdout.write(f"{entry.name}: every {entry.every}, from {entry.anchor:%H:%M} UTC")
+        Scheduler(interval=options["interval"]).run(once=options["once"])
@@ -0,0 +1,243 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from types import SimpleNamespace
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.paginator import InvalidPage
+from django.db.models import F, Q
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+MAX_PAGE_SIZE = 100
+
+
+class PageNumberPagination(pagination.PageNumberPagination):
+    """
+    Default page-number pagination that lets clients opt in to larger pages with `?page_size=`.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = MAX_PAGE_SIZE
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        `paginate_queryset` for async views: the count and the page are read with the async ORM.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator.count is a cached property; filling it first lets page() validate the number
+        # without a synchronous COUNT query.
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+
+        self.page.object_list = [row async for row in self.page.object_list]
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return list(self.page)
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Keyset (cursor) pagination over `(ordering field, pk)`.
+
+    Each page is fetched with a `WHERE key > cursor ... LIMIT n` query instead of OFFSET, and no
+    COUNT query is issued, so the cost per page stays constant however deep the client walks.
+    The ordering follows the view's OrderingFilter (first term only), with the primary key as
+    tie-breaker so rows sharing a value are neither skipped nor repeated. NULLs always sort last.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    max_page_size = MAX_PAGE_SIZE
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        rows = list(self.get_page_queryset(queryset, request, view))
+        return self.set_page(rows)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        rows = [row async for row in self.get_page_queryset(queryset, request, view)]
+        return self.set_page(rows)
+
+    def get_page_queryset(self, queryset, request, view):
+        """
+        The page query: one row more than the page size, to know whether there is a further page.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.order_term = self.get_order_term(request, queryset, view)
+        self.descending = self.order_term.startswith("-")
+        self.field_name = self.order_term.lstrip("-")
+        opts = queryset.model._meta
+        self.field = opts.pk if self.field_name == "pk" else opts.get_field(self.field_name)
+
+        self.cursor = self.decode_cursor(request)
+        self.reverse = bool(self.cursor and self.cursor["r"])
+
+        if self.cursor is not None:
+            queryset = queryset.filter(self.build_seek_filter(self.cursor["v"], self.cursor["pk"], self.reverse))
+        return queryset.order_by(*self.build_ordering(self.reverse))[: self.page_size + 1]
+
+    def set_page(self, rows: list) -> list:
+        has_more = len(rows) > self.page_size
+        page = rows[: self.page_size]
+        if self.reverse:
+            page.reverse()
+
+        if self.reverse:
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+        self.page = page
+        return page
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return api_settings.PAGE_SIZE
+        if page_size <= 0:
+            return api_settings.PAGE_SIZE
+        return min(page_size, self.max_page_size)
+
+    def get_order_term(self, request, queryset, view) -> str:
+        ordering = None
+        for backend in getattr(view, "filter_backends", []):
+            if hasattr(backend, "get_ordering"):
+                ordering = backend().get_ordering(request, queryset, view)
+                break
+        ordering = ordering or queryset.query.order_by or ("-pk",)
+        term = ordering[0]
+        if "__" in term or term.lstrip("-") == "pk":
+            return "-pk" if term.startswith("-") else "pk"
+        if term.lstrip("-") in queryset.query.annotations:
+            # E.g. the search rank: not a column a cursor can seek on.
+            return "-pk"
+        return term
+
+    def build_ordering(self, reverse: bool):
+        descending = self.descending != reverse
+        pk_term = "-pk" if descending else "pk"
+        if self.field_name == "pk":
+            return [pk_term]
+        if not self.field.null:
+            return [f"-{self.field_name}" if descending else self.field_name, pk_term]
+        nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+        expression = F(self.field_name)
+        return [expression.desc(**nulls) if descending else expression.asc(**nulls), pk_term]
+
+    def build_seek_filter(self, value, pk, reverse: bool) -> Q:
+        """
+        Rows strictly after (or before, when paging backwards) the `(value, pk)` key.
+        """
+        if self.field_name == "pk":
+            value = pk
+        descending = self.descending != reverse
+        after = "lt" if descending else "gt"
+        pk_after = Q(**{f"pk__{after}": pk})
+
+        if value is None:
+            # NULLs sort last going forwards and first going backwards.
+            nulls = Q(**{f"{self.field_name}__isnull": True}) & pk_after
+            return nulls if not reverse else nulls | Q(**{f"{self.field_name}__isnull": False})
+
+        seek = Q(**{f"{self.field_name}__{after}": value}) | (Q(**{self.field_name: value}) & pk_after)
+        if self.field.null and not reverse:
+            seek |= Q(**{f"{self.field_name}__isnull": True})
+        return seek
+
+    def get_key(self, instance) -> tuple:
+        if isinstance(instance, dict):
+            # A `.values()` row (see config.serialization); it carries "pk" and the ordering column.
+            instance = SimpleNamespace(**instance)
+        if self.field_name == "pk":
+            return None, instance.pk
+        value = getattr(instance, self.field.attname)
+        return (None if value is None else self.field.value_to_string(instance)), instance.pk
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            if cursor["o"] != self.order_term:
+                raise ValueError("cursor was issued for a different ordering")
+            cursor["pk"] = int(cursor["pk"])
+            cursor["r"] = bool(cursor.get("r"))
+            if cursor.get("v") is not None:
+                cursor["v"] = self.field.to_python(cursor["v"])
+            else:
+                cursor["v"] = None
+        except (BinasciiError, KeyError, TypeError, ValueError, UnicodeEncodeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def encode_cursor(self, instance, reverse: bool) -> str:
+        value, pk = self.get_key(instance)
+        payload = json.dumps({"o": self.order_term, "v": value, "pk": pk, "r": int(reverse)}, separators=(",", ":"))
+        encoded = urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+
+class OptionalKeysetPagination(pagination.BasePagination):
+    """
+    Page-number pagination by default; switches to keyset pagination when the client sends
+    `?pagination=cursor` (or follows a `cursor` link), so existing clients keep working.
+    """
+
+    mode_query_param = "pagination"
+    cursor_mode = "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.paginator = self.get_paginator(request)
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.paginator = self.get_paginator(request)
+        return await self.paginator.apaginate_queryset(queryset, request, view)
+
+    def get_paginator(self, request) -> pagination.BasePagination:
+        if (
+            request.query_params.get(self.mode_query_param) == self.cursor_mode
+            or KeysetPagination.cursor_query_param in request.query_params
+        ):
+            return KeysetPagination()
+        return PageNumberPagination()
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
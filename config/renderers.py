@@ -0,0 +1,51 @@
+import orjson
+from django.conf import settings
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.utils.encoders import JSONEncoder
+
+# datetimes go through DRF's encoder, which truncates them to milliseconds and writes UTC as "Z"; dict keys
+# may be ints, as with the json module.
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    `JSONRenderer` encoding with orjson, which builds the bytes in one pass in C: 3-4 times faster
+    on list pages (see `benchmark_rendering`). The output is the same compact JSON (UUIDs, subclasses
+    of dict, list and str included); values orjson does not know (datetimes, dates, Decimals, lazy
+    strings, querysets) are handed to DRF's `JSONEncoder.default`, so they render as before.
+
+    Indented output (`; indent=` or the browsable API) uses `JSONRenderer`.
+    """
+
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        content = orjson.dumps(data, default=self.encoder.default, option=ORJSON_OPTIONS)
+        # As JSONRenderer: keep the output a strict JavaScript subset.
+        if b"\xe2\x80\xa8" in content or b"\xe2\x80\xa9" in content:
+            content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return content
+
+
+class ORJSONParser(JSONParser):
+    """
+    `JSONParser` decoding UTF-8 bodies with orjson.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
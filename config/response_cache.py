@@ -0,0 +1,181 @@
+import hashlib
+import time
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from config.db_routers import read_from_replica
+from vaccines import catalogue
+
+GLOBAL_VERSION_KEY = "responses:version"
+HEADER = "X-Response-Cache"
+
+
+def get_cache():
+    return caches[settings.RESPONSE_CACHE]
+
+
+def owner_version_key(owner_id) -> str:
+    return f"responses:owner:{owner_id}:version"
+
+
+def stats_key(endpoint: str, outcome: str) -> str:
+    return f"responses:stats:{endpoint}:{outcome}"
+
+
+def get_versions(owner_id) -> tuple[int, int]:
+    """
+    (global version, owner version), nanosecond timestamps of the last invalidation (or of the first read).
+    """
+    cache = get_cache()
+    keys = [GLOBAL_VERSION_KEY, owner_version_key(owner_id)]
+    versions = cache.get_many(keys)
+    if len(versions) < len(keys):
+        for key in keys:
+            if key not in versions:
+                cache.add(key, time.time_ns(), timeout=None)
+        versions = cache.get_many(keys)
+    return versions[keys[0]], versions[keys[1]]
+
+
+def _bump(keys: list[str]) -> None:
+    version = time.time_ns()
+    get_cache().set_many(dict.fromkeys(keys, version), timeout=None)
+
+
+def _invalidate(keys: list[str]) -> None:
+    """
+    Start new versions of `keys`, so no response cached under the old ones is served again; they expire
+    after `RESPONSE_CACHE_TIMEOUT`. As for the vaccine catalogue, the versions are bumped again on commit,
+    so a response another request cached before the write became visible is not served afterwards.
+    """
+    if not settings.RESPONSE_CACHE or not keys:
+        return
+    _bump(keys)
+    transaction.on_commit(lambda: _bump(keys))
+
+
+def invalidate_owners(*owner_ids) -> None:
+    """
+    Drop the cached pet and vaccination responses of these owners: called whenever their pets or
+    vaccinations are written.
+    """
+    _invalidate([owner_version_key(owner_id) for owner_id in set(owner_ids) - {None}])
+
+
+def invalidate_all() -> None:
+    """
+    Drop every owner's cached responses, for writes that span owners (backfills, rebuilds, generated data).
+    """
+    _invalidate([GLOBAL_VERSION_KEY])
+
+
+def count(endpoint: str, outcome: str) -> None:
+    cache = get_cache()
+    key = stats_key(endpoint, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_stats(endpoints) -> dict[str, dict[str, int]]:
+    """
+    Hits and misses counted for each endpoint since the counters were created.
+    """
+    keys = {(endpoint, outcome): stats_key(endpoint, outcome) for endpoint in endpoints for outcome in ("hit", "miss")}
+    values = get_cache().get_many(keys.values())
+    stats = {endpoint: {"hit": 0, "miss": 0} for endpoint in endpoints}
+    for (endpoint, outcome), key in keys.items():
+        stats[endpoint][outcome] = values.get(key, 0)
+    return stats
+
+
+class OwnerResponseCacheMixin:
+    """
+    Caches the data of successful `list` and `retrieve` responses (and their async versions) per owner,
+    in the `RESPONSE_CACHE` cache.
+
+    The key holds the endpoint, the requesting user (whose objects the querysets are limited to), the
+    URL with its query parameters in sorted order, and the versions the data depends on: the owner's and
+    the global one (see `invalidate_owners` and `invalidate_all`), the vaccine catalogue's (vaccine names
+    and periodicities) and today's date (upcoming and overdue values). A write never deletes keys; it
+    starts a new version, and the old entries are no longer looked up.
+
+    Responses built from replica reads (see `config.db_routers`) are not stored: a replica may not
+    have the write that started the current version yet, and the stale page would be served until it
+    expires. Stored responses come from the primary and may be served to any request.
+
+    Responses carry `X-Response-Cache: hit` or `miss`; hits and misses are counted per endpoint.
+    """
+
+    response_cache_actions = ("list", "retrieve")
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, super().retrieve, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.acached_response(request, super().alist, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.acached_response(request, super().aretrieve, *args, **kwargs)
+
+    def cached_response(self, request, handler, *args, **kwargs):
+        key = self.get_response_cache_key(request)
+        if key is None:
+            return handler(request, *args, **kwargs)
+        response = self.get_cached_response(key)
+        if response is None:
+            response = self.store_response(key, handler(request, *args, **kwargs))
+        return response
+
+    async def acached_response(self, request, handler, *args, **kwargs):
+        key = self.get_response_cache_key(request)
+        if key is None:
+            return await handler(request, *args, **kwargs)
+        response = self.get_cached_response(key)
+        if response is None:
+            response = self.store_response(key, await handler(request, *args, **kwargs))
+        return response
+
+    @property
+    def response_cache_endpoint(self) -> str:
+        return f"{self.basename}-{self.action}"
+
+    def get_response_cache_key(self, request) -> str | None:
+        if not settings.RESPONSE_CACHE or self.action not in self.response_cache_actions:
+            return None
+        owner_id = request.user.pk
+        if owner_id is None:
+            return None
+        global_version, owner_version = get_versions(owner_id)
+        params = sorted((name, value) for name, values in request.query_params.lists() for value in values)
+        # The scheme and host are part of the pagination links.
+        url = hashlib.md5(repr((request.build_absolute_uri(request.path), params)).encode()).hexdigest()
+        return (
+            f"responses:{self.response_cache_endpoint}:{owner_id}:{global_version}:{owner_version}:"
+            f"{catalogue.get_version()}:{date.today().isoformat()}:{url}"
+        )
+
+    def get_cached_response(self, key: str) -> Response | None:
+        data = get_cache().get(key)
+        if data is None:
+            return None
+        count(self.response_cache_endpoint, "hit")
+        return Response(data, headers={HEADER: "hit"})
+
+    def store_response(self, key: str, response: Response) -> Response:
+        if response.status_code == status.HTTP_200_OK:
+            if not read_from_replica():
+                get_cache().set(key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+            count(self.response_cache_endpoint, "miss")
+            response[HEADER] = "miss"
+        return response
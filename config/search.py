@@ -0,0 +1,178 @@
+import re
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.migrations.operations.base import Operation
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+# Words of a search query; each must start a word of the indexed text.
+WORD = re.compile(r"\w+")
+MAX_SEARCH_WORDS = 8
+
+
+def get_search_words(terms: list[str]) -> list[str]:
+    words = [word.lower() for term in terms for word in WORD.findall(term)]
+    return list(dict.fromkeys(words))[:MAX_SEARCH_WORDS]
+
+
+class FullTextIndex:
+    """
+    Full-text index over text columns of a model, for `FullTextSearchFilter`.
+
+    On PostgreSQL it is a GIN index on `to_tsvector('simple', ...)` of the columns; on SQLite an
+    external-content FTS5 table named `name`, kept in sync with the model's table by triggers. Both
+    match words by prefix, without stemming or accent folding, and rank matches (`ts_rank`, BM25).
+    It is created by the `CreateFullTextIndex` migration operation.
+    """
+
+    config = "simple"
+
+    def __init__(self, name: str, fields: list[str]):
+        self.name = name
+        self.fields = fields
+
+    def get_vector(self) -> SearchVector:
+        return SearchVector(*self.fields, config=self.config)
+
+    def search(self, queryset, words: list[str]):
+        """
+        Filter `queryset` to the rows matching every word and annotate their `search_rank` (higher
+        is better), or return None on databases without a full-text index.
+        """
+        vendor = connections[queryset.db].vendor
+        if vendor == "postgresql":
+            query = SearchQuery(" & ".join(f"{word}:*" for word in words), config=self.config, search_type="raw")
+            vector = self.get_vector()
+            return queryset.alias(search_document=vector).filter(search_document=query).annotate(
+                search_rank=SearchRank(vector, query)
+            )
+        if vendor == "sqlite":
+            match = " ".join(f'"{word}"*' for word in words)
+            opts = queryset.model._meta
+            return queryset.filter(
+                pk__in=RawSQL(f'SELECT rowid FROM "{self.name}" WHERE "{self.name}" MATCH %s', [match])
+            ).annotate(
+                # FTS5's rank is BM25 negated: lower is better.
+                search_rank=RawSQL(
+                    f'SELECT -rank FROM "{self.name}" WHERE "{self.name}" MATCH %s '
+                    f'AND rowid = "{opts.db_table}"."{opts.pk.column}"',
+                    [match],
+                    output_field=FloatField(),
+                )
+            )
+        return None
+
+    def create_sql(self, model, schema_editor) -> list[str]:
+        vendor = schema_editor.connection.vendor
+        if vendor == "postgresql":
+            return [str(GinIndex(self.get_vector(), name=self.name).create_sql(model, schema_editor))]
+        if vendor != "sqlite":
+            return []
+        table, pk = model._meta.db_table, model._meta.pk.column
+        columns = [model._meta.get_field(name).column for name in self.fields]
+        names = ", ".join(f'"{column}"' for column in columns)
+        new = ", ".join(f'new."{column}"' for column in columns)
+        old = ", ".join(f'old."{column}"' for column in columns)
+        fts = self.name
+        return [
+            f"CREATE VIRTUAL TABLE \"{fts}\" USING fts5({names}, content='{table}', content_rowid='{pk}', "
+            "tokenize='unicode61 remove_diacritics 0', prefix='2 3')",
+            f"INSERT INTO \"{fts}\"(\"{fts}\") VALUES ('rebuild')",
+            f'CREATE TRIGGER "{fts}_insert" AFTER INSERT ON "{table}" BEGIN '
+            f'INSERT INTO "{fts}"(rowid, {names}) VALUES (new."{pk}", {new}); END',
+            f'CREATE TRIGGER "{fts}_delete" AFTER DELETE ON "{table}" BEGIN '
+            f'INSERT INTO "{fts}"("{fts}", rowid, {names}) VALUES (\'delete\', old."{pk}", {old}); END',
+            f'CREATE TRIGGER "{fts}_update" AFTER UPDATE OF {names} ON "{table}" BEGIN '
+            f'INSERT INTO "{fts}"("{fts}", rowid, {names}) VALUES (\'delete\', old."{pk}", {old}); '
+            f'INSERT INTO "{fts}"(rowid, {names}) VALUES (new."{pk}", {new}); END',
+        ]
+
+    def drop_sql(self, model, schema_editor) -> list[str]:
+        vendor = schema_editor.connection.vendor
+        if vendor == "postgresql":
+            return [str(GinIndex(self.get_vector(), name=self.name).remove_sql(model, schema_editor))]
+        if vendor != "sqlite":
+            return []
+        return [
+            *(f'DROP TRIGGER IF EXISTS "{self.name}_{event}"' for event in ("insert", "delete", "update")),
+            f'DROP TABLE IF EXISTS "{self.name}"',
+        ]
+
+
+class CreateFullTextIndex(Operation):
+    """
+    Migration operation creating a model's `FullTextIndex` (nothing on other databases).
+
+    SQLite's triggers belong to the table: a later migration that makes Django rebuild the table on
+    SQLite (most column changes) drops them, so it must drop and create the index again.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name: str, name: str, fields: list[str]):
+        self.model_name = model_name
+        self.name = name
+        self.fields = fields
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            for sql in FullTextIndex(self.name, self.fields).create_sql(model, schema_editor):
+                schema_editor.execute(sql, params=None)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            for sql in FullTextIndex(self.name, self.fields).drop_sql(model, schema_editor):
+                schema_editor.execute(sql, params=None)
+
+    def describe(self):
+        return f"Create full-text index {self.name} on {self.model_name} ({', '.join(self.fields)})"
+
+    @property
+    def migration_name_fragment(self):
+        return f"{self.model_name.lower()}_{self.name.lower()}"
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    `?search=` through the model's `search_index` (a `FullTextIndex`): every word of the query must
+    start a word of the indexed fields, e.g. `?search=lab ret` finds "Labrador Retriever". Without an
+    `ordering` parameter, results are ordered by relevance (`search_rank`), then the usual ordering.
+
+    Models without a full-text index, and other databases, fall back to `SearchFilter`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        index = getattr(queryset.model, "search_index", None)
+        words = get_search_words(self.get_search_terms(request))
+        if index is None or not words:
+            return super().filter_queryset(request, queryset, view)
+        results = index.search(queryset, words)
+        if results is None:
+            return super().filter_queryset(request, queryset, view)
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            results = results.order_by("-search_rank", *queryset.query.order_by)
+        return results
+
+
+def rank_text_match(values: list[str], words: list[str]) -> float | None:
+    """
+    In-memory counterpart of the full-text match, for rows that are not queried from the database:
+    None unless every word starts a word of `values`; otherwise a rank favouring whole-word matches.
+    """
+    text_words = [word.lower() for value in values for word in WORD.findall(value or "")]
+    rank = 0.0
+    for word in words:
+        matches = [text_word for text_word in text_words if text_word.startswith(word)]
+        if not matches:
+            return None
+        rank += 1 + sum(0.5 for text_word in matches if text_word == word)
+    return rank
@@ -0,0 +1,237 @@
+from datetime import date, datetime
+from functools import cache, lru_cache, partial
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.utils.timezone import is_naive, make_aware
+from rest_framework import ISO_8601, serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# Fields whose representation of a database value is the value itself.
+IDENTITY_FIELDS = (serializers.CharField, serializers.EmailField, serializers.IntegerField, serializers.ChoiceField)
+
+
+class ValuesRepresentation:
+    """
+    Read-only counterpart of a `ModelSerializer` that renders `.values()` rows.
+
+    The serializer's fields are compiled once into `(output name, value key, converter)` extractors:
+    plain columns are copied, primary key related fields read the `<name>_id` column, ISO 8601 dates
+    and datetimes are formatted directly (resolving the timezone once per batch rather than per row),
+    and other fields reuse the bound `to_representation` of the serializer's own field. The output is
+    the same JSON without building a model instance and field tree per row.
+
+    `fields` and `expand` mirror `DynamicFieldsSerializerMixin`: expanded fields are rendered by a
+    nested representation reading the related columns (`pet__name`, ...) joined into the same rows.
+    """
+
+    def __init__(
+        self,
+        serializer_class: type[serializers.ModelSerializer],
+        fields: tuple[str, ...] | None = None,
+        expand: tuple[str, ...] = (),
+        prefix: str = "",
+    ):
+        self.serializer_class = serializer_class
+        self.prefix = prefix
+        model = serializer_class.Meta.model
+        self.null_key = prefix + model._meta.pk.attname
+        self.extractors = []
+        for name, field in serializer_class().fields.items():
+            if field.write_only or (fields is not None and name not in fields):
+                continue
+            if name in expand:
+                nested = ValuesRepresentation(
+                    serializer_class.expandable_fields[name], prefix=f"{prefix}{field.source}__"
+                )
+                self.extractors.append((name, None, nested))
+            else:
+                self.extractors.append((name, self.get_value_key(model, name, field), self.get_converter(name, field)))
+        self.value_names = list(
+            dict.fromkeys(
+                value_name
+                for _, key, converter in self.extractors
+                for value_name in (converter.value_names if key is None else [key])
+            )
+        )
+
+    def get_value_key(self, model, name: str, field) -> str:
+        try:
+            return self.prefix + model._meta.get_field(field.source).attname
+        except FieldDoesNotExist:
+            if field.read_only and not self.prefix and field.source.isidentifier():
+                # A declared read-only field over a queryset annotation of that name.
+                return field.source
+            raise ImproperlyConfigured(
+                f"{self.serializer_class.__name__}.{name} does not map to a model column (source '{field.source}')."
+            )
+
+    def get_converter(self, name: str, field):
+        """
+        How to render a value of `field`: None to use it as is, a callable, or a `DateTimeConverter`.
+        """
+        if type(field) in IDENTITY_FIELDS:
+            return None
+        if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+            return None
+        if isinstance(field, (serializers.RelatedField, serializers.ManyRelatedField, serializers.BaseSerializer)):
+            raise ImproperlyConfigured(f"{self.serializer_class.__name__}.{name} cannot be rendered from a column.")
+        if type(field) is serializers.DateTimeField and is_iso_8601(field, api_settings.DATETIME_FORMAT):
+            return DateTimeConverter(field) if settings.USE_TZ else field.to_representation
+        if type(field) is serializers.DateField and is_iso_8601(field, api_settings.DATE_FORMAT):
+            return date.isoformat
+        return field.to_representation
+
+    def get_converters(self) -> list:
+        return [self.bind(converter) for _, _, converter in self.extractors]
+
+    @staticmethod
+    def bind(converter):
+        if isinstance(converter, DateTimeConverter):
+            return converter.bind()
+        if isinstance(converter, ValuesRepresentation):
+            return partial(converter.to_nested_representation, converters=converter.get_converters())
+        return converter
+
+    def to_representation(self, row: dict, converters: list | None = None) -> dict:
+        data = {}
+        for (name, key, _), convert in zip(self.extractors, converters or self.get_converters()):
+            # Expanded fields (no key) are rendered from the whole row.
+            value = row if key is None else row[key]
+            # Like Serializer.to_representation, None is never passed to the field.
+            data[name] = value if convert is None or value is None else convert(value)
+        return data
+
+    def to_nested_representation(self, row: dict, converters: list) -> dict | None:
+        return None if row[self.null_key] is None else self.to_representation(row, converters)
+
+    def many(self, rows) -> list[dict]:
+        converters = self.get_converters()
+        return [self.to_representation(row, converters) for row in rows]
+
+
+class DateTimeConverter:
+    """
+    `DateTimeField.to_representation` for ISO 8601 output, with the field's timezone resolved once per
+    batch by `bind()` instead of once per value.
+    """
+
+    def __init__(self, field: serializers.DateTimeField):
+        self.field = field
+
+    def bind(self):
+        timezone = self.field.timezone if hasattr(self.field, "timezone") else self.field.default_timezone()
+        return partial(format_datetime, timezone=timezone)
+
+
+def is_iso_8601(field, default_format) -> bool:
+    output_format = getattr(field, "format", default_format)
+    return isinstance(output_format, str) and output_format.lower() == ISO_8601
+
+
+def format_datetime(value: datetime, timezone) -> str:
+    if is_naive(value):
+        value = make_aware(value, timezone)
+    value = value.astimezone(timezone).isoformat()
+    return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+
+@lru_cache(maxsize=256)
+def get_values_representation(
+    serializer_class, fields: tuple[str, ...] | None = None, expand: tuple[str, ...] = ()
+) -> ValuesRepresentation:
+    return ValuesRepresentation(serializer_class, fields=fields, expand=expand)
+
+
+@cache
+def get_field_names(serializer_class) -> frozenset[str]:
+    return frozenset(serializer_class().fields)
+
+
+class DynamicFieldsSerializerMixin:
+    """
+    Read options for a `ModelSerializer`: `fields` keeps only the named fields and `expand` replaces
+    the primary key fields named in `expandable_fields` with the nested serializer, which renders the
+    objects the queryset already joins with `select_related`.
+    """
+
+    expandable_fields: dict[str, type[serializers.Serializer]] = {}
+
+    def __init__(self, *args, fields: tuple[str, ...] | None = None, expand: tuple[str, ...] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        for name in expand:
+            self.fields[name] = self.expandable_fields[name](read_only=True)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class DynamicFieldsViewMixin:
+    """
+    Reads `?fields=a,b` and `?expand=x,y` for the list and retrieve actions and passes them to a
+    serializer using `DynamicFieldsSerializerMixin` (and to the lean list representation).
+    """
+
+    fields_query_param = "fields"
+    expand_query_param = "expand"
+    dynamic_fields_actions = ("list", "retrieve")
+
+    def get_serializer(self, *args, **kwargs):
+        if self.action in self.dynamic_fields_actions:
+            kwargs.update(self.get_field_options())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_field_options(self) -> dict:
+        serializer_class = self.get_serializer_class()
+        expandable = getattr(serializer_class, "expandable_fields", {})
+        expand = self.split_param(self.expand_query_param)
+        unknown = [name for name in expand if name not in expandable]
+        if unknown:
+            choices = f"Choose from: {', '.join(expandable)}." if expandable else "Nothing can be expanded here."
+            raise ValidationError({self.expand_query_param: [f"Cannot expand {', '.join(unknown)}. {choices}"]})
+
+        fields = self.split_param(self.fields_query_param)
+        unknown = [name for name in fields if name not in get_field_names(serializer_class)]
+        if unknown:
+            raise ValidationError({self.fields_query_param: [f"Unknown field(s): {', '.join(unknown)}."]})
+        return {"fields": fields or None, "expand": expand}
+
+    def split_param(self, name: str) -> tuple[str, ...]:
+        # Sorted, so equivalent requests share a cached representation.
+        value = self.request.query_params.get(name, "")
+        return tuple(sorted({part.strip() for part in value.split(",") if part.strip()}))
+
+
+class ValuesListMixin:
+    """
+    Serves the list action from `.values()` rows through a `ValuesRepresentation` of the view's
+    serializer class, unless `LEAN_LIST_SERIALIZATION` is off. Filtering, ordering and pagination
+    are unchanged; other actions use the serializer as usual.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if not settings.LEAN_LIST_SERIALIZATION:
+            return super().list(request, *args, **kwargs)
+
+        representation = self.get_values_representation()
+        queryset = self.get_values_queryset(representation)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(representation.many(page))
+        return Response(representation.many(queryset))
+
+    def get_values_representation(self) -> ValuesRepresentation:
+        options = self.get_field_options() if isinstance(self, DynamicFieldsViewMixin) else {}
+        return get_values_representation(self.get_serializer_class(), **options)
+
+    def get_values_queryset(self, representation: ValuesRepresentation):
+        """
+        The filtered queryset as `.values()` rows holding the columns `representation` reads.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        # The keyset paginator reads the primary key and the ordering column from the rows.
+        model = queryset.model
+        ordering_names = [model._meta.get_field(name).attname for name in getattr(self, "ordering_fields", None) or []]
+        return queryset.values(*dict.fromkeys(["pk", *representation.value_names, *ordering_names]))
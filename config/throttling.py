@@ -0,0 +1,165 @@
+import math
+import threading
+import time
+from functools import cache, lru_cache
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+@lru_cache(maxsize=None)
+def parse_rate(rate: str | None) -> tuple[float, float] | None:
+    """
+    `"<requests>/<period>"` as in DRF (e.g. "20/min") to (bucket capacity, tokens refilled per second):
+    a client may burst the period's requests at once, then gets one every period/requests seconds.
+    """
+    if not rate or rate.lower() == "none":
+        return None
+    count, period = rate.split("/")
+    return float(count), int(count) / PERIODS[period[0]]
+
+
+class LocalBucketStore:
+    """
+    Token buckets in a dict of this process: (tokens, time of last update, time it will be full).
+    Buckets that have refilled are dropped when the dict reaches `max_keys`.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.buckets: dict[str, tuple[float, float, float]] = {}
+        self.max_keys = max_keys
+        self.lock = threading.Lock()
+
+    def consume(self, key: str, capacity: float, refill: float, now: float) -> float:
+        with self.lock:
+            bucket = self.buckets.get(key)
+            tokens = capacity if bucket is None else min(capacity, bucket[0] + (now - bucket[1]) * refill)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / refill
+            if not wait:
+                tokens -= 1
+            if bucket is None and len(self.buckets) >= self.max_keys:
+                self.buckets = {name: state for name, state in self.buckets.items() if state[2] > now}
+            self.buckets[key] = (tokens, now, now + (capacity - tokens) / refill)
+            return wait
+
+
+class CacheBucketStore:
+    """
+    Token buckets in a Django cache, shared by the processes using it. The read and the write are
+    not atomic, so concurrent requests of one client may both take the last token, as with DRF's
+    cache-based throttles.
+    """
+
+    def __init__(self, alias: str):
+        self.cache = caches[alias]
+
+    def consume(self, key: str, capacity: float, refill: float, now: float) -> float:
+        bucket = self.cache.get(key)
+        tokens = capacity if bucket is None else min(capacity, bucket[0] + (now - bucket[1]) * refill)
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / refill
+        if not wait:
+            tokens -= 1
+        # Kept until the bucket is full again, when a missing key means the same.
+        self.cache.set(key, (tokens, now), math.ceil((capacity - tokens) / refill) + 1)
+        return wait
+
+
+def unreached_rates() -> dict[str, str]:
+    """
+    `THROTTLE_RATES` with rates no benchmark reaches, for benchmarks that send every request as one
+    client: the throttles still run.
+    """
+    return dict.fromkeys(settings.THROTTLE_RATES, "1000000/s")
+
+
+@cache
+def get_store() -> LocalBucketStore | CacheBucketStore:
+    return CacheBucketStore(settings.THROTTLE_CACHE) if settings.THROTTLE_CACHE else LocalBucketStore()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Throttle with a token bucket per client of `scope`, whose rate is `THROTTLE_RATES[scope]`; scopes
+    without a rate are not throttled. Subclasses pick the client with `get_client_key`, or None to
+    leave the request to other throttles.
+
+    Buckets live in the process (`LocalBucketStore`), or in the `THROTTLE_CACHE` cache when set, so
+    that all processes share them.
+    """
+
+    scope = ""
+
+    def allow_request(self, request, view) -> bool:
+        rate = parse_rate(settings.THROTTLE_RATES.get(self.scope))
+        if rate is None:
+            return True
+        client = self.get_client_key(request, view)
+        if client is None:
+            return True
+        self.wait_time = get_store().consume(f"throttle:{self.scope}:{client}", *rate, time.time())
+        return not self.wait_time
+
+    def wait(self) -> float:
+        return self.wait_time
+
+    def get_client_key(self, request, view) -> str | None:
+        raise NotImplementedError
+
+    def get_user_or_ip(self, request) -> str:
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return f"ip:{self.get_ident(request)}"
+
+
+class AnonThrottle(TokenBucketThrottle):
+    """
+    Unauthenticated requests, per IP address.
+    """
+
+    scope = "anon"
+
+    def get_client_key(self, request, view) -> str | None:
+        if request.user and request.user.is_authenticated:
+            return None
+        return self.get_ident(request)
+
+
+class UserThrottle(TokenBucketThrottle):
+    """
+    Authenticated requests, per user.
+    """
+
+    scope = "user"
+
+    def get_client_key(self, request, view) -> str | None:
+        if request.user and request.user.is_authenticated:
+            return str(request.user.pk)
+        return None
+
+
+class WriteThrottle(TokenBucketThrottle):
+    """
+    Unsafe methods (creates, updates, deletes, imports), per user or, unauthenticated, per IP address.
+    """
+
+    scope = "write"
+
+    def get_client_key(self, request, view) -> str | None:
+        if request.method in SAFE_METHODS:
+            return None
+        return self.get_user_or_ip(request)
+
+
+class AuthThrottle(TokenBucketThrottle):
+    """
+    Login and registration, per IP address: each one costs a password hash (see users.hashers).
+    """
+
+    scope = "auth"
+
+    def get_client_key(self, request, view) -> str | None:
+        return self.get_ident(request)
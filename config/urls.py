@@ -1,9 +1,12 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import TokenRefreshView
 
-from users.views import UserViewSet, RegisterView
+from config.async_views import async_read_urls
+from jobs.views import JobStatsView
+from users.views import LoginView, UserViewSet, RegisterView
 from pets.views import PetViewSet
 from vaccines.views import VaccineViewSet
 from vaccinations.views import VaccinationViewSet
@@ -18,7 +21,11 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include(router.urls)),
     path("api/auth/register/", RegisterView.as_view(), name="auth-register"),
-    path("api/auth/login/", TokenObtainPairView.as_view(), name="auth-login"),
+    path("api/auth/login/", LoginView.as_view(), name="auth-login"),
     path("api/auth/refresh/", TokenRefreshView.as_view(), name="auth-refresh"),
+    path("api/jobs/stats/", JobStatsView.as_view(), name="job-stats"),
 ]
 
+if settings.ASYNC_READ_VIEWS:
+    # Ahead of the router, which keeps serving the other methods and routes.
+    urlpatterns.insert(0, path("api/", include(async_read_urls(router))))
@@ -0,0 +1,19 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "status", "run_at", "attempts", "created_at", "started_at", "finished_at")
+    search_fields = ("name", "unique_key")
+    list_filter = ("status", "name")
+    actions = ["requeue"]
+
+    @admin.action(description="Queue the selected jobs again")
+    def requeue(self, request, queryset):
+        count = queryset.exclude(status="running").update(
+            status="queued", run_at=timezone.now(), attempts=0, claimed_by=""
+        )
+        self.message_user(request, f"{count} job(s) queued.")
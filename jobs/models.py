@@ -0,0 +1,158 @@
+from datetime import timedelta
+
+from django.db import connection, models, transaction
+from django.db.models import Avg, Count, F, Max, Min, Q
+from django.utils import timezone
+
+from .registry import get_job
+
+# Longest window accepted by the throughput stats (`job_stats --hours`, `/api/jobs/stats/?hours=`).
+STATS_MAX_HOURS = 24 * 365
+
+
+class JobManager(models.Manager):
+    def enqueue(self, name: str, payload: dict | None = None, run_at=None, unique_key: str | None = None) -> "Job":
+        """
+        Queue the registered job `name`. With `unique_key`, a job already queued under that key
+        (in any state) is returned instead, so periodic and fan-out jobs are enqueued once.
+        """
+        fields = {
+            "name": name,
+            "payload": payload or {},
+            "run_at": run_at or timezone.now(),
+            "max_attempts": get_job(name).max_attempts,
+        }
+        if unique_key is None:
+            return self.create(**fields)
+        job, _ = self.get_or_create(unique_key=unique_key, defaults=fields)
+        return job
+
+    def claim(self, worker: str, limit: int = 1) -> list["Job"]:
+        """
+        Mark up to `limit` due jobs as running by `worker` and return them.
+
+        Where the database supports it, rows locked by another worker's claim are skipped instead of
+        waited for. The update only takes jobs still queued, so concurrent claims never share a job.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            due = self.filter(status="queued", run_at__lte=now).order_by("run_at", "id")
+            if connection.features.has_select_for_update_skip_locked:
+                due = due.select_for_update(skip_locked=True)
+            ids = list(due.values_list("id", flat=True)[:limit])
+            if not ids:
+                return []
+            self.filter(id__in=ids, status="queued").update(
+                status="running", claimed_by=worker, started_at=now, attempts=F("attempts") + 1
+            )
+        return list(self.filter(id__in=ids, status="running", claimed_by=worker).order_by("run_at", "id"))
+
+    def requeue_stale(self, timeout: timedelta) -> int:
+        """
+        Queue again the jobs left running longer than `timeout`, e.g. by a worker that was killed.
+        """
+        stale = self.filter(status="running", started_at__lt=timezone.now() - timeout)
+        failed = stale.filter(attempts__gte=F("max_attempts")).update(
+            status="failed", finished_at=timezone.now(), error="Timed out."
+        )
+        return failed + stale.update(status="queued", claimed_by="", error="Timed out; retried.")
+
+    def stats(self, since) -> list[dict]:
+        """
+        Per job name: jobs in each state, and the jobs finished since `since` with their durations
+        and summed result metrics (e.g. the reminder counts), as totals and per second of run time.
+        """
+        stats = {
+            row["name"]: row
+            for row in self.order_by()
+            .values("name")
+            .annotate(
+                queued=Count("id", filter=Q(status="queued")),
+                running=Count("id", filter=Q(status="running")),
+                failed=Count("id", filter=Q(status="failed")),
+                oldest_queued=Min("run_at", filter=Q(status="queued")),
+            )
+        }
+        finished = (
+            self.filter(status="succeeded", finished_at__gte=since)
+            .order_by()
+            .values("name")
+            .annotate(
+                succeeded=Count("id"),
+                average_seconds=Avg(F("finished_at") - F("started_at")),
+                last_finished_at=Max("finished_at"),
+            )
+        )
+        for row in finished:
+            stats[row["name"]].update(row)
+
+        # Result metrics are summed here rather than in SQL, as JSON aggregation differs per database.
+        totals = {}
+        for name, result in self.filter(status="succeeded", finished_at__gte=since).values_list("name", "result"):
+            job_totals = totals.setdefault(name, {})
+            for key, value in (result or {}).items():
+                if isinstance(value, (int, float)) and not key.endswith("_per_second"):
+                    job_totals[key] = job_totals.get(key, 0) + value
+
+        now = timezone.now()
+        for name, row in stats.items():
+            average = row.pop("average_seconds", None)
+            row["succeeded"] = row.get("succeeded", 0)
+            row["average_seconds"] = round(average.total_seconds(), 3) if average is not None else None
+            oldest_queued = row.pop("oldest_queued")
+            row["queue_lag_seconds"] = round(max((now - oldest_queued).total_seconds(), 0), 1) if oldest_queued else 0
+            row["totals"] = totals.get(name, {})
+            seconds = row["totals"].get("seconds")
+            row["per_second"] = {
+                key: round(value / seconds, 1) for key, value in row["totals"].items() if key != "seconds" and seconds
+            }
+        return sorted(stats.values(), key=lambda row: row["name"])
+
+
+class Job(models.Model):
+    """
+    A background job: the function registered as `name` (see `jobs.registry`), called by a worker
+    with `payload` once `run_at` has passed. Failed jobs are retried with backoff until
+    `max_attempts`; `result` holds the metrics returned by the last successful run.
+    """
+
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    ]
+
+    name = models.CharField(max_length=255)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="queued")
+    run_at = models.DateTimeField(default=timezone.now)
+    unique_key = models.CharField(
+        max_length=255,
+        unique=True,
+        null=True,
+        blank=True,
+        help_text="Deduplicates enqueues, e.g. one job per schedule period.",
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    claimed_by = models.CharField(max_length=255, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    objects = JobManager()
+
+    class Meta:
+        db_table = "jobs"
+        ordering = ["-created_at"]
+        indexes = [
+            # The workers' claim query.
+            models.Index(fields=["run_at", "id"], name="job_queued_idx", condition=Q(status="queued")),
+            models.Index(fields=["name", "finished_at"], name="job_name_finished_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.name} #{self.pk} ({self.status})"
@@ -0,0 +1,89 @@
+from collections.abc import Callable
+from datetime import datetime, time, timedelta, timezone
+
+# When a failed job is retried: after retry_delay, doubling with each attempt.
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = timedelta(seconds=30)
+
+
+class UnknownJob(LookupError):
+    """
+    Raised for a job name no function is registered under.
+    """
+
+
+class JobFunction:
+    """
+    A function run by the workers. It is called with the job's payload as keyword arguments and
+    may return a dict of metrics (counts, rates), stored as the job's result.
+    """
+
+    def __init__(self, name: str, func: Callable, max_attempts: int, retry_delay: timedelta):
+        self.name = name
+        self.func = func
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def __call__(self, **payload):
+        return self.func(**payload)
+
+    def enqueue(self, **kwargs):
+        from .models import Job
+
+        return Job.objects.enqueue(self.name, **kwargs)
+
+    def get_retry_delay(self, attempts: int) -> timedelta:
+        return self.retry_delay * 2 ** (attempts - 1)
+
+
+class Schedule:
+    """
+    Enqueues the job `name` once per `every`, at `at` (UTC) past each period boundary counted from
+    the epoch; e.g. `every=timedelta(days=1), at=time(8)` runs daily at 08:00 UTC.
+    """
+
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    def __init__(self, name: str, every: timedelta, at: time = time(0)):
+        self.name = name
+        self.every = every
+        self.anchor = self.epoch + timedelta(hours=at.hour, minutes=at.minute, seconds=at.second)
+
+    def current_slot(self, now: datetime) -> datetime:
+        """
+        Start of the period `now` falls in.
+        """
+        return self.anchor + (now - self.anchor) // self.every * self.every
+
+
+registry: dict[str, JobFunction] = {}
+schedules: list[Schedule] = []
+
+
+def job(
+    name: str | None = None, *, max_attempts: int = DEFAULT_MAX_ATTEMPTS, retry_delay: timedelta = DEFAULT_RETRY_DELAY
+):
+    """
+    Register the decorated function as a job, under `name` or `<module>.<function>`.
+    """
+
+    def register(func: Callable) -> JobFunction:
+        job_name = name or f"{func.__module__}.{func.__name__}"
+        registry[job_name] = JobFunction(job_name, func, max_attempts, retry_delay)
+        return registry[job_name]
+
+    return register
+
+
+def schedule(name: str, every: timedelta, at: time = time(0)) -> None:
+    """
+    Have the scheduler enqueue the job `name` periodically.
+    """
+    schedules.append(Schedule(name, every, at))
+
+
+def get_job(name: str) -> JobFunction:
+    try:
+        return registry[name]
+    except KeyError:
+        raise UnknownJob(f"No job registered as {name!r}.")
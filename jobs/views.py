@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.instrumentation import InstrumentedViewMixin
+
+from .models import STATS_MAX_HOURS, Job
+
+
+class JobStatsView(InstrumentedViewMixin, APIView):
+    """
+    Staff-only queue and throughput metrics per job name, over the last `hours` (default 24).
+    """
+
+    permission_classes = [IsAdminUser]
+    hours_field = serializers.FloatField(min_value=0, max_value=STATS_MAX_HOURS)
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        try:
+            hours = self.hours_field.run_validation(request.query_params.get("hours", 24))
+            since = timezone.now() - timedelta(hours=hours)
+        except ValidationError as exc:
+            raise ValidationError({"hours": exc.detail})
+        except (OverflowError, ValueError):
+            # NaN passes the field's range check, but not timedelta().
+            raise ValidationError({"hours": ["A valid number is required."]})
+        return Response({"since": since, "jobs": Job.objects.stats(since)})
@@ -0,0 +1,137 @@
+import json
+import logging
+import os
+import signal
+import socket
+import time
+import traceback
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import Job
+from .registry import UnknownJob, get_job, schedules
+
+logger = logging.getLogger("jobs")
+
+
+class Worker:
+    """
+    Claims due jobs from the queue and runs them, one at a time, until stopped.
+
+    Database connections are checked and recycled around each job as around a request, so
+    `CONN_MAX_AGE` and `CONN_HEALTH_CHECKS` apply to long-running workers too. SIGTERM and SIGINT
+    stop the worker after its current job.
+    """
+
+    def __init__(self, poll_interval: float | None = None, timeout: int | None = None):
+        self.name = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.poll_interval = settings.JOB_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.timeout = timedelta(seconds=settings.JOB_TIMEOUT if timeout is None else timeout)
+        self.stopping = False
+
+    def run(self, burst: bool = False, max_jobs: int | None = None) -> int:
+        """
+        Run jobs until stopped, until `max_jobs` have run or, with `burst`, until none is due.
+        """
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self.stop)
+        processed = 0
+        next_stale_check = 0.0
+        while not self.stopping and (max_jobs is None or processed < max_jobs):
+            close_old_connections()
+            if time.monotonic() >= next_stale_check:
+                Job.objects.requeue_stale(self.timeout)
+                next_stale_check = time.monotonic() + 60
+            jobs = Job.objects.claim(self.name)
+            if not jobs:
+                if burst:
+                    break
+                time.sleep(self.poll_interval)
+                continue
+            for job in jobs:
+                self.execute(job)
+                processed += 1
+        close_old_connections()
+        return processed
+
+    def stop(self, signum=None, frame=None) -> None:
+        self.stopping = True
+
+    def execute(self, job: Job) -> Job:
+        started = time.perf_counter()
+        try:
+            function = get_job(job.name)
+            result = function(**job.payload)
+        except Exception as exc:
+            seconds = time.perf_counter() - started
+            logger.exception("Job %s #%s failed (attempt %s of %s).", job.name, job.pk, job.attempts, job.max_attempts)
+            job.error = "".join(traceback.format_exception(exc))
+            if not isinstance(exc, UnknownJob) and job.attempts < job.max_attempts:
+                job.status = "queued"
+                job.run_at = timezone.now() + function.get_retry_delay(job.attempts)
+                job.claimed_by = ""
+            else:
+                job.status = "failed"
+                job.finished_at = timezone.now()
+            job.save(update_fields=["status", "error", "run_at", "claimed_by", "finished_at"])
+        else:
+            seconds = time.perf_counter() - started
+            job.status = "succeeded"
+            job.result = {**(result or {}), "seconds": round(seconds, 3)}
+            job.error = ""
+            job.finished_at = timezone.now()
+            job.save(update_fields=["status", "result", "error", "finished_at"])
+        log = {
+            "job": job.name,
+            "id": job.pk,
+            "status": job.status,
+            "attempt": job.attempts,
+            "ms": round(seconds * 1000, 1),
+        }
+        logger.info(json.dumps({**log, **(job.result or {})} if job.status == "succeeded" else log))
+        return job
+
+
+class Scheduler:
+    """
+    Enqueues the periodic jobs registered with `jobs.registry.schedule`.
+
+    Each period is enqueued once, under a unique key, so several schedulers can run side by side and
+    a restarted scheduler enqueues the latest period only if it was missed.
+    """
+
+    def __init__(self, interval: float = 30):
+        self.interval = interval
+        self.stopping = False
+
+    def run(self, once: bool = False) -> None:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self.stop)
+        while not self.stopping:
+            close_old_connections()
+            self.tick()
+            if once:
+                break
+            time.sleep(self.interval)
+
+    def stop(self, signum=None, frame=None) -> None:
+        self.stopping = True
+
+    def tick(self, now=None) -> list[Job]:
+        now = now or timezone.now()
+        jobs = []
+        for entry in schedules:
+            slot = entry.current_slot(now)
+            jobs.append(
+                Job.objects.enqueue(
+                    entry.name,
+                    payload={"scheduled_at": slot.isoformat()},
+                    run_at=slot,
+                    unique_key=f"{entry.name}@{slot.isoformat()}",
+                )
+            )
+        return jobs
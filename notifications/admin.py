@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import Notification
+
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "kind", "scheduled_for", "status", "created_at", "sent_at")
+    search_fields = ("user__email",)
+    list_filter = ("kind", "status", "scheduled_for")
+    raw_id_fields = ("user",)
@@ -0,0 +1,107 @@
+import json
+import sys
+import threading
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import Notification
+
+
+def get_backend(path: str | None = None) -> "BaseNotificationBackend":
+    return import_string(path or settings.NOTIFICATION_BACKEND)()
+
+
+class BaseNotificationBackend:
+    """
+    Delivers notifications in batches, as Django's email backends do.
+
+    `send_messages` returns the errors of the notifications that could not be sent, by id; the
+    others count as delivered. Raising fails the whole batch, which the delivery job then retries.
+    """
+
+    def send_messages(self, notifications: list[Notification]) -> dict[int, str]:
+        errors = {}
+        for notification in notifications:
+            try:
+                self.send(notification)
+            except Exception as exc:
+                errors[notification.pk] = str(exc) or exc.__class__.__name__
+        return errors
+
+    def send(self, notification: Notification) -> None:
+        raise NotImplementedError("Subclasses must implement send() or send_messages().")
+
+
+class ConsoleBackend(BaseNotificationBackend):
+    """
+    Writes each notification to stdout, for development.
+    """
+
+    lock = threading.Lock()
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def send_messages(self, notifications: list[Notification]) -> dict[int, str]:
+        text = "".join(
+            f"To: {notification.user.email}\nSubject: {notification.subject}\n\n{notification.body}\n{'-' * 79}\n"
+            for notification in notifications
+        )
+        with self.lock:
+            self.stream.write(text)
+            self.stream.flush()
+        return {}
+
+
+class FileBackend(BaseNotificationBackend):
+    """
+    Appends each notification as a JSON line to `NOTIFICATION_FILE_PATH`, one write per batch, e.g.
+    for another system to pick up.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or settings.NOTIFICATION_FILE_PATH
+
+    def send_messages(self, notifications: list[Notification]) -> dict[int, str]:
+        sent_at = timezone.now().isoformat()
+        lines = "".join(
+            json.dumps(
+                {
+                    "id": notification.pk,
+                    "user_id": notification.user_id,
+                    "email": notification.user.email,
+                    "kind": notification.kind,
+                    "scheduled_for": notification.scheduled_for.isoformat(),
+                    "subject": notification.subject,
+                    "payload": notification.payload,
+                    "sent_at": sent_at,
+                }
+            )
+            + "\n"
+            for notification in notifications
+        )
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(lines)
+        return {}
+
+
+class EmailBackend(BaseNotificationBackend):
+    """
+    Sends each notification as an email through Django's `EMAIL_BACKEND`, over one connection per batch.
+    """
+
+    def send_messages(self, notifications: list[Notification]) -> dict[int, str]:
+        errors = {}
+        with get_connection() as connection:
+            for notification in notifications:
+                message = EmailMessage(
+                    notification.subject, notification.body, to=[notification.user.email], connection=connection
+                )
+                try:
+                    message.send()
+                except Exception as exc:
+                    errors[notification.pk] = str(exc) or exc.__class__.__name__
+        return errors
@@ -0,0 +1,71 @@
+from datetime import date, time, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from jobs.registry import job, schedule
+
+from .backends import get_backend
+from .models import Notification
+from .reminders import ReminderPlanner
+
+
+@job("notifications.send_due_reminders")
+def send_due_reminders(scheduled_at: str | None = None, days_ahead: int | None = None) -> dict:
+    """
+    Write the day's vaccination reminders and fan their delivery out to one job per owner range.
+    """
+    today = (parse_datetime(scheduled_at) if scheduled_at else timezone.now()).date()
+
+    def enqueue_delivery(owner_from: int, owner_to: int, count: int) -> None:
+        deliver_notifications.enqueue(
+            payload={
+                "kind": ReminderPlanner.kind,
+                "scheduled_for": today.isoformat(),
+                "owner_from": owner_from,
+                "owner_to": owner_to,
+            },
+            unique_key=f"notifications.deliver@{ReminderPlanner.kind}:{today.isoformat()}:{owner_from}",
+        )
+
+    planner = ReminderPlanner(
+        today,
+        days_ahead=settings.REMINDER_DAYS_AHEAD if days_ahead is None else days_ahead,
+        batch_size=settings.REMINDER_BATCH_SIZE,
+        on_batch=enqueue_delivery,
+    )
+    return planner.run()
+
+
+@job("notifications.deliver")
+def deliver_notifications(kind: str, scheduled_for: str, owner_from: int, owner_to: int) -> dict:
+    """
+    Send the pending notifications of the owners with ids in (owner_from, owner_to] through the
+    configured backend. A retry after a crash may send a batch twice; delivery is at least once.
+    """
+    notifications = list(
+        Notification.objects.filter(
+            kind=kind,
+            scheduled_for=date.fromisoformat(scheduled_for),
+            user_id__gt=owner_from,
+            user_id__lte=owner_to,
+            status="pending",
+        )
+        .select_related("user")
+        .only("id", "kind", "scheduled_for", "payload", "user__email")
+        .order_by("user_id")
+    )
+    errors = get_backend().send_messages(notifications)
+
+    sent_ids = [notification.pk for notification in notifications if notification.pk not in errors]
+    Notification.objects.filter(pk__in=sent_ids).update(status="sent", sent_at=timezone.now())
+    failed = [notification for notification in notifications if notification.pk in errors]
+    for notification in failed:
+        notification.status = "failed"
+        notification.error = errors[notification.pk]
+    Notification.objects.bulk_update(failed, ["status", "error"])
+    return {"sent": len(sent_ids), "failed": len(failed)}
+
+
+schedule("notifications.send_due_reminders", every=timedelta(days=1), at=time.fromisoformat(settings.REMINDER_TIME))
@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.db import models
+
+
+class Notification(models.Model):
+    """
+    A message for a user, written by a background job and sent by the configured delivery backend
+    (`NOTIFICATION_BACKEND`). `payload` holds what the message is about, e.g. the due vaccinations.
+    """
+
+    KIND_CHOICES = [
+        ("vaccination_due", "Vaccinations due"),
+    ]
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="notifications")
+    kind = models.CharField(max_length=50, choices=KIND_CHOICES)
+    scheduled_for = models.DateField()
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "notifications"
+        ordering = ["-created_at"]
+        constraints = [
+            # One notification of a kind per user and day, so a re-run of the job adds nothing.
+            models.UniqueConstraint(fields=["user", "kind", "scheduled_for"], name="notification_user_kind_day_uniq"),
+        ]
+        indexes = [
+            # The delivery jobs' range reads.
+            models.Index(
+                fields=["kind", "scheduled_for", "user"],
+                name="notification_pending_idx",
+                condition=models.Q(status="pending"),
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()} for {self.user_id} on {self.scheduled_for} ({self.status})"
+
+    @property
+    def subject(self) -> str:
+        items = self.payload.get("items", [])
+        overdue = sum(1 for item in items if item["overdue"])
+        if overdue:
+            return f"{overdue} overdue vaccination(s) for your pets"
+        return f"{len(items)} vaccination(s) due soon for your pets"
+
+    @property
+    def body(self) -> str:
+        lines = [
+            f"- {item['pet_name']}: {item['vaccine_name']}, "
+            f"{'overdue since' if item['overdue'] else 'due on'} {item['next_due_date']}"
+            for item in self.payload.get("items", [])
+        ]
+        return "\n".join(lines)
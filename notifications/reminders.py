@@ -0,0 +1,91 @@
+import time
+from collections.abc import Callable
+from datetime import date, timedelta
+from itertools import groupby
+from operator import itemgetter
+
+from django.db.models import Max, Min
+
+from pets.models import Pet
+from vaccinations.models import VaccinationStatus
+
+from .models import Notification
+
+
+class ReminderPlanner:
+    """
+    Writes one `vaccination_due` notification per owner with vaccinations overdue or due within
+    `days_ahead` days of `today`, listing them.
+
+    Owners are walked in primary key ranges of `batch_size`: each range is one query over the
+    vaccination statuses (the latest dose of each pet and vaccine, through the (pet, next_due_date)
+    index) and one `bulk_create`, so memory is bounded by a batch whatever the number of due
+    records. Notifications are unique per owner, kind and day, so a re-run only fills the gaps.
+    `on_batch(owner_from, owner_to, count)` is called after each range that wrote notifications.
+    """
+
+    kind = "vaccination_due"
+
+    def __init__(
+        self,
+        today: date,
+        days_ahead: int = 7,
+        batch_size: int = 1000,
+        on_batch: Callable[[int, int, int], None] | None = None,
+    ):
+        self.today = today
+        self.horizon = today + timedelta(days=days_ahead)
+        self.batch_size = batch_size
+        self.on_batch = on_batch
+
+    def run(self) -> dict:
+        started = time.perf_counter()
+        owners = Pet.objects.aggregate(first=Min("owner_id"), last=Max("owner_id"))
+        metrics = {"batches": 0, "owners": 0, "items": 0}
+        if owners["first"] is not None:
+            for owner_from in range(owners["first"] - 1, owners["last"], self.batch_size):
+                owner_to = owner_from + self.batch_size
+                owners_count, items_count = self.plan(owner_from, owner_to)
+                metrics["batches"] += 1
+                metrics["owners"] += owners_count
+                metrics["items"] += items_count
+                if owners_count and self.on_batch:
+                    self.on_batch(owner_from, owner_to, owners_count)
+        seconds = time.perf_counter() - started
+        metrics["items_per_second"] = round(metrics["items"] / seconds, 1) if seconds else 0
+        return metrics
+
+    def plan(self, owner_from: int, owner_to: int) -> tuple[int, int]:
+        """
+        Write the notifications of the owners with ids in (owner_from, owner_to]; returns the
+        number of owners and of due vaccinations.
+        """
+        rows = (
+            VaccinationStatus.objects.filter(
+                next_due_date__lte=self.horizon,
+                pet__owner_id__gt=owner_from,
+                pet__owner_id__lte=owner_to,
+                pet__owner__is_active=True,
+            )
+            .order_by("pet__owner_id", "next_due_date", "pet_id", "vaccine_id")
+            .values_list("pet__owner_id", "pet_id", "pet__name", "vaccine_id", "vaccine__name", "next_due_date")
+        )
+        notifications, items_count = [], 0
+        for owner_id, owner_rows in groupby(rows.iterator(chunk_size=2000), key=itemgetter(0)):
+            items = [
+                {
+                    "pet": pet_id,
+                    "pet_name": pet_name,
+                    "vaccine": vaccine_id,
+                    "vaccine_name": vaccine_name,
+                    "next_due_date": next_due_date.isoformat(),
+                    "overdue": next_due_date < self.today,
+                }
+                for _, pet_id, pet_name, vaccine_id, vaccine_name, next_due_date in owner_rows
+            ]
+            items_count += len(items)
+            notifications.append(
+                Notification(user_id=owner_id, kind=self.kind, scheduled_for=self.today, payload={"items": items})
+            )
+        Notification.objects.bulk_create(notifications, ignore_conflicts=True)
+        return len(notifications), items_count
@@ -5,3 +5,5 @@ class PetsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "pets"
 
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.6 on 2026-10-18 09:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Pet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('species', models.CharField(choices=[('dog', 'Dog'), ('cat', 'Cat'), ('other', 'Other')], max_length=20)),
+                ('breed', models.CharField(blank=True, max_length=255)),
+                ('birth_date', models.DateField(blank=True, null=True)),
+                ('weight', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('owner', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='pets', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'pets',
+                'ordering': ['name'],
+                'indexes': [models.Index(fields=['owner', 'name'], name='pet_owner_name_idx'), models.Index(fields=['owner', 'created_at'], name='pet_owner_created_idx')],
+            },
+        ),
+    ]
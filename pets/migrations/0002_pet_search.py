@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from config.search import CreateFullTextIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0001_initial'),
+    ]
+
+    operations = [
+        CreateFullTextIndex('pet', 'pet_search', ['name', 'breed']),
+    ]
@@ -1,5 +1,7 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+
+from config.search import FullTextIndex
 
 
 class Pet(models.Model):
@@ -18,13 +20,42 @@ class Pet(models.Model):
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name="pets",
+        db_index=False,  # covered by the (owner, ...) composite indexes
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Created by migration 0002 (config.search.CreateFullTextIndex).
+    search_index = FullTextIndex("pet_search", ["name", "breed"])
+
     class Meta:
         db_table = "pets"
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["owner", "name"], name="pet_owner_name_idx"),
+            models.Index(fields=["owner", "created_at"], name="pet_owner_created_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.name} ({self.species})"
 
+    def save(self, *args, **kwargs):
+        moved = self.pk is not None and getattr(self, "_loaded_owner_id", self.owner_id) != self.owner_id
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if moved:
+                # Vaccinations and their statuses carry the owner too (see `Vaccination.owner`).
+                self.vaccinations.update(owner_id=self.owner_id)
+                self.vaccination_statuses.update(owner_id=self.owner_id)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the owner as loaded, so moving a pet to another owner also invalidates the
+        # cached responses of the owner it left.
+        instance._loaded_owner_id = dict(zip(field_names, values)).get("owner_id")
+        return instance
+
+    @property
+    def owner_ids(self) -> set[int]:
+        return {self.owner_id, getattr(self, "_loaded_owner_id", None)} - {None}
+
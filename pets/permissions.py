@@ -14,5 +14,5 @@ class IsPetOwner(BasePermission):
         return bool(request.user and request.user.is_authenticated)
 
     def has_object_permission(self, request: Request, view: View, obj: Pet) -> bool:
-        return obj.owner == request.user
+        return obj.owner_id == request.user.pk
 
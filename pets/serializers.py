@@ -1,12 +1,14 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from config.serialization import DynamicFieldsSerializerMixin
+
 from .models import Pet
 
 User = get_user_model()
 
 
-class PetSerializer(serializers.ModelSerializer):
+class PetSerializer(DynamicFieldsSerializerMixin, serializers.ModelSerializer):
     owner_id = serializers.PrimaryKeyRelatedField(
         read_only=True,
         source="owner",
@@ -30,6 +32,18 @@ class PetSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         if request is None or not request.user.is_authenticated:
             raise serializers.ValidationError("Authenticated user is required to create a pet.")
-        validated_data["owner"] = request.user
+        validated_data["owner_id"] = request.user.pk
         return super().create(validated_data)
 
+
+class PetSummarySerializer(PetSerializer):
+    """
+    Pet with its vaccination summary, read from the annotations of `PetViewSet.annotate_summary`.
+    """
+
+    last_vaccination_date = serializers.DateField(read_only=True)
+    next_due_date = serializers.DateField(read_only=True)
+    overdue_count = serializers.IntegerField(read_only=True)
+
+    class Meta(PetSerializer.Meta):
+        fields = PetSerializer.Meta.fields + ["last_vaccination_date", "next_due_date", "overdue_count"]
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from config.response_cache import invalidate_owners
+
+from .models import Pet
+
+
+@receiver(post_save, sender=Pet)
+@receiver(post_delete, sender=Pet)
+def invalidate_owner_responses(sender, instance: Pet, **kwargs) -> None:
+    invalidate_owners(*instance.owner_ids)
+    instance._loaded_owner_id = instance.owner_id
@@ -1,25 +1,128 @@
+from datetime import date
+from itertools import groupby
+
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, viewsets
+from rest_framework.decorators import action
+from rest_framework.request import Request
+
+from config.async_views import AsyncReadMixin
+from config.export import CSVRenderer, NDJSONRenderer, export_response
+from config.instrumentation import InstrumentedViewMixin
+from config.pagination import OptionalKeysetPagination
+from config.response_cache import OwnerResponseCacheMixin
+from config.search import FullTextSearchFilter
+from config.serialization import DynamicFieldsViewMixin, ValuesListMixin
+from vaccinations.models import VaccinationStatus
 
 from .models import Pet
 from .permissions import IsPetOwner
-from .serializers import PetSerializer
+from .serializers import PetSerializer, PetSummarySerializer
 
 
-class PetViewSet(viewsets.ModelViewSet):
+class PetViewSet(
+    InstrumentedViewMixin,
+    OwnerResponseCacheMixin,
+    AsyncReadMixin,
+    DynamicFieldsViewMixin,
+    ValuesListMixin,
+    viewsets.ModelViewSet,
+):
     """
     Full CRUD for pets.
     Users can access only their own pets.
+    List and retrieve include a vaccination summary and accept `fields=` to trim the payload.
+    `search=` matches name and breed by word prefix, ranked (see `config.search`).
+    `export/` streams the filtered pets with their vaccinations as CSV or NDJSON.
+    List and retrieve also have async versions for ASGI (see `config.async_views`).
+    List and retrieve responses are cached per owner until the owner's data changes (see `config.response_cache`).
     """
 
     serializer_class = PetSerializer
+    summary_actions = ("list", "retrieve")
+    pagination_class = OptionalKeysetPagination
     permission_classes = [IsPetOwner]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, filters.OrderingFilter]
     filterset_fields = ["species", "breed"]
     search_fields = ["name", "breed"]
     ordering_fields = ["name", "created_at"]
+    export_chunk_size = 2000
+    export_pet_fields = ["id", "name", "species", "breed", "birth_date", "weight", "created_at"]
+    export_vaccination_fields = {
+        "id": "vaccinations__id",
+        "vaccine_id": "vaccinations__vaccine_id",
+        "vaccine_name": "vaccinations__vaccine__name",
+        "application_date": "vaccinations__application_date",
+        "next_due_date": "vaccinations__next_due_date",
+        "veterinarian_name": "vaccinations__veterinarian_name",
+        "notes": "vaccinations__notes",
+    }
 
     def get_queryset(self):
         user = self.request.user
-        return Pet.objects.filter(owner=user).order_by("name")
+        queryset = Pet.objects.filter(owner_id=user.pk).order_by("name")
+        if self.action in self.summary_actions:
+            queryset = self.annotate_summary(queryset)
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action in self.summary_actions:
+            return PetSummarySerializer
+        return super().get_serializer_class()
+
+    @staticmethod
+    def annotate_summary(queryset):
+        """
+        Vaccination summary of each pet, read from its status rows (latest vaccination per vaccine)
+        with correlated subqueries on the (pet, next_due_date) index, in the same query as the pets.
+        """
+        statuses = VaccinationStatus.objects.filter(pet_id=OuterRef("pk")).order_by()
+        per_pet = statuses.values("pet_id")
+        return queryset.annotate(
+            last_vaccination_date=Subquery(per_pet.annotate(last=Max("application_date")).values("last")),
+            next_due_date=Subquery(
+                statuses.filter(next_due_date__isnull=False).order_by("next_due_date").values("next_due_date")[:1]
+            ),
+            overdue_count=Coalesce(
+                Subquery(per_pet.filter(next_due_date__lt=date.today()).annotate(total=Count("*")).values("total")),
+                0,
+            ),
+        )
+
+    @action(detail=False, methods=["get"], renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request: Request, *args, **kwargs):
+        """
+        Stream the pets matching the list filters and ordering, each with its vaccinations (newest first).
+
+        `?format=csv` (default) writes one row per vaccination, repeating the pet columns (pets without
+        vaccinations get one row with empty vaccination columns). `?format=ndjson` writes one line per
+        pet with a nested `vaccinations` list.
+        """
+        pets = self.filter_queryset(self.get_queryset())
+        # One LEFT JOIN query read in chunks; ordering by pet first keeps each pet's rows together.
+        rows = (
+            pets.order_by(*pets.query.order_by, "id", "-vaccinations__application_date", "vaccinations__id")
+            .values_list(*self.export_pet_fields, *self.export_vaccination_fields.values())
+            .iterator(chunk_size=self.export_chunk_size)
+        )
+        pet_count = len(self.export_pet_fields)
+        vaccination_columns = list(self.export_vaccination_fields)
 
+        if request.accepted_renderer.format == CSVRenderer.format:
+            columns = [f"pet_{name}" for name in self.export_pet_fields]
+            columns += [f"vaccination_{name}" for name in vaccination_columns]
+            records = (dict(zip(columns, row)) for row in rows)
+        else:
+            columns = []
+            records = (
+                {
+                    **dict(zip(self.export_pet_fields, key)),
+                    "vaccinations": [
+                        dict(zip(vaccination_columns, row[pet_count:])) for row in group if row[pet_count] is not None
+                    ],
+                }
+                for key, group in groupby(rows, key=lambda row: row[:pet_count])
+            )
+        return export_response(request.accepted_renderer, records, columns, "pets")
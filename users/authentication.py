@@ -0,0 +1,92 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+User = get_user_model()
+
+
+def user_state_cache_key(user_id) -> str:
+    return f"users:state:{user_id}"
+
+
+def user_state(user) -> tuple[bool, bool] | bool:
+    """
+    What the stateless authentication checks about a user: `(is_staff, is_superuser)`, or False
+    if the user is inactive.
+    """
+    return (user.is_staff, user.is_superuser) if user.is_active else False
+
+
+def get_user_state(user_id) -> tuple[bool, bool] | bool:
+    """
+    `user_state` of the user (False if it no longer exists), cached for `JWT_REVOCATION_CACHE_TTL`
+    seconds.
+    """
+    ttl = settings.JWT_REVOCATION_CACHE_TTL
+    key = user_state_cache_key(user_id)
+    state = cache.get(key) if ttl > 0 else None
+    if state is None:
+        state = User.objects.filter(pk=user_id, is_active=True).values_list("is_staff", "is_superuser").first()
+        state = tuple(state) if state is not None else False
+        if ttl > 0:
+            cache.set(key, state, ttl)
+    return state
+
+
+async def aget_user_state(user_id) -> tuple[bool, bool] | bool:
+    """
+    `get_user_state` for async views. The cache is read synchronously: the cache backends' async
+    methods only run the same calls in a thread.
+    """
+    ttl = settings.JWT_REVOCATION_CACHE_TTL
+    key = user_state_cache_key(user_id)
+    state = cache.get(key) if ttl > 0 else None
+    if state is None:
+        state = await User.objects.filter(pk=user_id, is_active=True).values_list("is_staff", "is_superuser").afirst()
+        state = tuple(state) if state is not None else False
+        if ttl > 0:
+            cache.set(key, state, ttl)
+    return state
+
+
+class StatelessJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    JWT authentication that builds a `TokenUser` from the token claims (id, is_staff,
+    is_superuser) instead of selecting the user row on every request.
+
+    The user's state is checked through a short-TTL cache, refreshed immediately on user
+    save/delete (see `users.signals`): deactivated or deleted users are rejected, and the staff
+    flags are taken from it, so a demoted user loses staff access before the token expires.
+    With `JWT_REVOCATION_CACHE_TTL = 0` the check is off and the claims are trusted.
+
+    `aauthenticate` is the same check for async views (see `config.async_views`).
+    """
+
+    inactive_message = "User is inactive or no longer exists."
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        if settings.JWT_REVOCATION_CACHE_TTL > 0:
+            self.apply_state(user, get_user_state(user.id))
+        return user
+
+    def apply_state(self, user, state: tuple[bool, bool] | bool) -> None:
+        if state is False:
+            raise AuthenticationFailed(self.inactive_message, code="user_inactive")
+        user.is_staff, user.is_superuser = state
+
+    async def aauthenticate(self, request):
+        # Validating the token needs no I/O; only the active check is awaited.
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        user = super().get_user(validated_token)
+        if settings.JWT_REVOCATION_CACHE_TTL > 0:
+            self.apply_state(user, await aget_user_state(user.id))
+        return user, validated_token
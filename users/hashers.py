@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from threading import BoundedSemaphore
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    Django's PBKDF2-SHA256 hasher with the iteration count of `PASSWORD_HASH_ITERATIONS`.
+
+    Hashes keep the count they were made with and still verify after a change; `User.check_password`
+    re-hashes a password at the current count when its user logs in.
+    """
+
+    @property
+    def iterations(self) -> int:
+        return settings.PASSWORD_HASH_ITERATIONS
+
+
+class PasswordHashingBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many password checks in progress, try again shortly."
+    default_code = "password_hashing_busy"
+    # Sent as Retry-After by DRF's exception handler.
+    wait = 1
+
+
+class HashingExecutor:
+    """
+    Bounded thread pool for password hashing: `workers` hashes run at a time and up to `queue_size`
+    more wait; past that, requests fail at once with `PasswordHashingBusy` (503) instead of queueing.
+
+    A hash takes a CPU for its whole duration (hashlib releases the GIL meanwhile). Inline, a burst of
+    logins or registrations would take every server thread and core; with the pool, at most
+    `workers + queue_size` threads of a process wait on hashing and the others serve the rest of the API.
+    """
+
+    def __init__(self, workers: int, queue_size: int):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hashing")
+        self.slots = BoundedSemaphore(workers + queue_size)
+
+    def run(self, function, *args):
+        if not self.slots.acquire(blocking=False):
+            raise PasswordHashingBusy()
+        try:
+            future = self.executor.submit(function, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        return future.result()
+
+
+@cache
+def get_executor() -> HashingExecutor:
+    # Created on first use, so gunicorn workers each start their own threads after the fork.
+    return HashingExecutor(settings.PASSWORD_HASHING_WORKERS, settings.PASSWORD_HASHING_QUEUE_SIZE)
+
+
+def make_password(password: str) -> str:
+    return get_executor().run(hashers.make_password, password)
+
+
+def verify_password(password: str, encoded: str) -> tuple[bool, bool]:
+    """
+    Whether `password` matches `encoded`, and whether the hash must be updated (other hasher or cost).
+    """
+    return get_executor().run(hashers.verify_password, password, encoded)
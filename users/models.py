@@ -3,6 +3,8 @@ from django.contrib.auth.models import PermissionsMixin
 from django.db import models
 from django.utils import timezone
 
+from .hashers import make_password, verify_password
+
 
 class UserManager(BaseUserManager):
     """
@@ -81,3 +83,20 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self) -> str:
         return self.full_name or self.email
 
+    def set_password(self, raw_password: str | None) -> None:
+        # Hashed on the bounded hashing pool (users.hashers) rather than the request thread.
+        self.password = make_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password: str) -> bool:
+        """
+        Verify on the hashing pool; a correct password whose hash uses another hasher or cost is
+        re-hashed and saved, as in `AbstractBaseUser.check_password`.
+        """
+        is_correct, must_update = verify_password(raw_password, self.password)
+        if is_correct and must_update:
+            self.set_password(raw_password)
+            self._password = None
+            self.save(update_fields=["password"])
+        return is_correct
+
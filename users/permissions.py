@@ -22,5 +22,5 @@ class IsSelfOrAdmin(BasePermission):
             return False
         if request.user.is_staff:
             return True
-        return obj == request.user
+        return obj.pk == request.user.pk
 
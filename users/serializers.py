@@ -1,7 +1,13 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer as BaseTokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer as BaseTokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import StatelessJWTAuthentication, get_user_state
+from .tokens import UserRefreshToken
 
 User = get_user_model()
 
@@ -38,25 +44,48 @@ class RegisterSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         password = validated_data.pop("password")
         validated_data.pop("password_confirm", None)
-        user = User.objects.create_user(
+        # One INSERT with the hashed password.
+        return User.objects.create_user(
             username=validated_data["email"],
             email=validated_data["email"],
+            password=password,
             full_name=validated_data.get("full_name", ""),
             phone_number=validated_data.get("phone_number", ""),
         )
-        user.set_password(password)
-        user.save()
-        return user
 
     def to_representation(self, instance):
         """
         After successful registration, return user data and JWT tokens.
         """
         data = UserSerializer(instance).data
-        refresh = RefreshToken.for_user(instance)
+        refresh = UserRefreshToken.for_user(instance)
         data["tokens"] = {
             "refresh": str(refresh),
             "access": str(refresh.access_token),
         }
         return data
 
+
+class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
+    """
+    Login serializer issuing tokens with the claims used by `StatelessJWTAuthentication`.
+    """
+
+    token_class = UserRefreshToken
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    """
+    Refresh serializer that reads the user's staff flags again before issuing the access token,
+    so it never carries flags the user lost since login. Inactive or deleted users are refused.
+    """
+
+    token_class = UserRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        state = get_user_state(refresh[api_settings.USER_ID_CLAIM])
+        if state is False:
+            raise AuthenticationFailed(StatelessJWTAuthentication.inactive_message, code="user_inactive")
+        refresh["is_staff"], refresh["is_superuser"] = state
+        return super().validate({**attrs, "refresh": str(refresh)})
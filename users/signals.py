@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import user_state, user_state_cache_key
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+def cache_state_on_save(sender, instance, **kwargs) -> None:
+    if settings.JWT_REVOCATION_CACHE_TTL > 0:
+        cache.set(user_state_cache_key(instance.pk), user_state(instance), settings.JWT_REVOCATION_CACHE_TTL)
+
+
+@receiver(post_delete, sender=User)
+def cache_state_on_delete(sender, instance, **kwargs) -> None:
+    if settings.JWT_REVOCATION_CACHE_TTL > 0:
+        cache.set(user_state_cache_key(instance.pk), False, settings.JWT_REVOCATION_CACHE_TTL)
@@ -4,6 +4,10 @@ from rest_framework.permissions import AllowAny
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+from config.instrumentation import InstrumentedViewMixin
+from config.throttling import AuthThrottle
 
 from .permissions import IsSelfOrAdmin
 from .serializers import RegisterSerializer, UserDetailSerializer, UserSerializer
@@ -11,12 +15,13 @@ from .serializers import RegisterSerializer, UserDetailSerializer, UserSerialize
 User = get_user_model()
 
 
-class RegisterView(APIView):
+class RegisterView(InstrumentedViewMixin, APIView):
     """
     Public endpoint to register a new user (pet owner).
     """
 
     permission_classes = [AllowAny]
+    throttle_classes = [AuthThrottle]
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         serializer = RegisterSerializer(data=request.data)
@@ -26,7 +31,15 @@ class RegisterView(APIView):
         return Response(data, status=status.HTTP_201_CREATED)
 
 
-class UserViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+class LoginView(TokenObtainPairView):
+    """
+    JWT login (access and refresh tokens), throttled per IP like registration.
+    """
+
+    throttle_classes = [AuthThrottle]
+
+
+class UserViewSet(InstrumentedViewMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
     """
     Read-only viewset for users.
     - List: restricted to staff users.
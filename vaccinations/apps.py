@@ -5,3 +5,5 @@ class VaccinationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "vaccinations"
 
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -0,0 +1,87 @@
+import time
+from collections.abc import Callable
+from datetime import date
+
+from django.db import router, transaction
+from django.db.models import Exists, Max, Min, OuterRef
+
+from config.response_cache import invalidate_all
+
+from .models import Vaccination, VaccinationArchive, VaccinationStatus
+
+FIELDS = ["id", "pet_id", "vaccine_id", "application_date", "next_due_date", "notes", "veterinarian_name", "created_at"]
+
+
+class VaccinationArchiver:
+    """
+    Moves vaccinations applied before `before` from `vaccinations` to `vaccinations_archive`, keeping
+    their ids, except the latest dose of each pet and vaccine (the one its status row points to), so
+    statuses and reminders are unaffected.
+
+    Rows are walked in primary key ranges of `batch_size`; each range is read with
+    `SELECT ... FOR UPDATE` through the primary key index, copied and deleted in one transaction,
+    so an interrupted run loses nothing and the next one carries on. On a range-partitioned table
+    (see `vaccinations.partitioning`) only the partitions before `before` are read. The run stops
+    after the range that passes `max_seconds`; `on_batch(moved, last_id)` is called after each
+    range that moved rows.
+
+    The delete bypasses the model signals: the rows are moved, not removed. Statuses are computed
+    from current rows only, so deleting the latest dose of a pair later falls back to its previous
+    current dose, not to an archived one.
+    """
+
+    def __init__(
+        self,
+        before: date,
+        batch_size: int = 5000,
+        max_seconds: float | None = None,
+        on_batch: Callable[[int, int], None] | None = None,
+    ):
+        self.before = before
+        self.batch_size = batch_size
+        self.max_seconds = max_seconds
+        self.on_batch = on_batch
+
+    def get_queryset(self):
+        return Vaccination.objects.filter(application_date__lt=self.before).exclude(
+            Exists(VaccinationStatus.objects.filter(vaccination_id=OuterRef("pk")))
+        )
+
+    def run(self) -> dict:
+        started = time.perf_counter()
+        ids = Vaccination.objects.filter(application_date__lt=self.before).aggregate(first=Min("pk"), last=Max("pk"))
+        metrics = {"batches": 0, "archived": 0}
+        if ids["first"] is not None:
+            for id_from in range(ids["first"] - 1, ids["last"], self.batch_size):
+                id_to = id_from + self.batch_size
+                moved = self.archive_batch(id_from, id_to)
+                metrics["batches"] += 1
+                metrics["archived"] += moved
+                if moved and self.on_batch:
+                    self.on_batch(moved, id_to)
+                if self.max_seconds is not None and time.perf_counter() - started > self.max_seconds:
+                    break
+        seconds = time.perf_counter() - started
+        metrics["rows_per_second"] = round(metrics["archived"] / seconds, 1) if seconds else 0
+        return metrics
+
+    def archive_batch(self, id_from: int, id_to: int) -> int:
+        """
+        Move the archivable rows with ids in (id_from, id_to]; returns how many were moved.
+        """
+        with transaction.atomic():
+            rows = list(
+                self.get_queryset()
+                .filter(pk__gt=id_from, pk__lte=id_to)
+                .order_by("pk")
+                .select_for_update(of=("self",))
+                .values(*FIELDS)
+            )
+            if not rows:
+                return 0
+            VaccinationArchive.objects.bulk_create([VaccinationArchive(**row) for row in rows])
+            ids = [row["id"] for row in rows]
+            Vaccination.objects.filter(pk__in=ids)._raw_delete(router.db_for_write(Vaccination))
+            # The default lists no longer include these rows.
+            invalidate_all()
+        return len(rows)
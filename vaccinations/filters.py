@@ -1,8 +1,11 @@
-from datetime import date
+from datetime import date, timedelta
 
 import django_filters
+from django.db.models import Q
 
-from .models import Vaccination
+from config.db_functions import Likely
+
+from .models import Vaccination, VaccinationHistory, VaccinationStatus
 
 
 class VaccinationFilter(django_filters.FilterSet):
@@ -16,7 +19,33 @@ class VaccinationFilter(django_filters.FilterSet):
 
     def filter_upcoming(self, queryset, name, value):
         if value:
-            today = date.today()
-            return queryset.filter(next_due_date__gte=today)
+            # Read the page in list order and skip the past doses, rather than sort the upcoming ones.
+            return queryset.filter(Likely(Q(next_due_date__gte=date.today())))
         return queryset
 
+
+class VaccinationHistoryFilter(VaccinationFilter):
+    class Meta(VaccinationFilter.Meta):
+        model = VaccinationHistory
+
+
+class VaccinationStatusFilter(django_filters.FilterSet):
+    WINDOW_CHOICES = [
+        ("overdue", "Overdue"),
+        ("7", "Due in the next 7 days"),
+        ("30", "Due in the next 30 days"),
+    ]
+
+    pet = django_filters.NumberFilter(field_name="pet_id")
+    vaccine = django_filters.NumberFilter(field_name="vaccine_id")
+    window = django_filters.ChoiceFilter(choices=WINDOW_CHOICES, method="filter_window")
+
+    class Meta:
+        model = VaccinationStatus
+        fields = ["pet", "vaccine", "window"]
+
+    def filter_window(self, queryset, name, value):
+        today = date.today()
+        if value == "overdue":
+            return queryset.filter(next_due_date__lt=today)
+        return queryset.filter(next_due_date__gte=today, next_due_date__lte=today + timedelta(days=int(value)))
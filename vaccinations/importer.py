@@ -0,0 +1,146 @@
+import csv
+import time
+from collections.abc import Callable, Iterable
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from config.response_cache import invalidate_owners
+from pets.models import Pet
+from vaccines.models import Vaccine
+
+from .models import Vaccination, VaccinationImport, VaccinationStatus
+from .serializers import VaccinationBulkItemSerializer
+
+# Column names accepted as aliases, so files written by the export endpoint can be imported back.
+COLUMN_ALIASES = {"pet_id": "pet", "vaccine_id": "vaccine"}
+FIELDS = ["pet", "vaccine", "application_date", "next_due_date", "notes", "veterinarian_name"]
+REQUIRED_FIELDS = ["pet", "vaccine", "application_date"]
+
+
+class ImportFileError(ValueError):
+    """
+    Raised when the CSV cannot be imported at all, e.g. required columns are missing.
+    """
+
+
+class VaccinationImporter:
+    """
+    Stream-parses a vaccination CSV and writes it in chunks.
+
+    For each chunk, pets and vaccines are loaded with one query each into the lookup maps used by
+    `VaccinationBulkItemSerializer`, so rows are validated with the `VaccinationSerializer` rules
+    without a query per row. Valid rows are written with `bulk_create` in one transaction per chunk,
+    together with the status refresh and the import's progress. Rejected rows are passed to
+    `on_rejected` once their chunk has committed, and `on_chunk` is called after each chunk.
+    """
+
+    def __init__(
+        self,
+        job: VaccinationImport,
+        chunk_size: int = 1000,
+        on_rejected: Callable[[list[tuple[int, dict, dict]]], None] | None = None,
+        on_chunk: Callable[[VaccinationImport, float], None] | None = None,
+    ):
+        self.job = job
+        self.chunk_size = chunk_size
+        self.on_rejected = on_rejected
+        self.on_chunk = on_chunk
+
+    def run(self, stream: Iterable[str]) -> VaccinationImport:
+        """
+        Import the rows of `stream` after the ones already committed by `job`.
+        """
+        reader = csv.DictReader(stream)
+        self.check_columns(reader.fieldnames or [])
+        started = time.perf_counter()
+
+        chunk = []
+        for number, row in enumerate(reader, start=1):
+            if number <= self.job.rows_committed:
+                continue
+            chunk.append((number, row))
+            if len(chunk) >= self.chunk_size:
+                self.import_chunk(chunk, started)
+                chunk = []
+        if chunk:
+            self.import_chunk(chunk, started)
+
+        self.job.status = "completed"
+        self.job.finished_at = timezone.now()
+        self.job.save(update_fields=["status", "finished_at", "updated_at"])
+        return self.job
+
+    @staticmethod
+    def check_columns(fieldnames: list[str]) -> None:
+        columns = {COLUMN_ALIASES.get(name, name) for name in fieldnames}
+        missing = [name for name in REQUIRED_FIELDS if name not in columns]
+        if missing:
+            raise ImportFileError(f"Missing required column(s): {', '.join(missing)}.")
+
+    def import_chunk(self, chunk: list[tuple[int, dict]], started: float) -> None:
+        items = [(number, row, self.clean_row(row)) for number, row in chunk]
+        context = self.get_context([item for _, _, item in items])
+
+        # One serializer validates the whole chunk, as ListSerializer does: building its fields is
+        # the expensive part, not validating a row.
+        serializer = VaccinationBulkItemSerializer(context=context)
+        to_create, rejected = [], []
+        for number, row, item in items:
+            try:
+                validated_data = serializer.run_validation(item)
+            except ValidationError as exc:
+                rejected.append((number, row, exc.detail))
+                continue
+            vaccination = Vaccination(**validated_data)
+            # bulk_create skips Model.save(), so fill the owner and due date here.
+            vaccination.fill_owner()
+            vaccination.fill_next_due_date()
+            to_create.append(vaccination)
+
+        with transaction.atomic():
+            Vaccination.objects.bulk_create(to_create)
+            # Bulk writes bypass the model signals, so refresh the affected statuses in one pass.
+            VaccinationStatus.objects.refresh(pair for vaccination in to_create for pair in vaccination.status_pairs)
+            invalidate_owners(*{vaccination.pet.owner_id for vaccination in to_create})
+            self.job.rows_committed = chunk[-1][0]
+            self.job.created_count += len(to_create)
+            self.job.rejected_count += len(rejected)
+            self.job.save(update_fields=["rows_committed", "created_count", "rejected_count", "updated_at"])
+
+        if rejected and self.on_rejected:
+            self.on_rejected(rejected)
+        if self.on_chunk:
+            self.on_chunk(self.job, time.perf_counter() - started)
+
+    @staticmethod
+    def clean_row(row: dict) -> dict:
+        """
+        Serializer input for a CSV row: known columns only, blank cells treated as absent.
+        """
+        item = {}
+        for name, value in row.items():
+            name = COLUMN_ALIASES.get(name, name)
+            if name in FIELDS and isinstance(value, str) and value.strip():
+                item[name] = value.strip()
+        return item
+
+    def get_context(self, items: list[dict]) -> dict:
+        pet_ids = {self._parse_id(item.get("pet")) for item in items} - {None}
+        vaccine_ids = {self._parse_id(item.get("vaccine")) for item in items} - {None}
+        pets = Pet.objects.filter(id__in=pet_ids)
+        if self.job.owner_id is not None:
+            # Other owners' pets are reported as not found rather than revealed.
+            pets = pets.filter(owner_id=self.job.owner_id)
+        return {
+            "pets": pets.only("id", "owner_id").order_by().in_bulk(),
+            "vaccines": Vaccine.objects.filter(id__in=vaccine_ids).only("id", "periodicity_days").order_by().in_bulk(),
+        }
+
+    @staticmethod
+    def _parse_id(value) -> int | None:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,38 @@
+from datetime import date, time, timedelta
+
+from django.conf import settings
+
+from jobs.registry import job, schedule
+
+from .archive import VaccinationArchiver
+from .partitioning import VaccinationPartitioner
+
+
+@job("vaccinations.archive")
+def archive_vaccinations(older_than_days: int | None = None) -> dict:
+    """
+    Move the vaccinations applied more than `older_than_days` (default `VACCINATION_ARCHIVE_AFTER_DAYS`)
+    days ago to the archive, for at most half the job timeout; the next run carries on.
+    """
+    days = settings.VACCINATION_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    if not days:
+        return {"archived": 0}
+    archiver = VaccinationArchiver(date.today() - timedelta(days=days), max_seconds=settings.JOB_TIMEOUT / 2)
+    return archiver.run()
+
+
+@job("vaccinations.add_partitions")
+def add_partitions() -> dict:
+    """
+    Create the yearly partitions of this year and the next one, when `vaccinations` is partitioned.
+    """
+    partitioner = VaccinationPartitioner()
+    if not partitioner.is_partitioned():
+        return {"created": 0}
+    year = date.today().year
+    return {"created": len(partitioner.add_partitions(range(year, year + 2)))}
+
+
+if settings.VACCINATION_ARCHIVE_AFTER_DAYS:
+    schedule("vaccinations.archive", every=timedelta(days=1), at=time.fromisoformat(settings.VACCINATION_ARCHIVE_TIME))
+schedule("vaccinations.add_partitions", every=timedelta(days=7), at=time(2))
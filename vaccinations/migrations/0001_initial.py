@@ -0,0 +1,35 @@
+# Generated by Django 5.0.6 on 2026-10-18 09:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('pets', '0001_initial'),
+        ('vaccines', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Vaccination',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('application_date', models.DateField()),
+                ('next_due_date', models.DateField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('veterinarian_name', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('pet', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='vaccinations', to='pets.pet')),
+                ('vaccine', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='vaccinations', to='vaccines.vaccine')),
+            ],
+            options={
+                'db_table': 'vaccinations',
+                'ordering': ['-application_date', 'pet__name'],
+                'indexes': [models.Index(fields=['pet', '-application_date'], name='vaccination_pet_applied_idx'), models.Index(fields=['pet', 'next_due_date'], name='vaccination_pet_due_idx'), models.Index(fields=['vaccine', '-application_date'], name='vaccination_vac_applied_idx'), models.Index(condition=models.Q(('next_due_date__isnull', False)), fields=['next_due_date'], name='vaccination_due_idx')],
+            },
+        ),
+    ]
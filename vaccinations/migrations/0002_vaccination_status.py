@@ -0,0 +1,37 @@
+# Generated by Django 5.0.6 on 2026-10-18 09:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0001_initial'),
+        ('vaccinations', '0001_initial'),
+        ('vaccines', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VaccinationStatus',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('application_date', models.DateField()),
+                ('next_due_date', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('pet', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='vaccination_statuses', to='pets.pet')),
+                ('vaccination', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='vaccinations.vaccination')),
+                ('vaccine', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='vaccination_statuses', to='vaccines.vaccine')),
+            ],
+            options={
+                'db_table': 'vaccination_statuses',
+                'ordering': ['next_due_date'],
+                'indexes': [models.Index(fields=['pet', 'next_due_date'], name='vaccination_status_pet_due_idx'), models.Index(condition=models.Q(('next_due_date__isnull', False)), fields=['next_due_date'], name='vaccination_status_due_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='vaccinationstatus',
+            constraint=models.UniqueConstraint(fields=('pet', 'vaccine'), name='vaccination_status_pet_vaccine_uniq'),
+        ),
+    ]
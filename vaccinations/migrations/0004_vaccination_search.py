@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from config.search import CreateFullTextIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaccinations', '0003_vaccination_import'),
+    ]
+
+    operations = [
+        CreateFullTextIndex('vaccination', 'vaccination_search', ['notes', 'veterinarian_name']),
+    ]
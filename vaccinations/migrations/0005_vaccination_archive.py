@@ -0,0 +1,65 @@
+# Generated by Django 5.0.6 on 2026-10-18 10:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+COLUMNS = "id, pet_id, vaccine_id, application_date, next_due_date, notes, veterinarian_name, created_at"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0002_pet_search'),
+        ('vaccinations', '0004_vaccination_search'),
+        ('vaccines', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VaccinationHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('application_date', models.DateField()),
+                ('next_due_date', models.DateField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('veterinarian_name', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('archived', models.BooleanField()),
+            ],
+            options={
+                'db_table': 'vaccinations_history',
+                'ordering': ['-application_date', 'pet__name'],
+                'managed': False,
+            },
+        ),
+        migrations.AlterField(
+            model_name='vaccinationstatus',
+            name='vaccination',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='vaccinations.vaccination'),
+        ),
+        migrations.CreateModel(
+            name='VaccinationArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('application_date', models.DateField()),
+                ('next_due_date', models.DateField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('veterinarian_name', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('pet', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='pets.pet')),
+                ('vaccine', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='vaccines.vaccine')),
+            ],
+            options={
+                'db_table': 'vaccinations_archive',
+                'ordering': ['-application_date'],
+                'indexes': [models.Index(fields=['pet', '-application_date'], name='vaccination_archive_pet_idx')],
+            },
+        ),
+        migrations.RunSQL(
+            f"CREATE VIEW vaccinations_history AS "
+            f"SELECT {COLUMNS}, FALSE AS archived FROM vaccinations "
+            f"UNION ALL SELECT {COLUMNS}, TRUE AS archived FROM vaccinations_archive",
+            "DROP VIEW vaccinations_history",
+        ),
+    ]
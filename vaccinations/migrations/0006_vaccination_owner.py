@@ -0,0 +1,53 @@
+# Generated by Django 5.0.6 on 2026-10-18 12:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Copy each row's owner from its pet before the (owner, ...) indexes are built.
+BACKFILL = "UPDATE {table} SET owner_id = (SELECT pets.owner_id FROM pets WHERE pets.id = {table}.pet_id)"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pets', '0002_pet_search'),
+        ('vaccinations', '0005_vaccination_archive'),
+        ('vaccines', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vaccination',
+            name='owner',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='vaccinationstatus',
+            name='owner',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunSQL(BACKFILL.format(table='vaccinations'), migrations.RunSQL.noop),
+        migrations.RunSQL(BACKFILL.format(table='vaccination_statuses'), migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='vaccination',
+            index=models.Index(fields=['owner', '-application_date'], name='vaccination_owner_applied_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccination',
+            index=models.Index(fields=['owner', 'vaccine', '-application_date'], name='vaccination_owner_vac_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccination',
+            index=models.Index(fields=['owner', 'next_due_date'], name='vaccination_owner_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccination',
+            index=models.Index(fields=['owner', '-created_at'], name='vaccination_owner_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccinationstatus',
+            index=models.Index(fields=['owner', 'next_due_date'], name='vaccination_status_owner_idx'),
+        ),
+    ]
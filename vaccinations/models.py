@@ -1,22 +1,313 @@
+from datetime import timedelta
+
+from django.conf import settings
 from django.db import models
+from django.db.models import OuterRef, Subquery
 
+from config.search import FullTextIndex
 from pets.models import Pet
 from vaccines.models import Vaccine
 
 
 class Vaccination(models.Model):
-    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name="vaccinations")
-    vaccine = models.ForeignKey(Vaccine, on_delete=models.CASCADE, related_name="vaccinations")
+    # The foreign keys are covered by the leading column of a composite index below.
+    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name="vaccinations", db_index=False)
+    vaccine = models.ForeignKey(Vaccine, on_delete=models.CASCADE, related_name="vaccinations", db_index=False)
+    # The pet's owner, copied here so an owner's vaccinations are read in order from the (owner, ...)
+    # indexes instead of being joined through pets and sorted. Kept by `fill_owner` and `Pet.save`;
+    # nullable only so the column could be added without rebuilding the table.
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        editable=False,
+        related_name="+",
+        db_index=False,
+    )
     application_date = models.DateField()
     next_due_date = models.DateField(null=True, blank=True)
     notes = models.TextField(blank=True)
     veterinarian_name = models.CharField(max_length=255, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Created by migration 0004 (config.search.CreateFullTextIndex).
+    search_index = FullTextIndex("vaccination_search", ["notes", "veterinarian_name"])
+
     class Meta:
         db_table = "vaccinations"
         ordering = ["-application_date", "pet__name"]
+        indexes = [
+            models.Index(fields=["owner", "-application_date"], name="vaccination_owner_applied_idx"),
+            models.Index(fields=["owner", "vaccine", "-application_date"], name="vaccination_owner_vac_idx"),
+            models.Index(fields=["owner", "next_due_date"], name="vaccination_owner_due_idx"),
+            models.Index(fields=["owner", "-created_at"], name="vaccination_owner_created_idx"),
+            models.Index(fields=["pet", "-application_date"], name="vaccination_pet_applied_idx"),
+            models.Index(fields=["pet", "next_due_date"], name="vaccination_pet_due_idx"),
+            models.Index(fields=["vaccine", "-application_date"], name="vaccination_vac_applied_idx"),
+            models.Index(
+                fields=["next_due_date"],
+                name="vaccination_due_idx",
+                condition=models.Q(next_due_date__isnull=False),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.pet} - {self.vaccine} on {self.application_date}"
 
+    def save(self, *args, **kwargs):
+        self.fill_owner()
+        self.fill_next_due_date()
+        super().save(*args, **kwargs)
+        self._loaded_schedule = (self.application_date, self.vaccine_id, self.next_due_date)
+
+    def fill_owner(self) -> None:
+        """
+        Copy the pet's owner when the vaccination is new or moves to another pet.
+        """
+        loaded_pet_id = getattr(self, "_loaded_pair", (None, None))[0]
+        if self.pet_id is not None and (self.owner_id is None or self.pet_id != loaded_pet_id):
+            self.owner_id = self.pet.owner_id
+
+    def fill_next_due_date(self) -> None:
+        """
+        Derive `next_due_date` from the vaccine periodicity when it was not given, or when
+        `application_date` or `vaccine` changed and `next_due_date` was left as loaded.
+        """
+        loaded = getattr(self, "_loaded_schedule", None)
+        if (
+            loaded is not None
+            and self.next_due_date == loaded[2]
+            and (self.application_date, self.vaccine_id) != loaded[:2]
+        ):
+            self.next_due_date = None
+        if self.next_due_date is None and self.application_date and self.vaccine_id:
+            self.next_due_date = self.application_date + timedelta(days=self.vaccine.periodicity_days)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the (pet, vaccine) pair as loaded, so moving a vaccination to another pair
+        # also refreshes the status of the pair it left.
+        loaded = dict(zip(field_names, values))
+        instance._loaded_pair = (loaded.get("pet_id"), loaded.get("vaccine_id"))
+        # And the values the due date was computed from, to derive it again when they change.
+        if {"application_date", "vaccine_id", "next_due_date"} <= loaded.keys():
+            instance._loaded_schedule = (
+                loaded["application_date"],
+                loaded["vaccine_id"],
+                loaded["next_due_date"],
+            )
+        return instance
+
+    @property
+    def status_pairs(self) -> set[tuple[int, int]]:
+        pairs = {(self.pet_id, self.vaccine_id)}
+        loaded_pair = getattr(self, "_loaded_pair", None)
+        if loaded_pair and None not in loaded_pair:
+            pairs.add(loaded_pair)
+        return pairs
+
+
+class VaccinationStatusManager(models.Manager):
+    def refresh(self, pairs) -> None:
+        """
+        Recompute the status rows of the given (pet_id, vaccine_id) pairs from their latest
+        vaccination, with one read, one upsert and at most one delete.
+        """
+        pairs = set(pairs)
+        if not pairs:
+            return
+
+        latest = (
+            Vaccination.objects.filter(pet_id=OuterRef("pet_id"), vaccine_id=OuterRef("vaccine_id"))
+            .order_by("-application_date", "-id")
+            .values("id")[:1]
+        )
+        rows = (
+            Vaccination.objects.filter(
+                pet_id__in={pet_id for pet_id, _ in pairs},
+                vaccine_id__in={vaccine_id for _, vaccine_id in pairs},
+                id=Subquery(latest),
+            )
+            .order_by()
+            .values_list("id", "pet_id", "vaccine_id", "owner_id", "application_date", "next_due_date")
+        )
+        statuses = [
+            VaccinationStatus(
+                pet_id=pet_id,
+                vaccine_id=vaccine_id,
+                owner_id=owner_id,
+                vaccination_id=vaccination_id,
+                application_date=application_date,
+                next_due_date=next_due_date,
+            )
+            for vaccination_id, pet_id, vaccine_id, owner_id, application_date, next_due_date in rows
+            if (pet_id, vaccine_id) in pairs
+        ]
+        self.bulk_create(
+            statuses,
+            update_conflicts=True,
+            unique_fields=["pet", "vaccine"],
+            update_fields=["vaccination", "owner", "application_date", "next_due_date", "updated_at"],
+        )
+
+        emptied = pairs - {(status.pet_id, status.vaccine_id) for status in statuses}
+        if emptied:
+            condition = models.Q()
+            for pet_id, vaccine_id in emptied:
+                condition |= models.Q(pet_id=pet_id, vaccine_id=vaccine_id)
+            self.filter(condition).delete()
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """
+        Recompute every status row, walking pets in primary key batches.
+        """
+        pet_ids = Pet.objects.order_by("id").values_list("id", flat=True)
+        total = 0
+        last_id = 0
+        while True:
+            batch = list(pet_ids.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                return total
+            pairs = set(
+                Vaccination.objects.filter(pet_id__in=batch).order_by().values_list("pet_id", "vaccine_id").distinct()
+            )
+            stale = set(self.filter(pet_id__in=batch).values_list("pet_id", "vaccine_id"))
+            self.refresh(pairs | stale)
+            total += len(pairs)
+            last_id = batch[-1]
+
+
+class VaccinationStatus(models.Model):
+    """
+    Current state of each (pet, vaccine) pair: its latest vaccination and when the next dose is due.
+    Maintained incrementally from `Vaccination` writes so reminder queries are index lookups.
+    """
+
+    # Covered by the leading column of the (pet, vaccine) unique constraint.
+    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name="vaccination_statuses", db_index=False)
+    vaccine = models.ForeignKey(Vaccine, on_delete=models.CASCADE, related_name="vaccination_statuses")
+    # Copied from the vaccination, for the owner's due list (see `Vaccination.owner`).
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        editable=False,
+        related_name="+",
+        db_index=False,
+    )
+    # Without a database constraint: a range-partitioned `vaccinations` (see `vaccinations.partitioning`)
+    # has no unique constraint on `id` alone to reference. Django still cascades the deletes.
+    vaccination = models.ForeignKey(Vaccination, on_delete=models.CASCADE, related_name="+", db_constraint=False)
+    application_date = models.DateField()
+    next_due_date = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = VaccinationStatusManager()
+
+    class Meta:
+        db_table = "vaccination_statuses"
+        ordering = ["next_due_date"]
+        constraints = [
+            models.UniqueConstraint(fields=["pet", "vaccine"], name="vaccination_status_pet_vaccine_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["owner", "next_due_date"], name="vaccination_status_owner_idx"),
+            models.Index(fields=["pet", "next_due_date"], name="vaccination_status_pet_due_idx"),
+            models.Index(
+                fields=["next_due_date"],
+                name="vaccination_status_due_idx",
+                condition=models.Q(next_due_date__isnull=False),
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.pet} - {self.vaccine} due {self.next_due_date}"
+
+
+class VaccinationArchive(models.Model):
+    """
+    Vaccinations moved out of `vaccinations` by `archive_vaccinations`, keeping their ids. Read-only,
+    and compact: one index, for a pet's history.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    pet = models.ForeignKey(Pet, on_delete=models.CASCADE, related_name="+", db_index=False)
+    # Not indexed: vaccines are rarely deleted, and a scan of the archive is acceptable then.
+    vaccine = models.ForeignKey(Vaccine, on_delete=models.CASCADE, related_name="+", db_index=False)
+    application_date = models.DateField()
+    next_due_date = models.DateField(null=True, blank=True)
+    notes = models.TextField(blank=True)
+    veterinarian_name = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "vaccinations_archive"
+        ordering = ["-application_date"]
+        indexes = [
+            models.Index(fields=["pet", "-application_date"], name="vaccination_archive_pet_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.pet_id} - {self.vaccine_id} on {self.application_date} (archived)"
+
+
+class VaccinationHistory(models.Model):
+    """
+    Current and archived vaccinations together: the `vaccinations_history` view, a UNION ALL of
+    `vaccinations` and `vaccinations_archive`. Read-only; the API uses it with `include_archived=true`.
+    """
+
+    pet = models.ForeignKey(Pet, on_delete=models.DO_NOTHING, related_name="+", db_constraint=False)
+    vaccine = models.ForeignKey(Vaccine, on_delete=models.DO_NOTHING, related_name="+", db_constraint=False)
+    application_date = models.DateField()
+    next_due_date = models.DateField(null=True, blank=True)
+    notes = models.TextField(blank=True)
+    veterinarian_name = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField()
+    archived = models.BooleanField()
+
+    class Meta:
+        managed = False
+        db_table = "vaccinations_history"
+        ordering = ["-application_date", "pet__name"]
+
+    def __str__(self) -> str:
+        return f"{self.pet_id} - {self.vaccine_id} on {self.application_date}"
+
+
+class VaccinationImport(models.Model):
+    """
+    Progress of a CSV import. `rows_committed` is advanced in the same transaction as each chunk,
+    so an interrupted import resumes after the last committed chunk.
+    """
+
+    STATUS_CHOICES = [
+        ("running", "Running"),
+        ("completed", "Completed"),
+    ]
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="vaccination_imports",
+        help_text="Restricts the import to this owner's pets; empty for imports run by an administrator.",
+    )
+    source = models.CharField(max_length=255)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="running")
+    rows_committed = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    rejected_count = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "vaccination_imports"
+        ordering = ["-started_at"]
+
+    def __str__(self) -> str:
+        return f"{self.source} ({self.status}, {self.rows_committed} rows)"
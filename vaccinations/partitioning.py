@@ -0,0 +1,142 @@
+from datetime import date
+
+from django.db import connections, router
+
+from .models import Vaccination, VaccinationHistory
+
+
+class VaccinationPartitioner:
+    """
+    Range partitioning of `vaccinations` by `application_date` on PostgreSQL: one partition per year
+    (`vaccinations_y2024` holds 2024) and a default partition for dates outside them.
+
+    `convert` rebuilds the table as a partitioned one in a single transaction, holding an exclusive
+    lock while the rows are copied and the indexes built, so run it in a maintenance window. The
+    primary key becomes (id, application_date), as PostgreSQL requires the partition key in unique
+    constraints; new ids carry on after the last one. `add_partitions` creates the
+    missing years, moving their rows out of the default partition if it holds any.
+
+    Queries filtering on `application_date` (keyset pages, `archive_vaccinations`) only scan the
+    partitions they need, and each year's indexes stay small.
+    """
+
+    table = Vaccination._meta.db_table
+    default_partition = f"{table}_default"
+    history_view = VaccinationHistory._meta.db_table
+
+    def __init__(self, using: str | None = None):
+        self.connection = connections[using or router.db_for_write(Vaccination)]
+
+    @classmethod
+    def partition_name(cls, year: int) -> str:
+        return f"{cls.table}_y{year}"
+
+    def fetch(self, sql: str, params=None) -> list[tuple]:
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def is_supported(self) -> bool:
+        return self.connection.vendor == "postgresql"
+
+    def is_partitioned(self) -> bool:
+        if not self.is_supported():
+            return False
+        return self.fetch("SELECT relkind FROM pg_class WHERE oid = %s::regclass", [self.table])[0][0] == "p"
+
+    def get_partitions(self) -> list[str]:
+        return [
+            name
+            for (name,) in self.fetch(
+                "SELECT child.relname FROM pg_inherits JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = %s::regclass ORDER BY child.relname",
+                [self.table],
+            )
+        ]
+
+    def get_year_range(self) -> tuple[int, int] | None:
+        first, last = self.fetch(f"SELECT MIN(application_date), MAX(application_date) FROM {self.table}")[0]
+        return (first.year, last.year) if first is not None else None
+
+    def convert(self, years: range) -> None:
+        """
+        Replace `vaccinations` with a partitioned table holding the same rows, with partitions for
+        `years` and the default one.
+        """
+        model = Vaccination
+        table = self.table
+        old_table = f"{table}_unpartitioned"
+        # The schema editor runs it all in one transaction.
+        with self.connection.schema_editor() as editor:
+            quote = editor.quote_name
+            editor.execute(f"LOCK TABLE {quote(table)} IN ACCESS EXCLUSIVE MODE")
+            # The history view is bound to the table it was created on: create it again afterwards.
+            view = self.fetch(
+                "SELECT pg_get_viewdef(to_regclass(%s)) WHERE to_regclass(%s) IS NOT NULL",
+                [self.history_view, self.history_view],
+            )
+            editor.execute(f"DROP VIEW IF EXISTS {quote(self.history_view)}")
+
+            editor.execute(f"ALTER TABLE {quote(table)} RENAME TO {quote(old_table)}")
+            editor.execute(
+                f"CREATE TABLE {quote(table)} (LIKE {quote(old_table)} INCLUDING DEFAULTS INCLUDING IDENTITY) "
+                f"PARTITION BY RANGE ({quote(model._meta.get_field('application_date').column)})"
+            )
+            for year in years:
+                self.create_partition(editor, year)
+            editor.execute(f"CREATE TABLE {quote(self.default_partition)} PARTITION OF {quote(table)} DEFAULT")
+            editor.execute(f"INSERT INTO {quote(table)} SELECT * FROM {quote(old_table)}")
+            editor.execute(f"DROP TABLE {quote(old_table)}")
+            editor.execute(
+                f"SELECT setval(pg_get_serial_sequence(%s, 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {quote(table)}",
+                [table],
+            )
+
+            editor.execute(f"ALTER TABLE {quote(table)} ADD PRIMARY KEY (id, application_date)")
+            for field in (model._meta.get_field(name) for name in ("pet", "vaccine", "owner")):
+                target = field.related_model._meta
+                editor.execute(
+                    f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(f'{table}_{field.column}_fk')} "
+                    f"FOREIGN KEY ({quote(field.column)}) REFERENCES {quote(target.db_table)} "
+                    f"({quote(target.pk.column)}) DEFERRABLE INITIALLY DEFERRED"
+                )
+            for index in model._meta.indexes:
+                editor.add_index(model, index)
+            for sql in model.search_index.create_sql(model, editor):
+                editor.execute(sql)
+            if view:
+                editor.execute(f"CREATE VIEW {quote(self.history_view)} AS {view[0][0]}")
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {self.connection.ops.quote_name(table)}")
+
+    def add_partitions(self, years: range) -> list[str]:
+        """
+        Create the partitions of `years` that do not exist yet; returns their names.
+        """
+        existing = set(self.get_partitions())
+        created = []
+        for year in years:
+            if self.partition_name(year) in existing:
+                continue
+            with self.connection.schema_editor() as editor:
+                self.create_partition(editor, year, move_from_default=True)
+            created.append(self.partition_name(year))
+        return created
+
+    def create_partition(self, editor, year: int, move_from_default: bool = False) -> None:
+        quote = editor.quote_name
+        table, default = quote(self.table), quote(self.default_partition)
+        start, end = date(year, 1, 1), date(year + 1, 1, 1)
+        in_range = f"application_date >= '{start.isoformat()}' AND application_date < '{end.isoformat()}'"
+        # A new range cannot be attached while the default partition holds rows in it.
+        move = move_from_default and self.fetch(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})")[0][0]
+        if move:
+            editor.execute(f"ALTER TABLE {table} DETACH PARTITION {default}")
+        editor.execute(
+            f"CREATE TABLE {quote(self.partition_name(year))} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        if move:
+            editor.execute(f"INSERT INTO {table} SELECT * FROM {default} WHERE {in_range}")
+            editor.execute(f"DELETE FROM {default} WHERE {in_range}")
+            editor.execute(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT")
@@ -14,5 +14,5 @@ class IsVaccinationPetOwner(BasePermission):
         return bool(request.user and request.user.is_authenticated)
 
     def has_object_permission(self, request: Request, view: View, obj: Vaccination) -> bool:
-        return obj.pet.owner == request.user
+        return obj.pet.owner_id == request.user.pk
 
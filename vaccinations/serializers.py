@@ -1,12 +1,17 @@
 from rest_framework import serializers
 
+from config.serialization import DynamicFieldsSerializerMixin
 from pets.models import Pet
+from pets.serializers import PetSerializer
 from vaccines.models import Vaccine
+from vaccines.serializers import VaccineSerializer
 
-from .models import Vaccination
+from .models import Vaccination, VaccinationStatus
 
 
-class VaccinationSerializer(serializers.ModelSerializer):
+class VaccinationSerializer(DynamicFieldsSerializerMixin, serializers.ModelSerializer):
+    expandable_fields = {"pet": PetSerializer, "vaccine": VaccineSerializer}
+
     class Meta:
         model = Vaccination
         fields = [
@@ -24,7 +29,7 @@ class VaccinationSerializer(serializers.ModelSerializer):
     def validate_pet(self, value: Pet) -> Pet:
         request = self.context.get("request")
         if request and request.user.is_authenticated:
-            if value.owner != request.user:
+            if value.owner_id != request.user.pk:
                 raise serializers.ValidationError("You can only create vaccinations for your own pets.")
         return value
 
@@ -33,3 +38,57 @@ class VaccinationSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Vaccine is required.")
         return value
 
+
+class VaccinationStatusSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = VaccinationStatus
+        fields = [
+            "pet",
+            "vaccine",
+            "vaccination",
+            "application_date",
+            "next_due_date",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
+class PreloadedRelatedField(serializers.RelatedField):
+    """
+    Primary key related field resolved from a `{pk: instance}` map in the serializer context,
+    so validating a batch does not issue one query per item.
+    """
+
+    default_error_messages = serializers.PrimaryKeyRelatedField.default_error_messages
+
+    def __init__(self, context_key: str, **kwargs):
+        self.context_key = context_key
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        instance = self.context[self.context_key].get(pk)
+        if instance is None:
+            self.fail("does_not_exist", pk_value=data)
+        return instance
+
+    def to_representation(self, value):
+        return value.pk
+
+    def get_queryset(self):
+        return None
+
+
+class VaccinationBulkItemSerializer(VaccinationSerializer):
+    """
+    Validates one item of a bulk request with the same rules as `VaccinationSerializer`,
+    against pets and vaccines loaded once for the whole batch.
+    """
+
+    pet = PreloadedRelatedField(context_key="pets")
+    vaccine = PreloadedRelatedField(context_key="vaccines")
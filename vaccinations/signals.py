@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.db.models import F, Value
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from config.db_functions import AddDays
+from config.response_cache import invalidate_owners
+from pets.models import Pet
+from vaccines.models import Vaccine
+
+from .models import Vaccination, VaccinationStatus
+
+
+@receiver(post_save, sender=Vaccination)
+def refresh_status_on_save(sender, instance: Vaccination, **kwargs) -> None:
+    invalidate_owner_responses(instance)
+    VaccinationStatus.objects.refresh(instance.status_pairs)
+    instance._loaded_pair = (instance.pet_id, instance.vaccine_id)
+
+
+@receiver(post_delete, sender=Vaccination)
+def refresh_status_on_delete(sender, instance: Vaccination, origin=None, **kwargs) -> None:
+    # Deletes cascading from a pet (or its owner) or a vaccine invalidate the responses themselves.
+    if isinstance(origin, Vaccination) or getattr(origin, "model", None) is Vaccination:
+        invalidate_owner_responses(instance)
+    VaccinationStatus.objects.refresh(instance.status_pairs)
+
+
+def invalidate_owner_responses(instance: Vaccination) -> None:
+    """
+    Invalidate the cached responses of the owners of the pets the vaccination belongs to, and belonged
+    to as loaded: the owner comes from the cached pet when there is one (as in the API views),
+    otherwise from a query.
+    """
+    if not settings.RESPONSE_CACHE:
+        return
+    pet_ids = {pet_id for pet_id, _ in instance.status_pairs}
+    if pet_ids == {instance.pet_id} and Vaccination.pet.is_cached(instance):
+        invalidate_owners(instance.pet.owner_id)
+    else:
+        invalidate_owners(*Pet.objects.filter(pk__in=pet_ids).values_list("owner_id", flat=True))
+
+
+@receiver(post_save, sender=Vaccine)
+def recompute_due_dates_on_periodicity_change(sender, instance: Vaccine, created: bool, **kwargs) -> None:
+    """
+    Shift the due dates that followed the old periodicity, with one UPDATE per table.
+    Due dates that were set to something else are left untouched.
+    """
+    old_days = getattr(instance, "_loaded_periodicity_days", None)
+    new_days = instance.periodicity_days
+    if created or old_days is None or old_days == new_days:
+        return
+
+    for model in (Vaccination, VaccinationStatus):
+        model.objects.filter(
+            vaccine=instance,
+            next_due_date=AddDays(F("application_date"), Value(old_days)),
+        ).update(next_due_date=AddDays(F("application_date"), Value(new_days)))
+    instance._loaded_periodicity_days = new_days
@@ -1,30 +1,302 @@
+import csv
+import io
+import time
+
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters, viewsets
+from rest_framework import filters, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from config.async_views import AsyncReadMixin
+from config.export import CSVRenderer, NDJSONRenderer, export_response
+from config.instrumentation import InstrumentedViewMixin
+from config.pagination import OptionalKeysetPagination
+from config.response_cache import OwnerResponseCacheMixin, invalidate_owners
+from config.search import FullTextSearchFilter
+from config.serialization import DynamicFieldsViewMixin, ValuesListMixin
+from pets.models import Pet
+from vaccines.models import Vaccine
 
-from .filters import VaccinationFilter
-from .models import Vaccination
+from .filters import VaccinationFilter, VaccinationHistoryFilter, VaccinationStatusFilter
+from .importer import ImportFileError, VaccinationImporter
+from .models import Vaccination, VaccinationHistory, VaccinationImport, VaccinationStatus
 from .permissions import IsVaccinationPetOwner
-from .serializers import VaccinationSerializer
+from .serializers import VaccinationBulkItemSerializer, VaccinationSerializer, VaccinationStatusSerializer
 
 
-class VaccinationViewSet(viewsets.ModelViewSet):
+class VaccinationViewSet(
+    InstrumentedViewMixin,
+    OwnerResponseCacheMixin,
+    AsyncReadMixin,
+    DynamicFieldsViewMixin,
+    ValuesListMixin,
+    viewsets.ModelViewSet,
+):
     """
     Full CRUD for vaccinations.
     Users can access only vaccinations of their own pets.
-    Supports filtering by pet, vaccine, and upcoming vaccinations.
+    Supports filtering by pet, vaccine, and upcoming vaccinations, and `search=` over notes and
+    veterinarian name (word prefixes, ranked; see `config.search`).
+    List and retrieve accept `expand=pet,vaccine` to embed those objects and `fields=` to trim the payload.
+    `due/` lists the current status of each pet and vaccine, filtered by due window.
+    `export/` streams the full filtered history as CSV or NDJSON, `import/` loads a CSV upload.
+    Reads include vaccinations moved to the archive (see `vaccinations.archive`) only with
+    `include_archived=true`; writes only see current ones.
+    List and retrieve also have async versions for ASGI (see `config.async_views`).
+    List and retrieve responses are cached per owner until the owner's data changes (see `config.response_cache`).
     """
 
     serializer_class = VaccinationSerializer
+    pagination_class = OptionalKeysetPagination
     permission_classes = [IsVaccinationPetOwner]
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_class = VaccinationFilter
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, filters.OrderingFilter]
+    search_fields = ["notes", "veterinarian_name"]
     ordering_fields = ["application_date", "next_due_date", "created_at"]
+    bulk_max_items = 5000
+    bulk_batch_size = 500
+    bulk_update_fields = ["pet", "owner", "vaccine", "application_date", "next_due_date", "notes", "veterinarian_name"]
+    export_chunk_size = 2000
+    import_chunk_size = 1000
+    import_error_limit = 100
+    export_fields = {
+        "id": "id",
+        "pet_id": "pet_id",
+        "pet_name": "pet__name",
+        "vaccine_id": "vaccine_id",
+        "vaccine_name": "vaccine__name",
+        "vaccine_manufacturer": "vaccine__manufacturer",
+        "application_date": "application_date",
+        "next_due_date": "next_due_date",
+        "veterinarian_name": "veterinarian_name",
+        "notes": "notes",
+        "created_at": "created_at",
+    }
 
     def get_queryset(self):
         user = self.request.user
+        if self.includes_archived:
+            # The history view has no owner column: archived rows are only reached through the pet.
+            queryset = VaccinationHistory.objects.filter(pet__owner_id=user.pk)
+        else:
+            # Filtered on the denormalized owner, so the list is read in order from an (owner, ...) index.
+            queryset = Vaccination.objects.filter(owner_id=user.pk)
+        return queryset.select_related("pet", "vaccine").order_by("-application_date")
+
+    @property
+    def includes_archived(self) -> bool:
+        request = getattr(self, "request", None)
         return (
-            Vaccination.objects.select_related("pet", "vaccine")
-            .filter(pet__owner=user)
-            .order_by("-application_date")
+            request is not None
+            and request.method in SAFE_METHODS
+            and request.query_params.get("include_archived", "").lower() in ("true", "1")
+        )
+
+    @property
+    def filterset_class(self):
+        return VaccinationHistoryFilter if self.includes_archived else VaccinationFilter
+
+    @action(detail=False, methods=["get"])
+    def due(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Latest state of each (pet, vaccine) pair with a next due date, soonest first.
+        Accepts `window=overdue|7|30`, `pet` and `vaccine`.
+        """
+        queryset = VaccinationStatus.objects.filter(owner_id=request.user.pk, next_due_date__isnull=False)
+        filterset = VaccinationStatusFilter(request.query_params, queryset=queryset, request=request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        queryset = filterset.qs.order_by("next_due_date")
+
+        # The view's ordering_fields describe vaccinations, so paginate on the fixed due-date order.
+        page = self.paginator.paginate_queryset(queryset, request, view=None)
+        serializer = VaccinationStatusSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["get"], renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request: Request, *args, **kwargs):
+        """
+        Stream every vaccination matching the list filters and ordering, without pagination.
+        `?format=csv` (default) or `?format=ndjson`.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        columns = list(self.export_fields)
+        rows = queryset.values_list(*self.export_fields.values()).iterator(chunk_size=self.export_chunk_size)
+        records = (dict(zip(columns, row)) for row in rows)
+        return export_response(request.accepted_renderer, records, columns, "vaccinations")
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Create or update a list of vaccinations in one request.
+
+        Items carrying an `id` update that vaccination, the others are created. Pets, vaccines and
+        existing vaccinations for the whole batch are loaded with one query each, valid rows are
+        written with `bulk_create`/`bulk_update` in a single transaction, and invalid items are
+        reported by index without aborting the rest.
+        """
+        items = request.data
+        if not isinstance(items, list):
+            raise ValidationError({"detail": "Expected a list of vaccinations."})
+        if len(items) > self.bulk_max_items:
+            raise ValidationError({"detail": f"A bulk request accepts at most {self.bulk_max_items} items."})
+
+        context = self.get_bulk_context(items)
+        existing = context["vaccinations"]
+        to_create, to_update, errors = [], [], []
+
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append({"index": index, "errors": {"non_field_errors": ["Expected an object."]}})
+                continue
+
+            instance = None
+            if item.get("id") is not None:
+                instance = existing.get(self._parse_id(item["id"]))
+                if instance is None:
+                    errors.append({"index": index, "errors": {"id": ["Vaccination not found."]}})
+                    continue
+
+            serializer = VaccinationBulkItemSerializer(
+                instance,
+                data=item,
+                partial=instance is not None,
+                context=context,
+            )
+            if not serializer.is_valid():
+                errors.append({"index": index, "errors": serializer.errors})
+                continue
+
+            if instance is None:
+                instance = Vaccination(**serializer.validated_data)
+                to_create.append((index, instance))
+            else:
+                for field, value in serializer.validated_data.items():
+                    setattr(instance, field, value)
+                to_update.append((index, instance))
+            # bulk_create/bulk_update skip Model.save(), so fill the owner and due date here.
+            instance.fill_owner()
+            instance.fill_next_due_date()
+
+        with transaction.atomic():
+            Vaccination.objects.bulk_create([obj for _, obj in to_create], batch_size=self.bulk_batch_size)
+            if to_update:
+                Vaccination.objects.bulk_update(
+                    [obj for _, obj in to_update],
+                    self.bulk_update_fields,
+                    batch_size=self.bulk_batch_size,
+                )
+            # Bulk writes bypass the model signals, so refresh the affected statuses in one pass.
+            VaccinationStatus.objects.refresh(
+                pair for _, obj in to_create + to_update for pair in obj.status_pairs
+            )
+            if to_create or to_update:
+                invalidate_owners(request.user.pk)
+
+        if errors and not (to_create or to_update):
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif errors:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED if to_create else status.HTTP_200_OK
+
+        return Response(
+            {
+                "created": VaccinationSerializer([obj for _, obj in to_create], many=True).data,
+                "updated": VaccinationSerializer([obj for _, obj in to_update], many=True).data,
+                "errors": errors,
+            },
+            status=response_status,
+        )
+
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser])
+    def import_csv(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Import a CSV upload (`file`) into the user's pets, in chunked bulk inserts.
+
+        Columns as in `import_vaccinations`. Rejected rows are reported by row number (the first
+        `import_error_limit` of them). If the upload is interrupted, posting the same file again with
+        `resume=<import id>` skips the rows already committed.
+        """
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValidationError({"file": ["A CSV file is required."]})
+
+        resume = request.data.get("resume")
+        if resume:
+            job = VaccinationImport.objects.filter(
+                pk=self._parse_id(resume), owner_id=request.user.pk, status="running"
+            ).first()
+            if job is None:
+                raise NotFound("No interrupted import with this id.")
+        else:
+            job = VaccinationImport.objects.create(owner_id=request.user.pk, source=upload.name[:255])
+
+        rejected = []
+
+        def collect(rows):
+            remaining = self.import_error_limit - len(rejected)
+            rejected.extend({"row": number, "errors": errors} for number, _, errors in rows[:remaining])
+
+        started, resumed_from = time.perf_counter(), job.rows_committed
+        importer = VaccinationImporter(job, chunk_size=self.import_chunk_size, on_rejected=collect)
+        try:
+            importer.run(io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline=""))
+        except (ImportFileError, UnicodeDecodeError, csv.Error) as exc:
+            if job.rows_committed == 0:
+                job.delete()
+            raise ValidationError({"file": [str(exc)]})
+        elapsed = time.perf_counter() - started
+
+        return Response(
+            {
+                "id": job.pk,
+                "status": job.status,
+                "rows": job.rows_committed,
+                "created": job.created_count,
+                "rejected": job.rejected_count,
+                "rows_per_second": round((job.rows_committed - resumed_from) / elapsed) if elapsed else None,
+                "errors": rejected,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    def get_bulk_context(self, items: list) -> dict:
+        """
+        Serializer context with the pets, vaccines and vaccinations referenced by a bulk request.
+        """
+        pet_ids, vaccine_ids, vaccination_ids = set(), set(), set()
+        for item in items:
+            if isinstance(item, dict):
+                pet_ids.add(self._parse_id(item.get("pet")))
+                vaccine_ids.add(self._parse_id(item.get("vaccine")))
+                vaccination_ids.add(self._parse_id(item.get("id")))
+        pet_ids.discard(None)
+        vaccine_ids.discard(None)
+        vaccination_ids.discard(None)
+
+        context = self.get_serializer_context()
+        context["pets"] = Pet.objects.filter(id__in=pet_ids).only("id", "owner_id").order_by().in_bulk()
+        context["vaccines"] = (
+            Vaccine.objects.filter(id__in=vaccine_ids).only("id", "periodicity_days").order_by().in_bulk()
+        )
+        context["vaccinations"] = (
+            Vaccination.objects.select_related("vaccine")
+            .filter(id__in=vaccination_ids, owner_id=self.request.user.pk)
+            .order_by()
+            .in_bulk()
         )
+        return context
 
+    @staticmethod
+    def _parse_id(value) -> int | None:
+        if isinstance(value, bool):
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
@@ -5,3 +5,5 @@ class VaccinesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "vaccines"
 
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
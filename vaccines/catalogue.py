@@ -0,0 +1,112 @@
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .models import Vaccine
+from .serializers import VaccineSerializer
+
+VERSION_KEY = "vaccines:catalogue:version"
+SNAPSHOT_KEY = "vaccines:catalogue:snapshot"
+
+
+@dataclass
+class CatalogueSnapshot:
+    """
+    The serialized vaccine catalogue at one version, ordered by (name, id).
+    """
+
+    version: int
+    rows: list[dict]
+    created_at: dict[int, datetime]
+    by_id: dict[int, dict] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.by_id = {row["id"]: row for row in self.rows}
+
+    @property
+    def etag(self) -> str:
+        return make_etag(self.version)
+
+
+# Per-process copy of the latest snapshot; the shared cache holds the version that decides if it is current.
+_local_snapshot: CatalogueSnapshot | None = None
+
+
+def make_etag(version: int) -> str:
+    return f'"vaccines-{version}"'
+
+
+def version_timestamp(version: int) -> float:
+    return version / 1e9
+
+
+def get_cache():
+    return caches[settings.VACCINE_CATALOGUE_CACHE]
+
+
+def get_version() -> int:
+    """
+    Current catalogue version, a nanosecond timestamp of the last change (or of the first read).
+    """
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def _bump_version() -> None:
+    get_cache().set(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def invalidate() -> None:
+    """
+    Start a new catalogue version.
+
+    The version is bumped again on commit, so a snapshot another process rebuilt before the write
+    became visible is not served afterwards.
+    """
+    _bump_version()
+    transaction.on_commit(_bump_version)
+
+
+def get_snapshot(version: int | None = None) -> CatalogueSnapshot:
+    """
+    The catalogue at the current version: from this process, then the shared cache, then the database.
+    """
+    global _local_snapshot
+    if version is None:
+        version = get_version()
+    if _local_snapshot is not None and _local_snapshot.version == version:
+        return _local_snapshot
+
+    cache = get_cache()
+    snapshot = cache.get(SNAPSHOT_KEY)
+    if snapshot is None or snapshot.version != version:
+        vaccines = list(Vaccine.objects.order_by("name", "id"))
+        snapshot = CatalogueSnapshot(
+            version=version,
+            rows=list(VaccineSerializer(vaccines, many=True).data),
+            created_at={vaccine.pk: vaccine.created_at for vaccine in vaccines},
+        )
+        cache.set(SNAPSHOT_KEY, snapshot, timeout=None)
+
+    _local_snapshot = snapshot
+    return snapshot
+
+
+async def aget_snapshot(version: int | None = None) -> CatalogueSnapshot:
+    """
+    `get_snapshot` for async views: the process copy when current, otherwise loaded in a thread.
+    """
+    if version is None:
+        version = get_version()
+    if _local_snapshot is not None and _local_snapshot.version == version:
+        return _local_snapshot
+    return await sync_to_async(get_snapshot)(version)
@@ -0,0 +1,30 @@
+# Generated by Django 5.0.6 on 2026-10-18 09:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Vaccine',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('manufacturer', models.CharField(blank=True, max_length=255)),
+                ('description', models.TextField(blank=True)),
+                ('periodicity_days', models.PositiveIntegerField(help_text='Recommended days between applications.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'vaccines',
+                'ordering': ['name'],
+                'indexes': [models.Index(fields=['name'], name='vaccine_name_idx'), models.Index(fields=['manufacturer', 'name'], name='vaccine_manufacturer_name_idx')],
+            },
+        ),
+    ]
@@ -11,7 +11,18 @@ class Vaccine(models.Model):
     class Meta:
         db_table = "vaccines"
         ordering = ["name"]
+        indexes = [
+            models.Index(fields=["name"], name="vaccine_name_idx"),
+            models.Index(fields=["manufacturer", "name"], name="vaccine_manufacturer_name_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the periodicity as loaded, so a change can recompute the derived due dates.
+        instance._loaded_periodicity_days = dict(zip(field_names, values)).get("periodicity_days")
+        return instance
+
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import catalogue
+from .models import Vaccine
+
+
+@receiver(post_save, sender=Vaccine)
+@receiver(post_delete, sender=Vaccine)
+def invalidate_catalogue(sender, instance: Vaccine, **kwargs) -> None:
+    catalogue.invalidate()
@@ -1,19 +1,120 @@
+from django.http import Http404
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, viewsets
+from rest_framework.response import Response
 
+from config.instrumentation import InstrumentedViewMixin, phase
+from config.search import FullTextSearchFilter, get_search_words, rank_text_match
+
+from . import catalogue
 from .models import Vaccine
 from .serializers import VaccineSerializer
 
 
-class VaccineViewSet(viewsets.ModelViewSet):
+class VaccineViewSet(InstrumentedViewMixin, viewsets.ModelViewSet):
     """
     Full CRUD for vaccines.
+
+    List and retrieve are served from the cached catalogue snapshot (see `vaccines.catalogue`), with
+    the `manufacturer` filter, search and ordering applied in memory. Both answer conditional
+    requests: a matching `If-None-Match` or `If-Modified-Since` gets a 304 without touching the
+    database. `alist`/`aretrieve` serve the same responses to async views (see `config.async_views`).
     """
 
     queryset = Vaccine.objects.all().order_by("name")
     serializer_class = VaccineSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, filters.OrderingFilter]
     filterset_fields = ["manufacturer"]
     search_fields = ["name", "manufacturer"]
     ordering_fields = ["name", "created_at"]
 
+    def list(self, request, *args, **kwargs):
+        version = catalogue.get_version()
+        not_modified = self.get_not_modified_response(request, version)
+        if not_modified is not None:
+            return not_modified
+
+        return self.get_list_response(catalogue.get_snapshot(version))
+
+    async def alist(self, request, *args, **kwargs):
+        version = catalogue.get_version()
+        not_modified = self.get_not_modified_response(request, version)
+        if not_modified is not None:
+            return not_modified
+        return self.get_list_response(await catalogue.aget_snapshot(version))
+
+    def retrieve(self, request, *args, **kwargs):
+        version = catalogue.get_version()
+        not_modified = self.get_not_modified_response(request, version)
+        if not_modified is not None:
+            return not_modified
+        return self.get_detail_response(catalogue.get_snapshot(version))
+
+    async def aretrieve(self, request, *args, **kwargs):
+        version = catalogue.get_version()
+        not_modified = self.get_not_modified_response(request, version)
+        if not_modified is not None:
+            return not_modified
+        return self.get_detail_response(await catalogue.aget_snapshot(version))
+
+    def get_list_response(self, snapshot: catalogue.CatalogueSnapshot) -> Response:
+        with phase("queryset"):
+            rows = self.filter_rows(snapshot)
+        page = self.paginate_queryset(rows)
+        response = self.get_paginated_response(page) if page is not None else Response(rows)
+        return self.add_validators(response, snapshot)
+
+    def get_detail_response(self, snapshot: catalogue.CatalogueSnapshot) -> Response:
+        try:
+            row = snapshot.by_id[int(self.kwargs[self.lookup_field])]
+        except (KeyError, ValueError):
+            raise Http404
+        # The catalogue is shared by every user, so there are no object permissions to check.
+        return self.add_validators(Response(row), snapshot)
+
+    def get_not_modified_response(self, request, version: int):
+        return get_conditional_response(
+            request,
+            etag=catalogue.make_etag(version),
+            last_modified=int(catalogue.version_timestamp(version)),
+        )
+
+    def add_validators(self, response: Response, snapshot: catalogue.CatalogueSnapshot) -> Response:
+        response["ETag"] = snapshot.etag
+        response["Last-Modified"] = http_date(catalogue.version_timestamp(snapshot.version))
+        # Clients may keep the response but must revalidate it, which the ETag makes cheap.
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def filter_rows(self, snapshot: catalogue.CatalogueSnapshot):
+        """
+        In-memory equivalent of the filter backends: exact `manufacturer`, search with the full-text
+        semantics (every word starts a word of a search field, ranked; see `config.search`), then
+        `ordering` (default relevance when searching, then name).
+        """
+        rows = snapshot.rows
+        manufacturer = self.request.query_params.get("manufacturer")
+        if manufacturer:
+            rows = [row for row in rows if row["manufacturer"] == manufacturer]
+
+        words = get_search_words(FullTextSearchFilter().get_search_terms(self.request))
+        ranks = {}
+        if words:
+            for row in rows:
+                rank = rank_text_match([row[name] for name in self.search_fields], words)
+                if rank is not None:
+                    ranks[row["id"]] = rank
+            rows = [row for row in rows if row["id"] in ranks]
+
+        ordering = filters.OrderingFilter().get_ordering(self.request, self.queryset, self) or []
+        rows = list(rows)
+        if ranks and not ordering:
+            rows.sort(key=lambda row: ranks[row["id"]], reverse=True)
+        # Stable sorts applied from the last term to the first give a multi-key ordering.
+        for term in reversed(ordering):
+            name = term.lstrip("-")
+            values = snapshot.created_at if name == "created_at" else {row["id"]: row[name] for row in rows}
+            rows.sort(key=lambda row: values[row["id"]], reverse=term.startswith("-"))
+        return rows